@@ -0,0 +1,128 @@
+"""
+Hangman Game - Alphabets
+Which characters are guessable letters, and which letter each one matches.
+
+Every guessable character has a key: its base letter, uppercased and without
+accents, so a guess of "e" reveals E, É, È and Ê alike and "σ" matches both
+Σ and ς. Characters without a key (spaces, digits, punctuation) cannot be
+guessed; Word shows them from the start, which is what makes phrases work.
+
+    LETTER_KEYS   character -> key
+    LETTER_BITS   character -> bit number of its key (for bitmask words)
+    LETTERS       every key, in bit order
+
+The tables start with the ASCII letters only, so plain words never pay for
+Unicode. The first non-ASCII character looked up through letter_key() or
+letter_bit() loads the rest of every alphabet in ALPHABETS at once, after
+which any lookup is a single dict access. Letters of scripts not listed in
+ALPHABETS are treated like punctuation.
+"""
+
+# name -> (base letters, code point ranges folded onto them)
+ALPHABETS = {
+    "latin": (
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+        ((0x00C0, 0x0250), (0x1E00, 0x1F00)),
+    ),
+    "greek": (
+        "ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ",
+        ((0x0370, 0x0400), (0x1F00, 0x2000)),
+    ),
+    "cyrillic": (
+        "АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ",
+        ((0x0400, 0x0530),),
+    ),
+}
+
+# Letters with no Unicode decomposition that still read as a base letter.
+FOLDS = {
+    "ß": "S",
+    "ẞ": "S",
+    "Æ": "A",
+    "æ": "A",
+    "Œ": "O",
+    "œ": "O",
+    "Ø": "O",
+    "ø": "O",
+    "Ł": "L",
+    "ł": "L",
+    "Đ": "D",
+    "đ": "D",
+    "Ð": "D",
+    "ð": "D",
+    "ı": "I",
+}
+
+LETTERS = "".join(letters for letters, _ in ALPHABETS.values())
+_KEY_BITS = {letter: bit for bit, letter in enumerate(LETTERS)}
+
+LETTER_KEYS = {
+    char: letter
+    for letter in ALPHABETS["latin"][0]
+    for char in (letter, letter.lower())
+}
+LETTER_BITS = {char: _KEY_BITS[key] for char, key in LETTER_KEYS.items()}
+
+_loaded = False
+
+
+def load():
+    """Add every character of ALPHABETS to the tables; done once, on demand."""
+    global _loaded
+    if _loaded:
+        return
+    import unicodedata
+
+    keys = {}
+    for letters, ranges in ALPHABETS.values():
+        for start, end in ranges:
+            for code in range(start, end):
+                char = chr(code)
+                base = unicodedata.normalize("NFD", char)[0]
+                key = FOLDS.get(base) or base.upper()
+                if key in _KEY_BITS:
+                    keys[char] = key
+        # Base letters are their own keys even when they decompose (Й).
+        for letter in letters:
+            keys[letter] = keys[letter.lower()] = letter
+    keys.update(FOLDS)
+    LETTER_BITS.update((char, _KEY_BITS[key]) for char, key in keys.items())
+    LETTER_KEYS.update(keys)
+    _loaded = True
+
+
+def upper(text):
+    """
+    Uppercase text one character for one character: composed (NFC) first,
+    and letters without a single-character capital, like ß, left as is.
+    """
+    if text.isascii():
+        return text.upper()
+    import unicodedata
+
+    text = unicodedata.normalize("NFC", text)
+    capitals = text.upper()
+    if len(capitals) == len(text):
+        return capitals
+    return "".join(
+        capital if len(capital) == 1 else char
+        for char, capital in ((char, char.upper()) for char in text)
+    )
+
+
+def letter_key(char):
+    """Return the key a guess of char matches, or None if it is no letter."""
+    key = LETTER_KEYS.get(char)
+    if key is None and not _loaded and char and not char.isascii():
+        load()
+        key = LETTER_KEYS.get(char)
+    return key
+
+
+def letter_bit(char):
+    """Return the bit number of char's key, or None if it is no letter."""
+    bit = LETTER_BITS.get(char)
+    if bit is None and not _loaded and char and not char.isascii():
+        load()
+        bit = LETTER_BITS.get(char)
+    return bit
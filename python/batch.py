@@ -0,0 +1,204 @@
+"""
+Hangman Game - Batch Evaluator
+Array-backed state for thousands of games played side by side.
+
+Words are packed into one uint8 matrix, one row per game. Game state is kept
+bit-sliced: for every letter there is one big integer whose bit i is set when
+game i has that letter in its word (or has guessed it). Applying a guess to
+all games, or checking which games are solved or lost, is then a handful of
+whole-batch integer operations instead of a loop over Word objects.
+
+The project has no third-party dependencies, so Python's arbitrary-precision
+integers play the role of the bit vectors.
+
+Only the letters A-Z can be guessed in a batch. Words are normalized like
+Word (uppercase, single spaces), spaces and ASCII punctuation are shown from
+the start, and words with any non-ASCII character are rejected; play those
+through Word or compact.py instead.
+"""
+
+from array import array
+
+from alphabet import upper
+from hangman import HangmanGame
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_A = ord("A")
+
+
+if hasattr(int, "bit_count"):
+    # Python 3.10+: count the bits in C.
+    popcount = int.bit_count
+else:
+
+    def popcount(bits):
+        """Return the number of set bits in a non-negative integer."""
+        return bin(bits).count("1")
+
+
+def iter_bits(bits):
+    """Yield the index of every set bit, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def bits_from_indices(indices):
+    """Return a bitset with the given game indices set."""
+    bits = 0
+    for index in indices:
+        bits |= 1 << index
+    return bits
+
+
+def letter_mask(word):
+    """Return the 26-bit mask of the A-Z letters in word."""
+    mask = 0
+    for letter in word.upper():
+        code = ord(letter) - _A
+        if 0 <= code < 26:
+            mask |= 1 << code
+    return mask
+
+
+class WordBatch:
+    """Guess state for a batch of games, updated with bitwise operations."""
+
+    def __init__(self, words, max_wrong=HangmanGame.MAX_WRONG_GUESSES):
+        words = [" ".join(upper(word).split()) for word in words]
+        for word in words:
+            if not word.isascii():
+                raise ValueError(f"'{word}' has letters outside A-Z")
+        self.size = len(words)
+        self.width = max((len(word) for word in words), default=0)
+        self.max_wrong = max_wrong
+        self.all = (1 << self.size) - 1
+
+        # Row-major uint8 matrix of letter codes, zero padded on the right.
+        self.matrix = bytearray(self.size * self.width)
+        self.lengths = array("H", (len(word) for word in words))
+        # Batches usually draw from a much smaller dictionary, so masks are
+        # computed once per distinct word.
+        masks = {}
+        self.letter_masks = array("L")
+        for word in words:
+            mask = masks.get(word)
+            if mask is None:
+                mask = masks[word] = letter_mask(word)
+            self.letter_masks.append(mask)
+        for row, word in enumerate(words):
+            start = row * self.width
+            self.matrix[start : start + len(word)] = word.encode("ascii")
+
+        # Set bits in byte buffers first; OR-ing into growing integers one
+        # row at a time would be quadratic in the batch size.
+        planes = [bytearray((self.size + 7) // 8) for _ in range(26)]
+        for row, mask in enumerate(self.letter_masks):
+            byte, bit = row >> 3, 1 << (row & 7)
+            while mask:
+                low = mask & -mask
+                planes[low.bit_length() - 1][byte] |= bit
+                mask ^= low
+        self.contains = [int.from_bytes(plane, "little") for plane in planes]
+
+        self.reset()
+
+    def reset(self):
+        """Start every game in the batch over."""
+        self.guessed = [0] * 26
+        # strikes[k] holds the games with more than k wrong guesses.
+        self.strikes = [0] * self.max_wrong
+        self._unsolved = 0
+        for bits in self.contains:
+            self._unsolved |= bits
+
+    def apply_guess(self, letter, games=None):
+        """
+        Guess letter in every active game, or only in the games bitset.
+        Games that already guessed letter are left alone.
+        Returns (hits, misses) as bitsets of games.
+        """
+        code = ord(letter.upper()) - _A
+        if not 0 <= code < 26:
+            raise ValueError(f"'{letter}' is not a letter from A to Z")
+
+        selected = self.active() if games is None else games & self.active()
+        selected &= ~self.guessed[code]
+        self.guessed[code] |= selected
+
+        hits = selected & self.contains[code]
+        misses = selected ^ hits
+
+        strikes = self.strikes
+        for level in range(self.max_wrong - 1, 0, -1):
+            strikes[level] |= strikes[level - 1] & misses
+        strikes[0] |= misses
+
+        if hits:
+            self._unsolved = 0
+            for have, tried in zip(self.contains, self.guessed):
+                self._unsolved |= have & ~tried
+
+        return hits, misses
+
+    def apply_guesses(self, letters):
+        """
+        Apply a different guess to each game, given as a sequence of letters
+        (or None to skip a game). Games are grouped by letter so this costs at
+        most 26 batch operations.
+        """
+        by_letter = {}
+        for row, letter in enumerate(letters):
+            if letter is not None:
+                key = letter.upper()
+                by_letter[key] = by_letter.get(key, 0) | (1 << row)
+
+        hits = misses = 0
+        for letter, games in by_letter.items():
+            letter_hits, letter_misses = self.apply_guess(letter, games)
+            hits |= letter_hits
+            misses |= letter_misses
+        return hits, misses
+
+    def solved(self):
+        """Return the bitset of games whose word is fully revealed."""
+        return self.all & ~self._unsolved
+
+    def lost(self):
+        """Return the bitset of games that ran out of wrong guesses."""
+        return self.strikes[-1] if self.strikes else 0
+
+    def active(self):
+        """Return the bitset of games that are still being played."""
+        return self._unsolved & ~self.lost()
+
+    def wrong_guesses(self, row):
+        """Return the number of wrong guesses made in one game."""
+        bit = 1 << row
+        return sum(1 for level in self.strikes if level & bit)
+
+    def guess_mask(self, row):
+        """Return the 26-bit mask of letters guessed in one game."""
+        bit = 1 << row
+        mask = 0
+        for code, tried in enumerate(self.guessed):
+            if tried & bit:
+                mask |= 1 << code
+        return mask
+
+    def get_word(self, row):
+        """Return the word for one game."""
+        start = row * self.width
+        return self.matrix[start : start + self.lengths[row]].decode("ascii")
+
+    def get_display(self, row):
+        """Return one game's word display, formatted like Word.get_display()."""
+        mask = self.guess_mask(row)
+        shown = []
+        for letter in self.get_word(row):
+            code = ord(letter) - _A
+            # Spaces and punctuation have no code and are always shown.
+            hidden = 0 <= code < 26 and not mask >> code & 1
+            shown.append("_" if hidden else letter)
+        return " ".join(shown)
@@ -0,0 +1,936 @@
+"""
+Hangman Game - Benchmarks
+Measures the game engine's hot paths and catches performance regressions.
+
+Each case is timed in many small batches. The report gives ops/sec (from the
+median batch), p50 and p99 per-operation latency across batches, and the
+memory allocated per operation (traced with tracemalloc in a separate,
+untimed pass).
+
+    python benchmarks.py                      # run and print a table
+    python benchmarks.py --output base.json   # save results
+    python benchmarks.py --baseline base.json # fail on >20% slowdowns
+    python benchmarks.py --startup            # fail if imports blow the budget
+    python benchmarks.py --check              # fail if a correctness check does
+
+The startup check imports each entry module in a fresh interpreter with
+python -X importtime and compares the median cumulative import time against
+STARTUP_BUDGETS_MS.
+
+The project has no test suite, so the code that is easy to get subtly wrong
+while making it faster (binary formats, hand-rolled data structures) also
+has correctness checks in CHECKS. --check runs them and exits 1 if any fails.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from hangman import GameInterface, HangmanGame, Player, Word, WordBank
+from renderer import FrameCache, TerminalRenderer, game_frame
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+WORD_LENGTHS = (5, 12, 40, 200)
+PHRASE_LENGTHS = (40, 400)
+DICTIONARY_SIZES = (29, 10000, 1000000)
+
+# Import time budgets (milliseconds, median of fresh interpreters).
+STARTUP_BUDGETS_MS = {
+    "hangman": 3.0,
+    "simulation": 10.0,
+    "solver": 15.0,
+    "demo": 5.0,
+}
+
+
+class Case:
+    """
+    One benchmark: prepare() builds a state per batch, run() times it.
+    max_batches caps the batch count of cases whose batches take seconds.
+    """
+
+    def __init__(
+        self, name, prepare, run, ops_per_batch, cleanup=None, max_batches=None
+    ):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+        self.ops_per_batch = ops_per_batch
+        self.cleanup = cleanup
+        self.max_batches = max_batches
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at fraction (0-1) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def random_word(length, rng):
+    """Return a random A-Z word of the given length."""
+    return "".join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def measure(case, batches):
+    """Run one case and return its result dict."""
+    if case.max_batches is not None:
+        batches = min(batches, case.max_batches)
+    run = case.run
+    for state in case.prepare(max(1, batches // 10)):
+        run(state)  # warm up
+
+    states = case.prepare(batches)
+    timer = time.perf_counter
+    samples = []
+    # Like timeit, keep the garbage collector out of the timed loop.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        total_started = timer()
+        for state in states:
+            started = timer()
+            run(state)
+            samples.append(timer() - started)
+        total = timer() - total_started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Allocations are measured separately so tracing does not skew timings.
+    alloc_batches = min(batches, 50)
+    states = case.prepare(alloc_batches)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for state in states:
+        run(state)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if case.cleanup is not None:
+        case.cleanup()
+
+    ops = batches * case.ops_per_batch
+    alloc_ops = alloc_batches * case.ops_per_batch
+    per_op = sorted(sample / case.ops_per_batch for sample in samples)
+    median = percentile(per_op, 0.50)
+    return {
+        "ops": ops,
+        # Throughput from the median batch is far less noisy than the mean.
+        "ops_per_sec": 1 / median if median else 0.0,
+        "mean_ops_per_sec": ops / total if total else 0.0,
+        "p50_us": median * 1e6,
+        "p99_us": percentile(per_op, 0.99) * 1e6,
+        "retained_bytes_per_op": (after - before) / alloc_ops,
+        "peak_bytes": peak - before,
+    }
+
+
+def word_bank_cases(sizes):
+    """Cases for WordBank.get_random_word over dictionaries of each size."""
+    original = WordBank.current()
+    cases = []
+    for size in sizes:
+        built = {}
+
+        def prepare(batches, size=size, built=built):
+            # Large dictionaries are only generated if the case actually runs.
+            if "words" not in built:
+                rng = random.Random(size)
+                built["words"] = tuple(
+                    random_word(rng.randint(4, 12), rng).lower() for _ in range(size)
+                )
+            WordBank.replace_words(built["words"])
+            return [None] * batches
+
+        def run(_):
+            for _ in range(100):
+                WordBank.get_random_word()
+
+        def cleanup():
+            WordBank.replace_words(original.words, original.source)
+
+        cases.append(
+            Case(f"WordBank.get_random_word[dict={size}]", prepare, run, 100, cleanup)
+        )
+    return cases
+
+
+def word_cases(lengths):
+    """Cases for Word and HangmanGame hot paths at each word length."""
+    rng = random.Random(1)
+    cases = []
+    for length in lengths:
+        text = random_word(length, rng)
+
+        def fresh_words(batches, text=text):
+            return [Word(text) for _ in range(batches)]
+
+        def guess_all(word):
+            for letter in ALPHABET:
+                word.guess_letter(letter)
+
+        def half_guessed(batches, text=text):
+            words = fresh_words(batches, text)
+            for word in words:
+                for letter in ALPHABET[::2]:
+                    word.guess_letter(letter)
+            return words
+
+        def display(word):
+            for _ in range(100):
+                word.get_display()
+
+        def fresh_games(batches, text=text):
+            games = []
+            for _ in range(batches):
+                game = HangmanGame(Player())
+                game.word = Word(text)
+                games.append(game)
+            return games
+
+        def make_guesses(game):
+            for letter in ALPHABET:
+                game.make_guess(letter)
+
+        def half_played(batches, text=text):
+            games = fresh_games(batches, text)
+            for game in games:
+                for letter in ALPHABET[::2]:
+                    game.make_guess(letter)
+            return games
+
+        def game_state(game):
+            for _ in range(100):
+                game.get_game_state()
+
+        cases += [
+            Case(f"Word.guess_letter[len={length}]", fresh_words, guess_all, 26),
+            Case(f"Word.get_display[len={length}]", half_guessed, display, 100),
+            Case(
+                f"HangmanGame.make_guess[len={length}]", fresh_games, make_guesses, 26
+            ),
+            Case(
+                f"HangmanGame.get_game_state[len={length}]",
+                half_played,
+                game_state,
+                100,
+            ),
+        ]
+    return cases
+
+
+def render_cases():
+    """Cases comparing frames/sec of the three ways to draw the board."""
+    rng = random.Random(2)
+    player = Player("Bench")
+    states = []
+    for wrong in range(HangmanGame.MAX_WRONG_GUESSES + 1):
+        game = HangmanGame(player)
+        game.word = Word(random_word(10, rng))
+        for letter in ALPHABET[:wrong]:
+            game.make_guess(letter)
+        game.wrong_guesses = wrong
+        states.append(game.get_game_state())
+
+    def frames(batches):
+        return [None] * batches
+
+    def print_frames(_):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for state in states:
+                GameInterface.display_header()
+                GameInterface.display_player_stats(player)
+                GameInterface.display_game_state(state)
+
+    renderer = TerminalRenderer(io.StringIO())
+
+    def diff_frames(_):
+        renderer.stream.seek(0)
+        for state in states:
+            renderer.draw(game_frame(player, state))
+
+    cache = FrameCache(width=80)
+    cache.prebuild()
+    sink = io.BytesIO()
+
+    def cached_frames(_):
+        sink.seek(0)
+        for state in states:
+            cache.write(state, sink)
+
+    count = len(states)
+    return [
+        Case("render.print[frames]", frames, print_frames, count),
+        Case("render.TerminalRenderer[frames]", frames, diff_frames, count),
+        Case("render.FrameCache[frames]", frames, cached_frames, count),
+    ]
+
+
+def metrics_cases():
+    """make_guess with metrics collection on, to compare against the plain case."""
+    import metrics
+
+    (plain,) = [
+        case
+        for case in word_cases((12,))
+        if case.name.startswith("HangmanGame.make_guess")
+    ]
+
+    def prepare(batches):
+        metrics.enable(HangmanGame)
+        return plain.prepare(batches)
+
+    def cleanup():
+        metrics.disable()
+        metrics.REGISTRY.reset()
+
+    return [
+        Case(
+            "HangmanGame.make_guess[len=12,metrics=on]",
+            prepare,
+            plain.run,
+            plain.ops_per_batch,
+            cleanup,
+        )
+    ]
+
+
+def room_cases(spectators=(1, 1000)):
+    """Room.guess fanned out to many subscribers."""
+    from rooms import Room
+
+    cases = []
+    for count in spectators:
+
+        def fresh_rooms(batches, count=count):
+            rooms = []
+            for _ in range(batches):
+                room = Room("bench")
+                room.start_new_word("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                room.join("player")
+                for _ in range(count):
+                    room.subscribe(len)
+                rooms.append(room)
+            return rooms
+
+        def guess_all(room):
+            for letter in ALPHABET:
+                room.guess("player", letter)
+
+        cases.append(
+            Case(f"Room.guess[subscribers={count}]", fresh_rooms, guess_all, 26)
+        )
+    return cases
+
+
+def checkpoint_cases(sizes=(200, 100000)):
+    """Bulk session dump and restore, per game, for checkpoints of each size."""
+    from checkpoint import dump_games, load_games
+
+    cases = []
+    for sessions in sizes:
+        built = {}
+
+        def build(sessions=sessions, built=built):
+            # Like word_bank_cases, only build the games if the case runs.
+            if not built:
+                rng = random.Random(3)
+                words = [random_word(rng.randint(4, 12), rng) for _ in range(5000)]
+                games = []
+                for index in range(sessions):
+                    game = HangmanGame(Player(f"player-{index}"))
+                    game.word = Word(rng.choice(words))
+                    for letter in rng.sample(ALPHABET, rng.randint(0, 8)):
+                        game.make_guess(letter)
+                    games.append(game)
+                built["keys"] = [f"{index:016x}" for index in range(sessions)]
+                built["games"] = games
+                built["data"] = dump_games(games, built["keys"])
+            return built
+
+        def same_games(batches, build=build):
+            return [build()["games"]] * batches
+
+        def same_data(batches, build=build):
+            return [build()["data"]] * batches
+
+        def dump(games, build=build):
+            dump_games(games, build()["keys"])
+
+        # A 100k-session batch takes about a second; a few are enough.
+        max_batches = 3 if sessions > 10000 else None
+        cases += [
+            Case(
+                f"dump_games[sessions={sessions}]",
+                same_games,
+                dump,
+                sessions,
+                max_batches=max_batches,
+            ),
+            Case(
+                f"load_games[sessions={sessions}]",
+                same_data,
+                load_games,
+                sessions,
+                max_batches=max_batches,
+            ),
+        ]
+    return cases
+
+
+def timer_cases(pending=(100, 50000)):
+    """TimerWheel ticks and re-arms with many timed games pending."""
+    from timers import TimerWheel
+
+    cases = []
+    for count in pending:
+
+        def wheels(batches, count=count):
+            states = []
+            rng = random.Random(count)
+            for _ in range(min(batches, 20)):
+                now = [0.0]
+                wheel = TimerWheel(tick=0.05, clock=lambda now=now: now[0])
+                timers = [
+                    wheel.schedule(rng.uniform(1, 600), int) for _ in range(count)
+                ]
+                states.append((wheel, now, timers))
+            return [states[index % len(states)] for index in range(batches)]
+
+        def tick_and_rearm(state):
+            # One tick plus one guess's worth of cancel-and-reschedule.
+            wheel, now, timers = state
+            for index in range(100):
+                now[0] += 0.05
+                wheel.advance()
+                timers[index].cancel()
+                timers[index] = wheel.schedule(15.0, int)
+
+        cases.append(
+            Case(f"TimerWheel.tick[timers={count}]", wheels, tick_and_rearm, 100)
+        )
+    return cases
+
+
+def random_phrase(length, rng):
+    """Return a random phrase of mixed-case, partly accented words."""
+    letters = ALPHABET + ALPHABET.lower() + "éèàçöüñÉÀÇ"
+    words = []
+    size = 0
+    while size < length:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(2, 9)))
+        words.append(word + rng.choice(("", "", "", ",", "!", "'s")))
+        size += len(words[-1]) + 1
+    return " ".join(words)[:length]
+
+
+def phrase_cases(lengths):
+    """Cases for phrase puzzles: accents, spaces and punctuation."""
+    rng = random.Random(2)
+    # Lowercase and accented guesses take the same path as "A"-"Z".
+    guesses = ALPHABET.lower()[:20] + "éçÖñÜü"
+    cases = []
+    for length in lengths:
+        text = random_phrase(length, rng)
+
+        def build(word, text=text):
+            for _ in range(10):
+                Word(text)
+
+        def fresh_words(batches, text=text):
+            return [Word(text) for _ in range(batches)]
+
+        def guess_all(word):
+            for letter in guesses:
+                word.guess_letter(letter)
+
+        def fresh_games(batches, text=text):
+            games = []
+            for _ in range(batches):
+                game = HangmanGame(Player())
+                game.word = Word(text)
+                games.append(game)
+            return games
+
+        def make_guesses(game):
+            for letter in guesses:
+                game.make_guess(letter)
+
+        cases += [
+            Case(f"Word[phrase={length}]", fresh_words, build, 10),
+            Case(f"Word.guess_letter[phrase={length}]", fresh_words, guess_all, 26),
+            Case(
+                f"HangmanGame.make_guess[phrase={length}]",
+                fresh_games,
+                make_guesses,
+                26,
+            ),
+        ]
+
+    from solver import Solver
+
+    # Phrases and accented words the solver must be able to finish.
+    puzzles = [random_phrase(40, rng) for _ in range(10)] + [
+        "café",
+        "crème brûlée",
+        "über",
+        "ωμέγα",
+    ]
+    solver = Solver(puzzles)
+
+    def solve_all(_):
+        for text in puzzles:
+            word = Word(text)
+            while not word.is_solved():
+                letter = solver.next_guess(word.get_pattern(), word.guessed_letters)
+                if letter is None:
+                    raise AssertionError(f"solver gave up on {text!r}")
+                word.guess_letter(letter)
+
+    cases.append(
+        Case(
+            "Solver.next_guess[phrases]", lambda batches: [None] * batches, solve_all, 1
+        )
+    )
+    return cases
+
+
+def query_cases(sizes):
+    """WordIndex combined attribute queries over dictionaries of each size."""
+    cases = []
+    for size in sizes:
+        built = {}
+
+        def prepare(batches, size=size, built=built):
+            # Like word_bank_cases, only build the index if the case runs.
+            if "index" not in built:
+                from difficulty import DifficultyIndex
+                from wordquery import WordIndex
+
+                rng = random.Random(size)
+                words = [random_word(rng.randint(4, 12), rng) for _ in range(size)]
+                categories = {
+                    name: rng.sample(words, max(1, size // 20))
+                    for name in ("animals", "countries", "food", "sports")
+                }
+                difficulty = DifficultyIndex(words, use_solver=False)
+                built["index"] = WordIndex(words, categories, difficulty)
+            return [built["index"]] * batches
+
+        def run(index):
+            rng = random.Random(4)
+            for _ in range(10):
+                index.random_word(
+                    rng,
+                    category="animals",
+                    min_length=7,
+                    max_length=9,
+                    excludes="Z",
+                    tier="medium",
+                )
+                index.random_word(rng, min_length=7, max_length=9, contains="E")
+
+        cases.append(Case(f"WordIndex.random_word[dict={size}]", prepare, run, 20))
+    return cases
+
+
+def all_cases(quick=False):
+    """Return every benchmark case."""
+    sizes = DICTIONARY_SIZES[:2] if quick else DICTIONARY_SIZES
+    return (
+        word_bank_cases(sizes)
+        + word_cases(WORD_LENGTHS)
+        + phrase_cases(PHRASE_LENGTHS)
+        + metrics_cases()
+        + room_cases()
+        + timer_cases()
+        + checkpoint_cases((200,) if quick else (200, 100000))
+        + query_cases(sizes)
+        + render_cases()
+    )
+
+
+def _game_state(game):
+    """Return everything a checkpoint must keep of a game, for comparing."""
+    word, player, timer = game.word, game.player, game.timer
+    return (
+        word and (word.get_word(), word.get_guessed_letters(), word.get_display()),
+        game.wrong_guesses,
+        game.game_over,
+        game.won,
+        player.name,
+        player.score,
+        player.games_played,
+        player.games_won,
+        player.timed_guesses,
+        player.response_time_total,
+        player.fastest_response,
+        player.slowest_response,
+        timer and (timer.guess_time, timer.game_time, timer.expired),
+    )
+
+
+def _expect_error(error, function, *args):
+    try:
+        function(*args)
+    except error:
+        return
+    raise AssertionError(f"{function.__name__} did not raise {error.__name__}")
+
+
+def check_checkpoint():
+    """dump_games() -> load_games() keeps every game, and bad data is refused."""
+    import struct
+
+    from checkpoint import HEADER, RECORD, dump_games, load_games
+    from compact import CompactHangmanGame, CompactPlayer, CompactWord
+    from timers import TimerWheel
+
+    classes = {
+        "regular": (HangmanGame, Player, Word),
+        "compact": (CompactHangmanGame, CompactPlayer, CompactWord),
+    }
+    texts = ("python", "to be, or not to be", "ωμέγα αλφα", "crème brûlée", None)
+    names = ("alice", "", "bob\0eve", "zoë 🎉", "Ἀθηνᾶ")
+    rng = random.Random(24)
+    wheel = TimerWheel(clock=lambda: 0.0)
+    for kind, (game_class, player_class, word_class) in classes.items():
+        games = []
+        for index in range(60):
+            player = player_class(names[index % len(names)])
+            player.score, player.games_played = index * 10, index
+            player.games_won = index // 2
+            if index % 4 == 0:
+                player.add_response_time(rng.uniform(0.1, 5.0))
+            if index % 3 == 0:
+                game = game_class(player, guess_time=10, game_time=60, timers=wheel)
+            else:
+                game = game_class(player)
+            text = texts[index % len(texts)]
+            if text is not None:
+                game.word = word_class(text)
+                if game.timer is not None:
+                    game.timer.start()
+                if index % 5 == 1:
+                    letters = sorted(game.word.letters)  # play to a win
+                else:
+                    letters = rng.sample("EOTAΩΑÈRBNSL", rng.randint(0, 8))
+                for letter in letters:
+                    game.make_guess(letter)
+            if game.timer is not None and index % 9 == 0:
+                game.timer.expire("guess")
+            games.append(game)
+        keys = [f"session\0{index}-🎲" for index in range(len(games))]
+
+        data = dump_games(games, keys)
+        expected = [_game_state(game) for game in games]
+        if not any(game.won for game in games):
+            raise AssertionError("no won game to check")
+        for load_kind, load_classes in classes.items():
+            restored = load_games(data, *load_classes, timers=wheel)
+            if [key for key, _ in restored] != keys:
+                raise AssertionError(f"{kind} -> {load_kind}: keys changed")
+            states = [_game_state(game) for _, game in restored]
+            for index, (before, after) in enumerate(zip(expected, states)):
+                if before != after:
+                    raise AssertionError(
+                        f"{kind} -> {load_kind}: game {index} changed: "
+                        f"{before} != {after}"
+                    )
+        for _, game in load_games(data, timers=wheel):
+            if game.timer is not None:
+                game.timer.stop()
+        for game in games:
+            if game.timer is not None:
+                game.timer.stop()
+
+    if load_games(dump_games([])) != []:
+        raise AssertionError("an empty checkpoint did not load as no games")
+
+    data = dump_games(games, keys)
+    table_at = HEADER.size + len(games) * RECORD.size
+    (first_length,) = struct.unpack_from("<I", data, table_at)
+    corrupt = bytearray(data)
+    struct.pack_into("<I", corrupt, table_at, first_length + 1)
+    _expect_error(ValueError, load_games, bytes(corrupt))
+    _expect_error(ValueError, load_games, data[:-1])
+    _expect_error(ValueError, load_games, b"XXXX" + data[4:])
+    corrupt = bytearray(data)
+    struct.pack_into("<H", corrupt, 4, 1)
+    _expect_error(ValueError, load_games, bytes(corrupt))
+
+
+def check_leaderboard():
+    """Leaderboard ranks, pages and skip-list widths match a sorted list."""
+    from leaderboard import Leaderboard
+
+    rng = random.Random(16)
+    board = Leaderboard(snapshot_size=10, snapshot_interval=0.0, seed=16)
+    players = {}
+    for step in range(4000):
+        action = rng.random()
+        name = f"p{rng.randrange(300)}"
+        player = players.get(name)
+        if player is None:
+            player = players[name] = Player(name, leaderboard=board)
+            board.update(player)
+        elif action < 0.1:
+            board.remove(name)
+            del players[name]
+            player.leaderboard = None
+        elif action < 0.2:
+            player.add_win()  # same score, new stats
+        else:
+            # Few distinct scores, so ties are broken by name often.
+            player.add_score(rng.choice((-10, -5, 5, 10, 20)))
+
+        if step % 50:
+            continue
+        expected = sorted(players.values(), key=lambda p: (-p.score, p.name))
+        entries = board.top(len(players) + 1)
+        ranked = [entry["name"] for entry in entries]
+        if ranked != [p.name for p in expected]:
+            raise AssertionError(f"step {step}: top() out of order")
+        for entry, p in zip(entries, expected):
+            if (entry["score"], entry["games_played"], entry["games_won"]) != (
+                p.score,
+                p.games_played,
+                p.games_won,
+            ):
+                raise AssertionError(f"step {step}: stale stats for {p.name}")
+        for rank, p in enumerate(expected, 1):
+            if board.rank(p.name) != rank:
+                raise AssertionError(f"step {step}: {p.name} is not ranked {rank}")
+        start = rng.randint(1, len(expected) + 1)
+        paged = [entry["name"] for entry in board.page(start, 7)]
+        if paged != [p.name for p in expected[start - 1 : start + 6]]:
+            raise AssertionError(f"step {step}: page({start}, 7) is wrong")
+        if [entry["name"] for entry in board.snapshot()] != ranked[:10]:
+            raise AssertionError(f"step {step}: snapshot() is stale")
+
+        # Every link's width must be the distance it skips at level 0.
+        position = {None: len(players) + 1}
+        node, index = board._head.forward[0], 1
+        while node is not None:
+            position[node.key] = index
+            node, index = node.forward[0], index + 1
+        for level in range(board._level):
+            node, at = board._head, 0
+            while node is not None:
+                following = node.forward[level]
+                target = position[following.key if following else None]
+                if following is not None and at + node.width[level] != target:
+                    raise AssertionError(f"step {step}: bad width at level {level}")
+                node, at = following, target
+
+
+def check_timer_wheel():
+    """TimerWheel fires every live timer once, on the first tick it is due."""
+    import math
+
+    from timers import TimerWheel
+
+    rng = random.Random(22)
+    # Two levels span 4096 ticks and three 262144, so the long delays go
+    # through the overflow list and through cascades from every level.
+    for levels in (2, 3):
+        now = [0.0]
+        wheel = TimerWheel(tick=1.0, levels=levels, clock=lambda: now[0])
+        due = {}  # timer number -> first tick it may fire on
+        timers = {}
+        fired = []
+
+        def schedule(delay):
+            number = len(due)
+            due[number] = math.ceil(now[0] + delay)
+            timers[number] = wheel.schedule(delay, fire, number)
+
+        def fire(number):
+            fired.append(number)
+            if number % 7 == 0:
+                schedule(rng.uniform(1, 50))  # re-arm from a callback
+
+        for _ in range(3000):
+            for _ in range(rng.randint(0, 3)):
+                schedule(rng.uniform(1, rng.choice((100, 20000, 400000))))
+            if timers and rng.random() < 0.3:
+                number = rng.choice(list(timers))
+                timers.pop(number).cancel()
+            step = rng.uniform(0, rng.choice((3, 300, 3000)))
+            now[0] += step
+            fired.clear()
+            wheel.advance()
+
+            tick = math.floor(now[0])
+            expected = sorted(number for number in timers if due[number] <= tick)
+            if sorted(fired) != expected:
+                late = sorted(set(expected) - set(fired))
+                extra = sorted(set(fired) - set(expected))
+                raise AssertionError(
+                    f"levels={levels}, tick {tick}: missed {late[:5]}, "
+                    f"fired early, twice or after cancel() {extra[:5]}"
+                )
+            for number in fired:
+                del timers[number]
+            if len(wheel) != len(timers):
+                raise AssertionError(
+                    f"levels={levels}: {len(wheel)} pending, expected {len(timers)}"
+                )
+
+
+CHECKS = {
+    "checkpoint": check_checkpoint,
+    "leaderboard": check_leaderboard,
+    "timers": check_timer_wheel,
+}
+
+
+def run_checks(checks=None):
+    """Run the correctness checks and return the names of those that failed."""
+    checks = checks if checks is not None else CHECKS
+    failed = []
+    for name, check in checks.items():
+        try:
+            check()
+        except Exception as error:
+            failed.append(name)
+            print(f"check {name:<20} FAILED: {type(error).__name__}: {error}")
+        else:
+            print(f"check {name:<20} ok")
+    return failed
+
+
+def import_time_ms(module):
+    """Return the cumulative import time of module in a fresh interpreter."""
+    # Time loading cached bytecode, as installed code does, not compiling.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <module>"
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            if fields[2].startswith(" " + module):
+                return int(fields[1]) / 1000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def check_startup(budgets=None, runs=5):
+    """
+    Print the median import time of each module against its budget and
+    return the modules that went over.
+    """
+    budgets = budgets if budgets is not None else STARTUP_BUDGETS_MS
+    over = []
+    for module, budget in budgets.items():
+        import_time_ms(module)  # warm up the bytecode cache
+        samples = sorted(import_time_ms(module) for _ in range(runs))
+        median = percentile(samples, 0.50)
+        flag = ""
+        if median > budget:
+            over.append(module)
+            flag = "  OVER BUDGET"
+        print(f"import {module:<20} {median:>8.2f} ms  (budget {budget:g} ms){flag}")
+    return over
+
+
+def run_benchmarks(cases, batches=1000, only=None):
+    """Run cases and return the full results document."""
+    results = {}
+    for case in cases:
+        if only and only not in case.name:
+            continue
+        results[case.name] = measure(case, batches)
+        row = results[case.name]
+        print(
+            f"{case.name:<45} {row['ops_per_sec']:>14,.0f} ops/s "
+            f"p50 {row['p50_us']:>8.2f}us  p99 {row['p99_us']:>8.2f}us  "
+            f"{row['retained_bytes_per_op']:>8.1f} B/op"
+        )
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "batches": batches,
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Print the change against a baseline and return the names of cases whose
+    throughput dropped by more than tolerance.
+    """
+    regressions = []
+    print("\nAgainst baseline:")
+    for name, row in results["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base["ops_per_sec"]:
+            continue
+        change = row["ops_per_sec"] / base["ops_per_sec"] - 1
+        flag = ""
+        if change < -tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<45} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman engine benchmarks")
+    parser.add_argument("--batches", type=int, default=1000)
+    parser.add_argument("--quick", action="store_true", help="skip the largest cases")
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--startup", action="store_true", help="check import times against budgets"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="run the correctness checks only"
+    )
+    args = parser.parse_args()
+
+    if args.startup:
+        if check_startup():
+            sys.exit(1)
+        return
+    if args.check:
+        if run_checks():
+            sys.exit(1)
+        return
+
+    results = run_benchmarks(all_cases(args.quick), args.batches, args.only)
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
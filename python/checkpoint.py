@@ -0,0 +1,262 @@
+"""
+Hangman Game - Session Checkpoints
+Dumps live games with their players into one compact buffer and back.
+
+A checkpoint is a header, one fixed-width record per game and a table of the
+strings the records refer to (words, player names and session keys), each
+stored once however many games share it:
+
+    header    magic "HGSS", format version, game count, string count and
+              string table size
+    records   one RECORD per game: word, name and key ids, the guessed
+              letters as a bitmask over alphabet.LETTERS, wrong guesses,
+              game flags, the player's counters and the game's time limits
+    strings   one uint32 length per string (in characters), then every
+              string's UTF-8 back to back, so any text round-trips,
+              NUL bytes included
+
+Records are packed into one preallocated buffer and read back with
+struct.iter_unpack, so a worker can drain or restore 100k sessions in a
+fraction of a second during a deploy. Restored timed games start their
+clocks afresh; selectors, event logs, stores and leaderboards are runtime
+attachments and are not saved.
+
+    data = dump_games(games, keys=session_ids)
+    for key, game in load_games(data):
+        ...
+"""
+
+import contextlib
+import gc
+import itertools
+import math
+import os
+import struct
+
+from alphabet import LETTER_BITS, LETTERS
+from hangman import HangmanGame, Player, Word
+
+MAGIC = b"HGSS"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHxxIII")
+RECORD = struct.Struct("<IIIQQBBBxqIIIddddd")
+
+NO_ID = 0xFFFFFFFF
+GAME_OVER, WON = 1, 2
+TIMED_OUT = (None, "guess", "game")
+_LOW_BITS = (1 << 64) - 1
+
+
+def _guessed_mask(word):
+    mask = getattr(word, "guessed_mask", None)
+    if mask is None:
+        mask = 0
+        for letter in word.guessed_letters:
+            mask |= 1 << LETTER_BITS[letter]
+    return mask
+
+
+def _time_or_nan(seconds):
+    return math.nan if seconds is None else seconds
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    # Creating many objects at once sets off repeated full collections that
+    # find nothing to free; pausing the collector makes a bulk load linear.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def dump_games(games, keys=None):
+    """
+    Return games (HangmanGame or CompactHangmanGame) and their players as
+    one checkpoint. keys, if given, are strings saved alongside each game,
+    such as server session ids.
+    """
+    games = list(games)
+    keys = list(keys) if keys is not None else None
+    strings = {}
+    buffer = bytearray(HEADER.size + len(games) * RECORD.size)
+    pack_into = RECORD.pack_into
+    offset = HEADER.size
+    for index, game in enumerate(games):
+        player = game.player
+        word = game.word
+        if word is None:
+            word_id, mask = NO_ID, 0
+        else:
+            word_id = strings.setdefault(word.word, len(strings))
+            mask = _guessed_mask(word)
+        name_id = strings.setdefault(player.name, len(strings))
+        key_id = (
+            NO_ID if keys is None else strings.setdefault(keys[index], len(strings))
+        )
+        timer = game.timer
+        if timer is None:
+            guess_time = game_time = 0.0
+            timed_out = 0
+        else:
+            guess_time = timer.guess_time or 0.0
+            game_time = timer.game_time or 0.0
+            timed_out = TIMED_OUT.index(timer.expired)
+        pack_into(
+            buffer,
+            offset,
+            key_id,
+            word_id,
+            name_id,
+            mask & _LOW_BITS,
+            mask >> 64,
+            game.wrong_guesses,
+            GAME_OVER * game.game_over | WON * game.won,
+            timed_out,
+            player.score,
+            player.games_played,
+            player.games_won,
+            player.timed_guesses,
+            player.response_time_total,
+            _time_or_nan(player.fastest_response),
+            _time_or_nan(player.slowest_response),
+            guess_time,
+            game_time,
+        )
+        offset += RECORD.size
+
+    table = struct.pack(f"<{len(strings)}I", *map(len, strings))
+    table += "".join(strings).encode("utf-8")
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(games), len(strings), len(table))
+    buffer += table
+    return bytes(buffer)
+
+
+def _read_strings(data, start, count, size):
+    lengths = struct.unpack_from(f"<{count}I", data, start)
+    text = bytes(data[start + 4 * count : start + size]).decode("utf-8")
+    ends = list(itertools.accumulate(lengths))
+    if (ends[-1] if ends else 0) != len(text):
+        raise ValueError("corrupt session checkpoint string table")
+    return [text[end - length : end] for length, end in zip(lengths, ends)]
+
+
+def load_games(
+    data, game_class=HangmanGame, player_class=Player, word_class=Word, timers=None
+):
+    """
+    Return [(key, game)] for every game in a checkpoint made by
+    dump_games(); key is None where no keys were saved. Pass the compact
+    classes to restore into CompactHangmanGame / CompactPlayer / CompactWord.
+    timers is the TimerWheel for restored timed games.
+    """
+    magic, version, count, string_count, table_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a session checkpoint")
+    if version != VERSION:
+        raise ValueError(f"unsupported session checkpoint version {version}")
+    start = HEADER.size + count * RECORD.size
+    if len(data) < start + table_size or table_size < 4 * string_count:
+        raise ValueError("truncated session checkpoint")
+    strings = _read_strings(data, start, string_count, table_size)
+
+    with _gc_paused():
+        return _load_records(
+            memoryview(data)[HEADER.size : start],
+            strings,
+            game_class,
+            player_class,
+            word_class,
+            timers,
+        )
+
+
+def _load_records(records, strings, game_class, player_class, word_class, timers):
+    restored = []
+    isnan = math.isnan
+    bitmask_words = hasattr(word_class, "guessed_mask")
+    # One Word per distinct text; each game gets an unguessed copy of it.
+    templates = {}
+    for (
+        key_id,
+        word_id,
+        name_id,
+        mask_low,
+        mask_high,
+        wrong,
+        flags,
+        timed_out,
+        score,
+        games_played,
+        games_won,
+        timed_guesses,
+        response_time_total,
+        fastest,
+        slowest,
+        guess_time,
+        game_time,
+    ) in RECORD.iter_unpack(records):
+        player = player_class(strings[name_id])
+        player.score = score
+        player.games_played = games_played
+        player.games_won = games_won
+        player.timed_guesses = timed_guesses
+        player.response_time_total = response_time_total
+        player.fastest_response = None if isnan(fastest) else fastest
+        player.slowest_response = None if isnan(slowest) else slowest
+
+        if guess_time or game_time:
+            game = game_class(
+                player,
+                guess_time=guess_time or None,
+                game_time=game_time or None,
+                timers=timers,
+            )
+        else:
+            game = game_class(player)
+        game.wrong_guesses = wrong
+        game.game_over = bool(flags & GAME_OVER)
+        game.won = bool(flags & WON)
+
+        if word_id != NO_ID:
+            template = templates.get(word_id)
+            if template is None:
+                template = templates[word_id] = word_class(strings[word_id])
+            word = template.unguessed_copy()
+            mask = mask_high << 64 | mask_low
+            if bitmask_words:
+                word.guessed_mask = mask
+            elif mask:
+                letters = []
+                while mask:
+                    low = mask & -mask
+                    letters.append(LETTERS[low.bit_length() - 1])
+                    mask ^= low
+                word.restore_guesses(letters)
+            game.word = word
+
+        if game.timer is not None:
+            if timed_out:
+                game.timer.expired = TIMED_OUT[timed_out]
+            elif not game.game_over and game.word is not None:
+                game.timer.start()
+        restored.append((None if key_id == NO_ID else strings[key_id], game))
+    return restored
+
+
+def write_checkpoint(path, data):
+    """Write a checkpoint to path atomically (via a temporary file)."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(data)
+    os.replace(temporary, path)
+
+
+def read_checkpoint(path):
+    """Return the checkpoint stored at path."""
+    with open(path, "rb") as handle:
+        return handle.read()
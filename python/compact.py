@@ -0,0 +1,236 @@
+"""
+Hangman Game - Compact Game State
+Drop-in, low-memory versions of Word, Player and HangmanGame.
+
+The classes here use __slots__ instead of per-instance dicts, keep the word's
+letters and the guessed letters as integer bitmasks instead of sets (one bit
+per key in alphabet.LETTERS), and share one interned copy of each word
+string between games. make_guess() and get_game_state() behave exactly like
+HangmanGame's, phrases and accented letters included.
+
+Run this module to compare the memory used by 100k live games:
+
+    python compact.py
+"""
+
+import sys
+import tracemalloc
+
+from alphabet import LETTER_BITS, LETTERS, letter_bit, upper
+from hangman import HangmanGame, Player
+
+
+class LetterSet:
+    """Read-only set-like view of letters stored in an integer bitmask."""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __contains__(self, letter):
+        bit = LETTER_BITS.get(letter)
+        return bit is not None and bool(self.mask >> bit & 1)
+
+    def __iter__(self):
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield LETTERS[low.bit_length() - 1]
+            mask ^= low
+
+    def __len__(self):
+        return bin(self.mask).count("1")
+
+
+class CompactWord:
+    """Word with bitmask letter tracking."""
+
+    __slots__ = ("word", "letter_mask", "guessed_mask")
+
+    def __init__(self, word):
+        self.word = sys.intern(" ".join(upper(word).split()))
+        mask = 0
+        for char in self.word:
+            bit = LETTER_BITS.get(char)
+            if bit is None:
+                bit = letter_bit(char)
+            if bit is not None:
+                mask |= 1 << bit
+        self.letter_mask = mask
+        self.guessed_mask = 0
+
+    @property
+    def letters(self):
+        """Return the letters in the word as a set-like view."""
+        return LetterSet(self.letter_mask)
+
+    @property
+    def guessed_letters(self):
+        """Return the guessed letters as a set-like view."""
+        return LetterSet(self.guessed_mask)
+
+    def guess_letter(self, letter):
+        """
+        Add a guessed letter and return True if correct, False otherwise.
+        """
+        bit = LETTER_BITS.get(letter)
+        if bit is None:
+            bit = letter_bit(letter)
+            if bit is None:
+                return False
+        self.guessed_mask |= 1 << bit
+        return bool(self.letter_mask >> bit & 1)
+
+    def is_solved(self):
+        """Check if the word has been completely guessed."""
+        return not self.letter_mask & ~self.guessed_mask
+
+    def get_display(self):
+        """Return the word with unguessed letters as underscores."""
+        return " ".join(self._reveal())
+
+    def get_pattern(self):
+        """Return the display as one token; see Word.get_pattern()."""
+        return "".join(self._reveal()).replace(" ", "/")
+
+    def _reveal(self):
+        mask = self.guessed_mask
+        bits = LETTER_BITS
+        for char in self.word:
+            bit = bits.get(char)
+            yield char if bit is None or mask >> bit & 1 else "_"
+
+    def get_guessed_letters(self):
+        """Return the guessed letters in sorted order."""
+        return list(LetterSet(self.guessed_mask))
+
+    def get_word(self):
+        """Return the original word."""
+        return self.word
+
+    def unguessed_copy(self):
+        """Return a new CompactWord for the same text with nothing guessed."""
+        word = CompactWord.__new__(CompactWord)
+        word.word = self.word
+        word.letter_mask = self.letter_mask
+        word.guessed_mask = 0
+        return word
+
+
+class CompactPlayer:
+    """Player without a per-instance __dict__."""
+
+    __slots__ = (
+        "name",
+        "score",
+        "games_played",
+        "games_won",
+        "store",
+        "timed_guesses",
+        "response_time_total",
+        "fastest_response",
+        "slowest_response",
+        "leaderboard",
+    )
+
+    # Subclassing would bring back __dict__, so the methods are shared instead.
+    __init__ = Player.__init__
+    add_win = Player.add_win
+    add_loss = Player.add_loss
+    add_score = Player.add_score
+    add_response_time = Player.add_response_time
+    save = Player.save
+    get_stats = Player.get_stats
+
+
+class CompactHangmanGame:
+    """HangmanGame that stores its state in a CompactWord and slots."""
+
+    __slots__ = (
+        "player",
+        "selector",
+        "event_log",
+        "log_id",
+        "timer",
+        "word",
+        "wrong_guesses",
+        "game_over",
+        "won",
+    )
+
+    MAX_WRONG_GUESSES = HangmanGame.MAX_WRONG_GUESSES
+
+    def __init__(
+        self,
+        player=None,
+        selector=None,
+        event_log=None,
+        guess_time=None,
+        game_time=None,
+        timers=None,
+    ):
+        self.player = player if player else CompactPlayer()
+        self.selector = selector
+        self.event_log = event_log
+        self.log_id = None
+        self.timer = None
+        if guess_time or game_time:
+            from timers import GameTimer
+
+            self.timer = GameTimer(self, guess_time, game_time, timers)
+        self.word = None
+        self.wrong_guesses = 0
+        self.game_over = False
+        self.won = False
+
+    def start_new_game(self):
+        """Initialize a new game."""
+        self.word = CompactWord(self.next_word())
+        self.wrong_guesses = 0
+        self.game_over = False
+        self.won = False
+        if self.event_log is not None:
+            self.log_id = self.event_log.game_started(self)
+        if self.timer is not None:
+            self.timer.start()
+
+    # The guess and state logic is HangmanGame's own, unchanged.
+    next_word = HangmanGame.next_word
+    make_guess = HangmanGame.make_guess
+    time_up = HangmanGame.time_up
+    process_guess = HangmanGame.process_guess
+    get_game_state = HangmanGame.get_game_state
+
+
+def measure_games(game_class, player_class, count=100000, guesses="EA"):
+    """Return the bytes allocated to keep count live games in memory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = []
+    for _ in range(count):
+        game = game_class(player_class())
+        game.start_new_game()
+        for letter in guesses:
+            game.make_guess(letter)
+        games.append(game)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del games
+    return used
+
+
+def main():
+    """Print bytes per 100k live games for both representations."""
+    count = 100000
+    regular = measure_games(HangmanGame, Player, count)
+    compact = measure_games(CompactHangmanGame, CompactPlayer, count)
+
+    print(f"Live games:         {count}")
+    print(f"HangmanGame:        {regular:>12,} bytes ({regular / count:.0f}/game)")
+    print(f"CompactHangmanGame: {compact:>12,} bytes ({compact / count:.0f}/game)")
+    print(f"Saved:              {1 - compact / regular:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ This script demonstrates the game's features without requiring user input.
 
 import time
 import os
-from hangman import HangmanGame, Player, HangmanDisplay, GameInterface
+from hangman import HangmanGame, Player, HangmanDisplay, GameInterface, WordBank
+from hangman import main as play_hangman
 
 
 def clear_and_wait(seconds=1.5):
@@ -32,6 +33,8 @@ def demo_hangman_stages():
 
 def demo_gameplay():
     """Demonstrate a full game playthrough."""
+    from solver import Solver
+
     print("\n" + "=" * 60)
     print("AUTOMATED GAMEPLAY DEMO".center(60))
     print("=" * 60 + "\n")
@@ -42,35 +45,13 @@ def demo_gameplay():
     game = HangmanGame(player)
     game.start_new_game()
 
-    # Common letters to try
-    common_letters = [
-        "E",
-        "T",
-        "A",
-        "O",
-        "I",
-        "N",
-        "S",
-        "H",
-        "R",
-        "D",
-        "L",
-        "C",
-        "U",
-        "M",
-        "W",
-        "F",
-        "G",
-        "Y",
-        "P",
-        "B",
-    ]
+    # The solver picks each guess from the board, not a fixed letter order
+    solver = Solver(WordBank.WORD_LIST)
 
     interface = GameInterface()
 
-    for letter in common_letters:
-        if game.game_over:
-            break
+    while not game.game_over:
+        letter = solver.guess_for(game)
 
         interface.clear_screen()
         print("\n" + "=" * 60)
@@ -210,9 +191,7 @@ def main_menu():
             clear_and_wait(0.1)
             print("\nLaunching the real game...")
             time.sleep(1)
-            import hangman
-
-            hangman.main()
+            play_hangman()
             break
         elif choice == "6":
             clear_and_wait(0.1)
@@ -0,0 +1,175 @@
+"""
+Hangman Game - Word Difficulty
+Scores every word once and keeps them in a sorted, bucketed index.
+
+A word's score combines how many wrong guesses the solver makes on it, how
+rare its letters are, how few distinct letters it has relative to the
+alphabet, and how short it is (short words give fewer clues). Word ids are
+sorted by score and split into equal-sized tiers, so drawing a word of a
+given difficulty is one randrange() into a contiguous slice.
+
+Scores are cached on disk, keyed by a digest of the word list, so restarting
+with the same dictionary skips the scoring pass. Words of an MmapWordBank
+are read from the mapping one at a time, while scoring and on each draw,
+and are never copied into one big list.
+"""
+
+import hashlib
+import os
+import random
+import struct
+from array import array
+
+from hangman import HangmanGame, WordBank
+from simulation import COMMON_LETTERS, play_game
+
+TIERS = ("easy", "medium", "hard")
+SCORE_VERSION = 1
+
+_CACHE_HEADER = struct.Struct("<4sI32sI")
+_CACHE_MAGIC = b"HMDS"
+
+
+def letter_rarity(word):
+    """Return 0 (common letters) to 1 (rare letters) for word."""
+    letters = set(word.upper())
+    ranks = [COMMON_LETTERS.find(letter) for letter in letters]
+    ranks = [rank if rank >= 0 else len(COMMON_LETTERS) - 1 for rank in ranks]
+    return sum(ranks) / (len(ranks) * (len(COMMON_LETTERS) - 1)) if ranks else 0.0
+
+
+def score_word(word, solver=None, max_wrong=HangmanGame.MAX_WRONG_GUESSES):
+    """Return the difficulty score of one word; higher is harder."""
+    word = word.upper()
+    score = 5 * letter_rarity(word)
+    score += 2 * (1 - min(len(word), 15) / 15)
+    score += 2 * (1 - len(set(word)) / 26)
+    if solver is not None:
+        _, wrong, _ = play_game(word, solver, max_wrong)
+        score += 10 * wrong / max_wrong
+    return score
+
+
+def words_digest(words):
+    """Return a digest identifying a word list and the scoring version."""
+    digest = hashlib.sha256(f"v{SCORE_VERSION}\n".encode("utf-8"))
+    for word in words:
+        digest.update(word.upper().encode("utf-8") + b"\n")
+    return digest.digest()
+
+
+def load_cached_scores(path, digest, count):
+    """Return cached scores for digest, or None if the cache does not match."""
+    try:
+        with open(path, "rb") as handle:
+            header = handle.read(_CACHE_HEADER.size)
+            magic, version, cached_digest, cached_count = _CACHE_HEADER.unpack(header)
+            if (magic, version, cached_digest, cached_count) != (
+                _CACHE_MAGIC,
+                SCORE_VERSION,
+                digest,
+                count,
+            ):
+                return None
+            scores = array("f")
+            scores.fromfile(handle, count)
+            return scores
+    except (OSError, EOFError, struct.error):
+        return None
+
+
+def save_cached_scores(path, digest, scores):
+    """Write scores to path atomically."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(
+            _CACHE_HEADER.pack(_CACHE_MAGIC, SCORE_VERSION, digest, len(scores))
+        )
+        scores.tofile(handle)
+    os.replace(temporary, path)
+
+
+class DifficultyIndex:
+    """Word ids sorted by difficulty score and split into tiers."""
+
+    def __init__(self, words=None, cache_path=None, use_solver=True, tiers=TIERS):
+        """
+        words: a word list or MmapWordBank; defaults to WordBank.WORD_LIST.
+        cache_path: file to load scores from and save them to.
+        use_solver: include the solver's wrong-guess count in the score.
+        """
+        source = words if words is not None else WordBank.WORD_LIST
+        # An MmapWordBank is kept as it is and read by id.
+        self.words = source if hasattr(source, "get_word") else list(source)
+        self._get = getattr(self.words, "get_word", None) or self.words.__getitem__
+        self.tiers = tuple(tiers)
+
+        digest = words_digest(self._iter_words()) if cache_path else None
+        scores = None
+        if cache_path:
+            scores = load_cached_scores(cache_path, digest, len(self.words))
+        if scores is None:
+            scores = self._score_all(use_solver)
+            if cache_path:
+                save_cached_scores(cache_path, digest, scores)
+        self.scores = scores
+
+        order = sorted(range(len(self.words)), key=scores.__getitem__)
+        self.sorted_ids = array("L", order)
+        self._ranks = None
+        self.bounds = {}
+        count = len(order)
+        for position, tier in enumerate(self.tiers):
+            start = count * position // len(self.tiers)
+            end = count * (position + 1) // len(self.tiers)
+            self.bounds[tier] = (start, end)
+
+    def _iter_words(self):
+        get = self._get
+        return (get(word_id) for word_id in range(len(self.words)))
+
+    def _score_all(self, use_solver):
+        solver = None
+        if use_solver and len(self.words):
+            from solver import Solver
+
+            solver = Solver(self._iter_words())
+        return array("f", (score_word(word, solver) for word in self._iter_words()))
+
+    def tier_of(self, word_id):
+        """Return the tier name of a word id."""
+        if self._ranks is None:
+            self._ranks = array("L", [0]) * len(self.sorted_ids)
+            for rank, sorted_id in enumerate(self.sorted_ids):
+                self._ranks[sorted_id] = rank
+        rank = self._ranks[word_id]
+        for tier in self.tiers:
+            start, end = self.bounds[tier]
+            if start <= rank < end:
+                return tier
+        raise IndexError(word_id)
+
+    def tier_ids(self, tier):
+        """Return the word ids in tier, easiest first."""
+        start, end = self._bounds(tier)
+        return self.sorted_ids[start:end]
+
+    def _bounds(self, tier):
+        if tier not in self.bounds:
+            raise ValueError(f"unknown difficulty '{tier}', use one of {self.tiers}")
+        return self.bounds[tier]
+
+    def random_word(self, tier, rng=random):
+        """Return a random word from tier in constant time."""
+        start, end = self._bounds(tier)
+        if start == end:
+            raise ValueError(f"no words in difficulty '{tier}'")
+        return self._get(self.sorted_ids[rng.randrange(start, end)]).upper()
+
+    def selector(self, tier, seed=None, no_repeat=True):
+        """Return a WordSelector that only draws words from tier."""
+        from selection import WordSelector
+
+        return WordSelector(
+            seed=seed, no_repeat=no_repeat, words=self.words, ids=self.tier_ids(tier)
+        )
@@ -6,6 +6,7 @@ programmatically or extend them.
 """
 
 from hangman import HangmanGame, Player, WordBank, GameInterface
+from tournament import Tournament
 
 
 def example_programmatic_usage():
@@ -66,28 +67,20 @@ def example_game_integration():
     """
     print("\n=== Game Integration Example ===\n")
 
-    # Create multiple players
-    players = [Player("Bob"), Player("Carol"), Player("Dave")]
+    # A league of bots playing real games with different strategies
+    tournament = Tournament(
+        {"Bob": "frequency", "Carol": "solver", "Dave": "random", "Erin": "solver"},
+        rounds=3,
+        seed=7,
+    )
+    standings = tournament.run()
 
-    # Simulate a tournament
-    for player in players:
-        game = HangmanGame(player)
-
-        # Play 3 games per player (simplified simulation)
-        for _ in range(3):
-            game.start_new_game()
-            # Simulate random completion
-            import random
-
-            player.add_win() if random.choice([True, False]) else player.add_loss()
-
-    # Display leaderboard
+    # Display standings (3 points per match won, 1 per draw)
     print("Tournament Results:")
-    print(f"{'Player':<10} {'Score':<10} {'Wins':<8} {'Win Rate'}")
+    print(f"{'Player':<10} {'Points':<10} {'Wins':<8} {'Win Rate'}")
     print("-" * 45)
 
-    for player in sorted(players, key=lambda p: p.score, reverse=True):
-        stats = player.get_stats()
+    for stats in standings.top(len(tournament.players)):
         print(
             f"{stats['name']:<10} {stats['score']:<10} {stats['games_won']:<8} {stats['win_rate']:.1f}%"
         )
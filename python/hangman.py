@@ -1,10 +1,20 @@
 """
 Hangman Game - Main Module
 A text-based interactive Hangman game with OOP design.
+
+Importing this module only defines the game classes. Anything heavier (the
+terminal renderer, word files, the random module, metrics) is imported the
+first time it is needed, so short-lived tools and worker processes that
+import hangman start quickly.
 """
 
-import random
+import _thread
+import bisect
 import os
+import sys
+import time
+
+from alphabet import LETTER_KEYS, letter_key, upper
 
 
 class HangmanDisplay:
@@ -84,10 +94,50 @@ class HangmanDisplay:
         return HangmanDisplay.STAGES[stage_index]
 
 
-class WordBank:
-    """Manages the word list and word selection."""
+class WordSnapshot:
+    """One immutable, numbered version of the word bank's word list."""
+
+    __slots__ = ("version", "words", "source")
+
+    def __init__(self, version, words, source=None):
+        self.version = version
+        self.words = words
+        self.source = source
+
+
+# Serializes WordBank writers. _thread's lock is threading.Lock without the
+# cost of importing threading at startup.
+_write_lock = _thread.allocate_lock()
+
+
+class _SnapshotWords:
+    """WORD_LIST read through a WordBank instance."""
+
+    def __get__(self, instance, owner):
+        return owner.snapshot.words
 
-    WORD_LIST = [
+
+class _WordBankType(type):
+    # A property on the metaclass, unlike a plain descriptor, also makes
+    # WordBank.WORD_LIST read-only, so it can't be replaced by assignment.
+    @property
+    def WORD_LIST(cls):
+        """The published words: always the words of the current snapshot."""
+        return cls.snapshot.words
+
+
+class WordBank(metaclass=_WordBankType):
+    """
+    Manages the word list and word selection.
+
+    The words are published as one immutable WordSnapshot that is replaced,
+    never changed in place: writers build a new snapshot and publish it with
+    a single assignment, so readers on any thread just take a reference
+    without locking and never see a half-updated list. WORD_LIST is read
+    from the snapshot, so the two can never disagree.
+    """
+
+    DEFAULT_WORDS = (
         "python",
         "javascript",
         "programming",
@@ -117,83 +167,296 @@ class WordBank:
         "compilation",
         "exception",
         "middleware",
-    ]
+    )
+
+    # The published snapshot; WORD_LIST is always snapshot.words.
+    snapshot = WordSnapshot(1, DEFAULT_WORDS)
+    WORD_LIST = _SnapshotWords()
+
+    # Optional MmapWordBank opened by use_word_file().
+    word_file = None
+
+    # Optional loader.WordListWatcher started by watch().
+    watcher = None
+
+    @staticmethod
+    def get_random_word(rng=None):
+        """
+        Return a random word from the word bank.
+        Pass a random.Random as rng for reproducible draws.
+        """
+        if rng is None:
+            import random as rng
+        if WordBank.word_file is not None:
+            return WordBank.word_file.get_random_word(rng=rng)
+        return rng.choice(WordBank.snapshot.words).upper()
+
+    @staticmethod
+    def use_word_file(path):
+        """
+        Draw words from a prebuilt binary word file instead of WORD_LIST.
+        Pass None to go back to the in-memory list.
+        """
+        from wordstore import MmapWordBank
+
+        bank = MmapWordBank(path) if path else None
+        if bank is not None and not len(bank):
+            bank.close()
+            raise ValueError(f"word file {path} has no words")
+        old = WordBank.word_file
+        WordBank.word_file = bank
+        if old is not None:
+            old.close()
+
+    @staticmethod
+    def current():
+        """Return the published WordSnapshot (version, words, source)."""
+        return WordBank.snapshot
 
     @staticmethod
-    def get_random_word():
-        """Return a random word from the word bank."""
-        return random.choice(WordBank.WORD_LIST).upper()
+    def _publish(words, source):
+        snapshot = WordSnapshot(WordBank.snapshot.version + 1, words, source)
+        WordBank.snapshot = snapshot
+        return snapshot
 
     @staticmethod
     def add_words(words):
-        """Add new words to the word bank."""
-        WordBank.WORD_LIST.extend(words)
+        """
+        Add new words to the word bank. Every call copies the published
+        tuple, so add a large list in one call rather than in many batches.
+        """
+        with _write_lock:
+            current = WordBank.snapshot
+            added = words if isinstance(words, tuple) else tuple(words)
+            return WordBank._publish(current.words + added, current.source)
+
+    @staticmethod
+    def replace_words(words, source=None):
+        """Swap in a whole new word list and return its WordSnapshot."""
+        words = tuple(words)
+        if not words:
+            raise ValueError("the word bank needs at least one word")
+        with _write_lock:
+            return WordBank._publish(words, source)
+
+    @staticmethod
+    def reload(path=None):
+        """
+        Load a word list file (see loader.py for the formats) and swap it
+        in. path defaults to the file the current list came from.
+        """
+        from loader import read_word_lists
+
+        path = path if path is not None else WordBank.snapshot.source
+        if path is None:
+            raise ValueError("no word list file to reload")
+        return WordBank.replace_words(read_word_lists([path]), source=path)
+
+    @staticmethod
+    def watch(path, interval=1.0):
+        """
+        Reload path whenever it changes, checking every interval seconds on
+        a background thread. Returns the watcher; call its stop() to end.
+        """
+        from loader import WordListWatcher
+
+        if WordBank.watcher is not None:
+            WordBank.watcher.stop()
+        WordBank.watcher = WordListWatcher(path, WordBank.reload, interval)
+        WordBank.watcher.start()
+        return WordBank.watcher
 
 
 class Word:
-    """Represents the secret word to be guessed."""
+    """Represents the secret word or phrase to be guessed."""
 
     def __init__(self, word):
-        self.word = word.upper()
-        self.letters = set(self.word)
+        self.word = word = " ".join(upper(word).split())
         self.guessed_letters = set()
 
+        # Positions of each letter key (see alphabet.py), so a guess only
+        # touches its occurrences. Spaces and punctuation have no key and
+        # are shown from the start.
+        self.positions = positions = {}
+        self._reveal = reveal = ["_"] * len(word)
+        keys = LETTER_KEYS
+        for index, char in enumerate(word):
+            key = keys.get(char) or letter_key(char)
+            if key is None:
+                reveal[index] = char
+            else:
+                positions.setdefault(key, []).append(index)
+        self.letters = set(positions)
+        self._hidden_letters = len(positions)
+
+        # Cached results, rebuilt only after a guess changes them.
+        self._display = None
+        self._pattern = None
+        self._sorted_guesses = []
+
     def guess_letter(self, letter):
         """
         Add a guessed letter and return True if correct, False otherwise.
+        Accented and lowercase forms match their base letter.
         """
-        letter = letter.upper()
+        letter = LETTER_KEYS.get(letter) or letter_key(letter)
+        if letter is None:
+            return False
+        if letter in self.guessed_letters:
+            return letter in self.letters
+
         self.guessed_letters.add(letter)
-        return letter in self.letters
+        bisect.insort(self._sorted_guesses, letter)
+
+        hits = self.positions.get(letter)
+        if not hits:
+            return False
+        word = self.word
+        for index in hits:
+            self._reveal[index] = word[index]
+        self._hidden_letters -= 1
+        self._display = self._pattern = None
+        return True
 
     def is_solved(self):
         """Check if the word has been completely guessed."""
-        return self.letters.issubset(self.guessed_letters)
+        return self._hidden_letters == 0
 
     def get_display(self):
         """Return the word with unguessed letters as underscores."""
-        return " ".join(
-            letter if letter in self.guessed_letters else "_" for letter in self.word
-        )
+        if self._display is None:
+            self._display = " ".join(self._reveal)
+        return self._display
+
+    def get_pattern(self):
+        """
+        Return the display as one token, like "P_TH_N" or "T_/B_": no
+        spaces between letters and "/" between the words of a phrase.
+        """
+        if self._pattern is None:
+            self._pattern = "".join(self._reveal).replace(" ", "/")
+        return self._pattern
+
+    def get_guessed_letters(self):
+        """Return the guessed letters in sorted order."""
+        return list(self._sorted_guesses)
 
     def get_word(self):
         """Return the original word."""
         return self.word
 
+    def unguessed_copy(self):
+        """
+        Return a new Word for the same text with nothing guessed. The letter
+        positions are shared rather than rebuilt, since guesses never change
+        them.
+        """
+        word = Word.__new__(Word)
+        word.word = self.word
+        word.positions = self.positions
+        word.letters = self.letters
+        word.guessed_letters = set()
+        word._hidden_letters = len(self.positions)
+        word._reveal = list(self._reveal)
+        for letter in self.guessed_letters:
+            for index in self.positions.get(letter, ()):
+                word._reveal[index] = "_"
+        word._display = word._pattern = None
+        word._sorted_guesses = []
+        return word
+
+    def restore_guesses(self, letters):
+        """
+        Mark letter keys as guessed all at once, as when loading a saved
+        game; cheaper than one guess_letter() call per letter.
+        """
+        guessed, positions = self.guessed_letters, self.positions
+        reveal, word = self._reveal, self.word
+        hidden = self._hidden_letters
+        for letter in letters:
+            if letter in guessed:
+                continue
+            guessed.add(letter)
+            hits = positions.get(letter)
+            if hits:
+                for index in hits:
+                    reveal[index] = word[index]
+                hidden -= 1
+        self._hidden_letters = hidden
+        self._sorted_guesses = sorted(guessed)
+        self._display = self._pattern = None
+
 
 class Player:
     """Represents a player in the game."""
 
-    def __init__(self, name="Player"):
+    def __init__(self, name="Player", store=None, leaderboard=None):
         self.name = name
         self.score = 0
         self.games_played = 0
         self.games_won = 0
+        self.store = store
+        # Response times of guesses in timed games.
+        self.timed_guesses = 0
+        self.response_time_total = 0.0
+        self.fastest_response = None
+        self.slowest_response = None
+        # Optional leaderboard.Leaderboard kept in sync with the stats.
+        self.leaderboard = leaderboard
+        if leaderboard is not None:
+            leaderboard.update(self)
 
     def add_win(self):
         """Record a win for the player."""
         self.games_won += 1
         self.games_played += 1
+        if self.leaderboard is not None:
+            self.leaderboard.update(self)
 
     def add_loss(self):
         """Record a loss for the player."""
         self.games_played += 1
+        if self.leaderboard is not None:
+            self.leaderboard.update(self)
 
     def add_score(self, points):
         """Add points to player's score."""
         self.score += points
+        if self.leaderboard is not None:
+            self.leaderboard.update(self)
+
+    def add_response_time(self, seconds):
+        """Record how long the player took over one guess in a timed game."""
+        self.timed_guesses += 1
+        self.response_time_total += seconds
+        if self.fastest_response is None or seconds < self.fastest_response:
+            self.fastest_response = seconds
+        if self.slowest_response is None or seconds > self.slowest_response:
+            self.slowest_response = seconds
+
+    def save(self):
+        """Queue the player's stats in the attached store, if any."""
+        if self.store is not None:
+            self.store.record(self)
 
     def get_stats(self):
         """Return player statistics."""
         win_rate = (
             (self.games_won / self.games_played * 100) if self.games_played > 0 else 0
         )
+        average_response = (
+            self.response_time_total / self.timed_guesses if self.timed_guesses else 0
+        )
         return {
             "name": self.name,
             "score": self.score,
             "games_played": self.games_played,
             "games_won": self.games_won,
             "win_rate": win_rate,
+            "timed_guesses": self.timed_guesses,
+            "average_response_time": average_response,
+            "fastest_response": self.fastest_response,
+            "slowest_response": self.slowest_response,
         }
 
 
@@ -202,30 +465,86 @@ class HangmanGame:
 
     MAX_WRONG_GUESSES = 6
 
-    def __init__(self, player=None):
+    def __init__(
+        self,
+        player=None,
+        selector=None,
+        event_log=None,
+        guess_time=None,
+        game_time=None,
+        timers=None,
+    ):
+        """
+        guess_time / game_time: seconds allowed per guess and per game; the
+            game is lost when either runs out. timers is the
+            timers.TimerWheel that enforces them (default: a shared wheel).
+        """
         self.player = player if player else Player()
+        # Optional selection.WordSelector for seeded / no-repeat words.
+        self.selector = selector
+        # Optional replay.EventLog that records every game.
+        self.event_log = event_log
+        self.log_id = None
+        # Optional timers.GameTimer for timed mode.
+        self.timer = None
+        if guess_time or game_time:
+            from timers import GameTimer
+
+            self.timer = GameTimer(self, guess_time, game_time, timers)
         self.word = None
         self.wrong_guesses = 0
         self.game_over = False
         self.won = False
 
+    def next_word(self):
+        """Return the word for the next game."""
+        if self.selector is not None:
+            return self.selector.next_word()
+        return WordBank.get_random_word()
+
     def start_new_game(self):
         """Initialize a new game."""
-        self.word = Word(WordBank.get_random_word())
+        self.word = Word(self.next_word())
         self.wrong_guesses = 0
         self.game_over = False
         self.won = False
+        if self.event_log is not None:
+            self.log_id = self.event_log.game_started(self)
+        if self.timer is not None:
+            self.timer.start()
 
     def make_guess(self, letter):
         """
         Process a letter guess.
         Returns a tuple: (is_correct, message)
         """
-        if not letter or len(letter) != 1 or not letter.isalpha():
+        timer = self.timer
+        if timer is not None and timer.check():
+            return None, f"Time's up! The word was: {self.word.get_word()}"
+        was_over = self.game_over
+        is_correct, message = self.process_guess(letter)
+        if self.event_log is not None and not was_over:
+            self.event_log.guess_made(self, letter, is_correct)
+        if timer is not None and is_correct is not None and not was_over:
+            self.player.add_response_time(timer.guess_made())
+        return is_correct, message
+
+    def time_up(self, kind):
+        """End the game as lost because the guess or game clock ran out."""
+        if self.game_over:
+            return
+        self.game_over = True
+        self.player.add_loss()
+        self.player.save()
+        if self.event_log is not None:
+            self.event_log.game_ended(self)
+
+    def process_guess(self, letter):
+        """Apply a letter guess to the game state; see make_guess()."""
+        letter = LETTER_KEYS.get(letter) or letter_key(letter)
+        if letter is None:
             return None, "Please enter a single letter."
 
-        letter = letter.upper()
-
         if letter in self.word.guessed_letters:
             return None, f"You already guessed '{letter}'. Try a different letter."
 
@@ -238,6 +557,7 @@ class HangmanGame:
                 self.player.add_win()
                 points = (self.MAX_WRONG_GUESSES - self.wrong_guesses) * 10
                 self.player.add_score(points)
+                self.player.save()
                 return True, f"Correct! You won! +{points} points"
             return True, f"Good guess! '{letter}' is in the word."
         else:
@@ -245,6 +565,7 @@ class HangmanGame:
             if self.wrong_guesses >= self.MAX_WRONG_GUESSES:
                 self.game_over = True
                 self.player.add_loss()
+                self.player.save()
                 return False, f"Wrong! The word was: {self.word.get_word()}"
             return False, f"Sorry, '{letter}' is not in the word."
 
@@ -254,10 +575,11 @@ class HangmanGame:
             "word_display": self.word.get_display(),
             "wrong_guesses": self.wrong_guesses,
             "max_guesses": self.MAX_WRONG_GUESSES,
-            "guessed_letters": sorted(self.word.guessed_letters),
+            "guessed_letters": self.word.get_guessed_letters(),
             "hangman_stage": HangmanDisplay.get_stage(self.wrong_guesses),
             "game_over": self.game_over,
             "won": self.won,
+            "timed_out": self.timer.expired if self.timer is not None else None,
         }
 
 
@@ -267,7 +589,11 @@ class GameInterface:
     @staticmethod
     def clear_screen():
         """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        from renderer import CLEAR_SCREEN, enable_ansi
+
+        enable_ansi()
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
 
     @staticmethod
     def display_header():
@@ -329,8 +655,24 @@ class GameInterface:
         input("\nPress ENTER to start...")
 
 
-def main():
-    """Main game loop."""
+def main(delay=True, guess_time=None):
+    """
+    Main game loop.
+    Pass delay=False (or set HANGMAN_NO_DELAY=1) to skip the pauses
+    between guesses, and guess_time to play timed games with that many
+    seconds per guess.
+    """
+    from renderer import FrameCache, LineReader, TerminalRenderer, game_frame
+
+    if os.environ.get("HANGMAN_NO_DELAY"):
+        delay = False
+    if os.environ.get("HANGMAN_METRICS") or os.environ.get("HANGMAN_PROFILE"):
+        import metrics
+
+        metrics.configure_from_env(
+            HangmanGame, GameInterface, TerminalRenderer, FrameCache
+        )
+
     interface = GameInterface()
     interface.display_welcome()
 
@@ -341,47 +683,50 @@ def main():
     )
     player = Player(player_name if player_name else "Player")
 
-    game = HangmanGame(player)
+    game = HangmanGame(player, guess_time=guess_time)
+    renderer = TerminalRenderer()
+    reader = LineReader()
     playing = True
 
+    idle = None
+    if game.timer is not None:
+
+        def idle():
+            # Run the clock while waiting for input.
+            if game.timer.wheel.advance() and game.game_over:
+                renderer.draw(game_frame(player, game.get_game_state(), "Time's up!"))
+                sys.stdout.write("Press ENTER to continue...")
+                sys.stdout.flush()
+
     while playing:
         # Start a new game
         game.start_new_game()
+        renderer.invalidate()
+        message = None
 
         while not game.game_over:
-            interface.clear_screen()
-            interface.display_header()
-            interface.display_player_stats(player)
-
-            game_state = game.get_game_state()
-            interface.display_game_state(game_state)
+            renderer.draw(game_frame(player, game.get_game_state(), message))
 
             # Get user input
-            guess = interface.get_user_input(
-                "\nEnter a letter (or 'quit' to exit): "
+            guess = reader.read_line(
+                "Enter a letter (or 'quit' to exit): ", idle=idle
             ).lower()
 
             if guess == "quit":
                 playing = False
                 break
+            if game.game_over:
+                break  # the clock ran out while waiting; idle() said so
 
             # Process the guess
             is_correct, message = game.make_guess(guess)
 
             if message:
-                interface.clear_screen()
-                interface.display_header()
-                interface.display_player_stats(player)
-                game_state = game.get_game_state()
-                interface.display_game_state(game_state)
-                interface.display_message(message)
+                renderer.draw(game_frame(player, game.get_game_state(), message))
 
                 if game.game_over:
-                    print()
                     input("Press ENTER to continue...")
-                else:
-                    import time
-
+                elif delay:
                     time.sleep(1.5)
 
         if not playing:
@@ -405,4 +750,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(
+        delay="--no-delay" not in sys.argv,
+        guess_time=15.0 if "--timed" in sys.argv else None,
+    )
@@ -0,0 +1,213 @@
+"""
+Hangman Game - Leaderboard
+Keeps players ranked by score as their scores change.
+
+Players are held in an indexable skip list ordered by score (highest first,
+then name). Each link records how many positions it skips, so a score update
+is O(log n), the rank of any player is O(log n), and the top k players are
+read in O(k), with no full sort per view.
+
+Attach the leaderboard to players (Player(name, leaderboard=board) or
+board.track(player)) and Player.add_score() / add_win() / add_loss() keep it
+up to date. For very large populations, readers can use snapshot(): an
+immutable copy of the top entries refreshed at most every snapshot_interval
+seconds, so frequent views never walk the list.
+"""
+
+import random
+import time
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ("key", "entry", "forward", "width")
+
+    def __init__(self, key, entry, level):
+        self.key = key
+        self.entry = entry
+        self.forward = [None] * level
+        self.width = [1] * level
+
+
+class Leaderboard:
+    """Players ranked by score, updated incrementally."""
+
+    def __init__(self, snapshot_size=100, snapshot_interval=1.0, seed=None):
+        self._rng = random.Random(seed)
+        self._head = _Node(None, None, MAX_LEVEL)
+        self._level = 1
+        self._nodes = {}
+        self.snapshot_size = snapshot_size
+        self.snapshot_interval = snapshot_interval
+        self._snapshot = ()
+        self._snapshot_time = None
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, name):
+        return name in self._nodes
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and self._rng.random() < 0.25:
+            level += 1
+        return level
+
+    def _insert(self, key, entry):
+        update = [self._head] * MAX_LEVEL
+        steps = [0] * MAX_LEVEL
+        node = self._head
+        position = 0
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level] is not None and node.forward[level].key < key:
+                position += node.width[level]
+                node = node.forward[level]
+            update[level] = node
+            steps[level] = position
+
+        new_level = self._random_level()
+        if new_level > self._level:
+            for level in range(self._level, new_level):
+                update[level] = self._head
+                steps[level] = 0
+                self._head.width[level] = len(self._nodes) + 1
+            self._level = new_level
+
+        new = _Node(key, entry, new_level)
+        for level in range(new_level):
+            before = update[level]
+            skipped = position - steps[level]
+            new.forward[level] = before.forward[level]
+            new.width[level] = before.width[level] - skipped
+            before.forward[level] = new
+            before.width[level] = skipped + 1
+        for level in range(new_level, self._level):
+            update[level].width[level] += 1
+        return new
+
+    def _remove(self, key):
+        update = [None] * MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level] is not None and node.forward[level].key < key:
+                node = node.forward[level]
+            update[level] = node
+
+        target = node.forward[0]
+        for level in range(self._level):
+            before = update[level]
+            if before.forward[level] is target:
+                before.forward[level] = target.forward[level]
+                before.width[level] += target.width[level] - 1
+            else:
+                before.width[level] -= 1
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+
+    def update(self, player):
+        """Insert or reposition a player after their stats changed."""
+        name = player.name
+        entry = (name, player.score, player.games_played, player.games_won)
+        old = self._nodes.get(name)
+        if old is not None:
+            if old.entry[1] == player.score:
+                old.entry = entry
+                self._maybe_snapshot()
+                return
+            self._remove(old.key)
+        self._nodes[name] = self._insert((-player.score, name), entry)
+        self._maybe_snapshot()
+
+    def track(self, player):
+        """Attach the leaderboard to player and add them to it."""
+        player.leaderboard = self
+        self.update(player)
+
+    def remove(self, name):
+        """Drop a player from the leaderboard."""
+        node = self._nodes.pop(name, None)
+        if node is not None:
+            self._remove(node.key)
+            self._maybe_snapshot()
+
+    def rank(self, name):
+        """Return the 1-based rank of a player, or None if not ranked."""
+        node = self._nodes.get(name)
+        if node is None:
+            return None
+        key = node.key
+        position = 0
+        current = self._head
+        for level in range(self._level - 1, -1, -1):
+            while (
+                current.forward[level] is not None and current.forward[level].key <= key
+            ):
+                position += current.width[level]
+                current = current.forward[level]
+        return position
+
+    def top(self, k=10):
+        """Return the top k entries as stats dicts, highest score first."""
+        entries = []
+        node = self._head.forward[0]
+        while node is not None and len(entries) < k:
+            entries.append(_stats(len(entries) + 1, node.entry))
+            node = node.forward[0]
+        return entries
+
+    def around(self, name, radius=2):
+        """Return the entries ranked within radius places of a player."""
+        rank = self.rank(name)
+        if rank is None:
+            return []
+        return self.page(max(1, rank - radius), 2 * radius + 1)
+
+    def page(self, start_rank, count):
+        """Return count entries starting at start_rank (1-based)."""
+        node = self._head
+        position = 0
+        for level in range(self._level - 1, -1, -1):
+            while (
+                node.forward[level] is not None
+                and position + node.width[level] < start_rank
+            ):
+                position += node.width[level]
+                node = node.forward[level]
+        entries = []
+        node = node.forward[0]
+        while node is not None and len(entries) < count:
+            entries.append(_stats(start_rank + len(entries), node.entry))
+            node = node.forward[0]
+        return entries
+
+    def _maybe_snapshot(self):
+        now = time.monotonic()
+        if (
+            self._snapshot_time is None
+            or now - self._snapshot_time >= self.snapshot_interval
+        ):
+            self.refresh_snapshot(now)
+
+    def refresh_snapshot(self, now=None):
+        """Rebuild the published snapshot of the top entries now."""
+        self._snapshot = tuple(self.top(self.snapshot_size))
+        self._snapshot_time = now if now is not None else time.monotonic()
+
+    def snapshot(self):
+        """Return the latest published top entries (may be slightly stale)."""
+        return self._snapshot
+
+
+def _stats(rank, entry):
+    name, score, games_played, games_won = entry
+    win_rate = (games_won / games_played * 100) if games_played > 0 else 0
+    return {
+        "rank": rank,
+        "name": name,
+        "score": score,
+        "games_played": games_played,
+        "games_won": games_won,
+        "win_rate": win_rate,
+    }
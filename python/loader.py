@@ -0,0 +1,319 @@
+"""
+Hangman Game - Streaming Word List Loader
+Loads custom word lists from files of any size into the WordBank.
+
+Inputs are newline-delimited word lists, either plain or compressed with gzip
+or bz2, or tar archives (optionally compressed) of such lists. Files are read
+in fixed-size chunks, words are normalized and deduplicated with a Bloom
+filter of fixed size, and accepted words are collected and published to
+the WordBank with a single WordBank.add_words() call at the end. Apart from
+the words themselves, memory use does not depend on the size of the input,
+and the published tuple is copied once rather than once per batch.
+
+read_word_lists() reads whole lists for WordBank.reload(), and
+WordListWatcher reloads a list in the background whenever its file changes.
+
+    python loader.py words.txt.gz more_words.tar.bz2
+"""
+
+import argparse
+import bz2
+import gzip
+import hashlib
+import math
+import os
+import tarfile
+import threading
+import time
+
+from alphabet import LETTER_KEYS, letter_key
+from hangman import WordBank
+
+CHUNK_SIZE = 1 << 20
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set used to drop duplicate words."""
+
+    def __init__(self, expected_items=1000000, false_positive_rate=0.001):
+        bits = -expected_items * math.log(false_positive_rate) / math.log(2) ** 2
+        self.size = max(8, int(bits))
+        self.hashes = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, item):
+        """Add item; return True if it was (probably) not present before."""
+        added = False
+        for position in self._positions(item):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & bit:
+                self.bits[byte] |= bit
+                added = True
+        return added
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class LoadProgress:
+    """Counters describing a load in progress."""
+
+    def __init__(self):
+        self.files = 0
+        self.bytes_read = 0
+        self.lines = 0
+        self.accepted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def get_stats(self):
+        """Return the counters and throughput as a dict."""
+        elapsed = self.elapsed or 1e-9
+        return {
+            "files": self.files,
+            "bytes_read": self.bytes_read,
+            "lines": self.lines,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "elapsed": elapsed,
+            "lines_per_second": self.lines / elapsed,
+            "megabytes_per_second": self.bytes_read / elapsed / 1e6,
+        }
+
+
+def _is_tar(path):
+    name = path.lower()
+    return name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2"))
+
+
+def open_streams(path):
+    """Yield a binary file object for every word list in path."""
+    if _is_tar(path):
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                if member.isfile():
+                    yield archive.extractfile(member)
+        return
+
+    with open(path, "rb") as raw:
+        magic = raw.read(3)
+    if magic[:2] == b"\x1f\x8b":
+        opener = gzip.open
+    elif magic == b"BZh":
+        opener = bz2.open
+    else:
+        opener = open
+    with opener(path, "rb") as stream:
+        yield stream
+
+
+def iter_lines(stream, progress, chunk_size=CHUNK_SIZE):
+    """Yield decoded lines from a binary stream, reading chunk by chunk."""
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        progress.bytes_read += len(chunk)
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8", "replace")
+    if tail:
+        yield tail.decode("utf-8", "replace")
+
+
+def normalize(line, min_length=3, max_length=32):
+    """
+    Return the word or phrase on line in WordBank form, or None to reject
+    it. Runs of whitespace become one space, as in Word. Besides letters
+    (see alphabet.py), only spaces and punctuation are accepted, and there
+    must be at least one letter.
+    """
+    word = line.strip().lower()
+    if word.isascii() and word.isalpha():
+        return word if min_length <= len(word) <= max_length else None
+    word = " ".join(word.split())
+    if not min_length <= len(word) <= max_length:
+        return None
+    has_letter = False
+    for char in word:
+        if (LETTER_KEYS.get(char) or letter_key(char)) is not None:
+            has_letter = True
+        elif char.isalnum() or not (char == " " or char.isprintable()):
+            return None
+    return word if has_letter else None
+
+
+def iter_words(paths, progress=None, seen=None, min_length=3, max_length=32):
+    """
+    Yield normalized, deduplicated words from every file in paths.
+    seen is the BloomFilter used for deduplication.
+    """
+    progress = progress if progress is not None else LoadProgress()
+    seen = seen if seen is not None else BloomFilter()
+    for path in paths:
+        for stream in open_streams(path):
+            progress.files += 1
+            for line in iter_lines(stream, progress):
+                progress.lines += 1
+                word = normalize(line, min_length, max_length)
+                if word is None:
+                    progress.rejected += 1
+                elif not seen.add(word):
+                    progress.duplicates += 1
+                else:
+                    progress.accepted += 1
+                    yield word
+
+
+def load_word_lists(
+    paths,
+    batch_size=10000,
+    expected_words=1000000,
+    on_progress=None,
+    sink=None,
+    min_length=3,
+    max_length=32,
+):
+    """
+    Stream words from paths into WordBank and return the LoadProgress.
+
+    Words already in the bank are not added again. The Bloom filter is sized
+    for expected_words at a 0.1% false positive rate, so a tiny fraction of
+    unique words may be skipped as duplicates. on_progress, if given, is
+    called with the LoadProgress after every batch. sink, if given, is
+    called with each batch of words; by default the words are published to
+    WordBank once, after the last batch.
+    """
+    collected = None
+    if sink is None:
+        collected = []
+        sink = collected.extend
+    progress = LoadProgress()
+    existing = WordBank.WORD_LIST
+    seen = BloomFilter(expected_words + len(existing))
+    for word in existing:
+        seen.add(word.lower())
+
+    batch = []
+    words = iter_words(paths, progress, seen, min_length, max_length)
+    for word in words:
+        batch.append(word)
+        if len(batch) >= batch_size:
+            sink(batch)
+            batch = []
+            if on_progress is not None:
+                on_progress(progress)
+    if batch:
+        sink(batch)
+    if collected:
+        WordBank.add_words(collected)
+    if on_progress is not None:
+        on_progress(progress)
+    return progress
+
+
+def read_word_lists(paths, min_length=3, max_length=32):
+    """Return the distinct words of every file in paths as a tuple."""
+    words = {}
+    progress = LoadProgress()
+    for path in paths:
+        for stream in open_streams(path):
+            for line in iter_lines(stream, progress):
+                word = normalize(line, min_length, max_length)
+                if word is not None:
+                    words[word] = None
+    return tuple(words)
+
+
+class WordListWatcher(threading.Thread):
+    """Background thread that calls reload(path) whenever path changes."""
+
+    def __init__(self, path, reload, interval=1.0, on_error=None):
+        super().__init__(name=f"WordListWatcher({path})", daemon=True)
+        self.path = path
+        self.reload = reload
+        self.interval = interval
+        self.on_error = on_error
+        self.reloads = 0
+        self._stopped = threading.Event()
+        self._signature = self._stat()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self):
+        """Reload now if the file changed since the last check."""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            self.reload(self.path)
+        except Exception as error:
+            # Keep serving the previous list; a half-written file is retried
+            # when it changes again.
+            if self.on_error is not None:
+                self.on_error(error)
+            return False
+        self.reloads += 1
+        return True
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        """Stop watching."""
+        self._stopped.set()
+
+
+def main():
+    """Load word lists from the command line and report throughput."""
+    parser = argparse.ArgumentParser(description="Load Hangman word lists")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--expected-words", type=int, default=1000000)
+    args = parser.parse_args()
+
+    def report(progress):
+        stats = progress.get_stats()
+        print(
+            f"\r{stats['lines']:>12,} lines  {stats['accepted']:>12,} words  "
+            f"{stats['megabytes_per_second']:6.1f} MB/s",
+            end="",
+            flush=True,
+        )
+
+    progress = load_word_lists(
+        args.paths, expected_words=args.expected_words, on_progress=report
+    )
+    stats = progress.get_stats()
+    print()
+    print(f"Duplicates skipped: {stats['duplicates']:,}")
+    print(f"Rejected lines:     {stats['rejected']:,}")
+    print(f"Words in bank:      {len(WordBank.WORD_LIST):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Hangman Game - Load Generator
+Drives a running game server with many concurrent bot clients and reports
+guesses per second and request latency percentiles.
+
+Usage:
+    python server.py &
+    python loadgen.py --clients 500 --games 20
+    python loadgen.py --spectators 2000 --events 200
+
+With --spectators, one player guesses in a shared room while the other
+connections watch it, and the latency reported is from sending each guess to
+each spectator receiving its event.
+"""
+
+import argparse
+import asyncio
+import time
+
+from simulation import COMMON_LETTERS
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at fraction (0-1) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _request(reader, writer, line, latencies):
+    started = time.perf_counter()
+    writer.write(line.encode("utf-8") + b"\n")
+    reply = (await reader.readline()).decode("utf-8").split()
+    latencies.append(time.perf_counter() - started)
+    if not reply or reply[0] != "OK":
+        raise RuntimeError(f"server replied {' '.join(reply)!r} to {line!r}")
+    return reply
+
+
+async def _connect(host, port, unix_path):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+
+async def run_client(host, port, unix_path, games, latencies):
+    """Play games on one connection with a frequency bot."""
+    reader, writer = await _connect(host, port, unix_path)
+
+    reply = await _request(reader, writer, "NEW loadgen", latencies)
+    session_id = reply[1]
+    for game in range(games):
+        if game:
+            await _request(reader, writer, f"NEXT {session_id}", latencies)
+        status = "playing"
+        letters = iter(COMMON_LETTERS)
+        while status == "playing":
+            letter = next(letters)
+            reply = await _request(
+                reader, writer, f"GUESS {session_id} {letter}", latencies
+            )
+            status = reply[4]
+
+    await _request(reader, writer, f"END {session_id}", latencies)
+    writer.close()
+
+
+async def run_load(host="127.0.0.1", port=7777, unix_path=None, clients=100, games=10):
+    """Run the load test and return a dict of results."""
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(run_client(host, port, unix_path, games, latencies) for _ in range(clients))
+    )
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+async def _room_reply(reader):
+    """Read up to the next reply line, skipping pushed events; return both."""
+    events = []
+    while True:
+        line = (await reader.readline()).decode("utf-8")
+        if not line:
+            raise ConnectionError("server closed the connection")
+        if line.startswith("EVT "):
+            events.append(line.split())
+            continue
+        return line.split(), events
+
+
+async def _spectate(reader, sent, events, latencies):
+    received = 0
+    while received < events:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        if line.startswith(b"EVT "):
+            latencies.append(time.perf_counter() - sent[int(line.split()[2])])
+            received += 1
+
+
+async def run_room_load(
+    host="127.0.0.1", port=7777, unix_path=None, spectators=1000, events=100
+):
+    """Broadcast events from one room player to many spectators."""
+    room = f"load-{time.monotonic_ns()}"
+    reader, writer = await _connect(host, port, unix_path)
+    writer.write(f"JOIN {room} player\n".encode("utf-8"))
+    reply, _ = await _room_reply(reader)
+    version = int(reply[1])
+
+    watchers = []
+    for _ in range(spectators):
+        watcher = await _connect(host, port, unix_path)
+        watcher[1].write(f"WATCH {room}\n".encode("utf-8"))
+        await watcher[0].readline()
+        watchers.append(watcher)
+
+    sent = {}
+    latencies = []
+    tasks = [
+        asyncio.ensure_future(_spectate(watcher[0], sent, events, latencies))
+        for watcher in watchers
+    ]
+    started = time.perf_counter()
+    letters = iter(COMMON_LETTERS)
+    status = "playing"
+    for _ in range(events):
+        version += 1
+        sent[version] = time.perf_counter()
+        if status == "playing":
+            line = f"RGUESS {room} player {next(letters)}"
+        else:
+            line = f"RNEXT {room}"
+            letters = iter(COMMON_LETTERS)
+        writer.write(line.encode("utf-8") + b"\n")
+        reply, pushed = await _room_reply(reader)
+        if reply[0] != "OK":
+            raise RuntimeError(f"server replied {' '.join(reply)!r} to {line!r}")
+        # The server pushes a command's event before replying to it.
+        status = pushed[-1][-1] if pushed[-1][3] == "GUESS" else "playing"
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    for _, watcher_writer in watchers:
+        watcher_writer.close()
+    writer.close()
+
+    latencies.sort()
+    return {
+        "spectators": spectators,
+        "events": events,
+        "deliveries": len(latencies),
+        "elapsed": elapsed,
+        "deliveries_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+def main():
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman server load generator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="connect to a Unix socket path instead")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument(
+        "--spectators", type=int, help="watch one shared room with this many clients"
+    )
+    parser.add_argument("--events", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.spectators:
+        results = asyncio.run(
+            run_room_load(args.host, args.port, args.unix, args.spectators, args.events)
+        )
+        print(f"Spectators:   {results['spectators']}")
+        print(f"Deliveries:   {results['deliveries']}")
+        print(f"Throughput:   {results['deliveries_per_second']:.0f} events/sec")
+        print(f"Latency p50:  {results['p50_ms']:.2f} ms")
+        print(f"Latency p99:  {results['p99_ms']:.2f} ms")
+        print(f"Latency max:  {results['max_ms']:.2f} ms")
+        return
+
+    results = asyncio.run(
+        run_load(args.host, args.port, args.unix, args.clients, args.games)
+    )
+    print(f"Clients:      {results['clients']}")
+    print(f"Requests:     {results['requests']}")
+    print(f"Throughput:   {results['requests_per_second']:.0f} requests/sec")
+    print(f"Latency p50:  {results['p50_ms']:.2f} ms")
+    print(f"Latency p99:  {results['p99_ms']:.2f} ms")
+    print(f"Latency max:  {results['max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Hangman Game - Metrics and Profiling
+Optional counters, latency histograms and profiler capture for the engine.
+
+Nothing is measured until instrumentation is switched on: enable() wraps
+HangmanGame.start_new_game / make_guess / get_game_state, the renderer's
+draw calls (TerminalRenderer.draw, FrameCache.render / write) and the
+GameInterface screens with timing wrappers, and disable() puts the original
+methods back, so a game that never enables metrics runs exactly the code it
+always did.
+
+    import metrics
+    metrics.enable()
+    ...
+    print(metrics.REGISTRY.to_prometheus())
+
+Profiling is opt-in as well: start_profiling("cpu") runs cProfile,
+start_profiling("memory") runs tracemalloc, and stop_profiling() returns a
+text report. The same switches can be set from the environment:
+
+    HANGMAN_METRICS=1            instrument the game
+    HANGMAN_METRICS_OUTPUT=path  write metrics there at exit (.json for JSON,
+                                 anything else for Prometheus text)
+    HANGMAN_PROFILE=cpu,memory   profile and print the report at exit
+"""
+
+import atexit
+import bisect
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+
+# Latency bucket upper bounds in nanoseconds (1us .. 1s).
+BUCKETS_NS = (
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    250_000,
+    500_000,
+    1_000_000,
+    2_500_000,
+    10_000_000,
+    100_000_000,
+    1_000_000_000,
+)
+
+# Methods wrapped by enable(), by class name.
+INSTRUMENTED_METHODS = {
+    "HangmanGame": ("start_new_game", "make_guess", "get_game_state"),
+    "CompactHangmanGame": ("start_new_game", "make_guess", "get_game_state"),
+    "GameInterface": (
+        "clear_screen",
+        "display_header",
+        "display_game_state",
+        "display_player_stats",
+        "display_message",
+    ),
+    "TerminalRenderer": ("draw",),
+    "FrameCache": ("render", "write"),
+    "GameServer": ("handle",),
+}
+
+GUESS_RESULTS = {True: "hit", False: "miss", None: "invalid"}
+
+
+def _guess_result(return_value):
+    """Name the outcome of a make_guess() call from its return value."""
+    return GUESS_RESULTS[return_value[0]]
+
+
+class Histogram:
+    """Cumulative-friendly latency histogram with fixed buckets."""
+
+    __slots__ = ("counts", "count", "total_ns")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+
+    def observe(self, elapsed_ns):
+        """Record one duration in nanoseconds."""
+        self.counts[bisect.bisect_left(BUCKETS_NS, elapsed_ns)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+    def quantile(self, fraction):
+        """Return the upper bound (seconds) of the bucket holding fraction."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_NS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound / 1e9
+        return float("inf")
+
+    def snapshot(self):
+        """Return the histogram as a plain dict."""
+        return {
+            "count": self.count,
+            "sum_seconds": self.total_ns / 1e9,
+            "p50_seconds": self.quantile(0.50),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": {
+                str(bound / 1e9): count for bound, count in zip(BUCKETS_NS, self.counts)
+            },
+            "overflow": self.counts[-1],
+        }
+
+
+class Metrics:
+    """A registry of named counters and latency histograms."""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, amount=1):
+        """Add amount to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, elapsed_ns):
+        """Record a duration in nanoseconds for an operation."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(elapsed_ns)
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self):
+        """Return all metrics as a JSON-serializable dict."""
+        return {
+            "counters": dict(self.counters),
+            "latency": {
+                name: histogram.snapshot()
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+    def to_json(self):
+        """Return snapshot() as a JSON string."""
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def to_prometheus(self, prefix="hangman"):
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        if self.counters:
+            lines.append(f"# TYPE {prefix}_events_total counter")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        if self.histograms:
+            metric = f"{prefix}_operation_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(self.histograms.items()):
+                label = f'op="{name}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS_NS, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{metric}_bucket{{{label},le="{bound / 1e9:g}"}} {cumulative}'
+                    )
+                lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum{{{label}}} {histogram.total_ns / 1e9:.9f}")
+                lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Metrics()
+
+# (class, attribute) -> the original class attribute, for disable().
+_originals = {}
+
+
+def _timed(function, name, registry, classify=None):
+    """Wrap function so each call is counted and timed under name."""
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = clock()
+        try:
+            return_value = function(*args, **kwargs)
+        except Exception:
+            registry.inc(f"{name}.errors")
+            raise
+        finally:
+            registry.observe(name, clock() - started)
+        if classify is not None:
+            registry.inc(f"{name}.{classify(return_value)}")
+        return return_value
+
+    return wrapper
+
+
+def instrument(cls, names=None, registry=REGISTRY):
+    """Wrap the named methods of cls (default: INSTRUMENTED_METHODS)."""
+    if names is None:
+        names = INSTRUMENTED_METHODS.get(cls.__name__, ())
+    for attribute in names:
+        if (cls, attribute) in _originals:
+            continue
+        original = cls.__dict__.get(attribute)
+        if original is None:
+            continue
+        name = f"{cls.__name__}.{attribute}"
+        classify = _guess_result if attribute == "make_guess" else None
+        if isinstance(original, staticmethod):
+            wrapped = staticmethod(_timed(original.__func__, name, registry, classify))
+        else:
+            wrapped = _timed(original, name, registry, classify)
+        _originals[(cls, attribute)] = original
+        setattr(cls, attribute, wrapped)
+
+
+def enable(*classes, registry=REGISTRY):
+    """
+    Start collecting metrics for classes, by default HangmanGame,
+    GameInterface and the renderer classes. Pass the classes explicitly when
+    hangman runs as __main__, so the running copy of the module is the one
+    instrumented.
+    """
+    if not classes:
+        from hangman import GameInterface, HangmanGame
+        from renderer import FrameCache, TerminalRenderer
+
+        classes = (HangmanGame, GameInterface, TerminalRenderer, FrameCache)
+    for cls in classes:
+        instrument(cls, registry=registry)
+
+
+def disable():
+    """Restore every instrumented method."""
+    for (cls, attribute), original in _originals.items():
+        setattr(cls, attribute, original)
+    _originals.clear()
+
+
+def is_enabled():
+    """Return True if any method is currently instrumented."""
+    return bool(_originals)
+
+
+_profiler = None
+
+
+def start_profiling(kinds=("cpu",)):
+    """Start cProfile ("cpu") and/or tracemalloc ("memory")."""
+    global _profiler
+    if isinstance(kinds, str):
+        kinds = [kind.strip() for kind in kinds.split(",") if kind.strip()]
+    unknown = set(kinds) - {"cpu", "memory"}
+    if unknown:
+        raise ValueError(f"unknown profile kind(s): {', '.join(sorted(unknown))}")
+    if "memory" in kinds and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if "cpu" in kinds and _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def stop_profiling(limit=20):
+    """Stop any running profilers and return their report as text."""
+    global _profiler
+    report = []
+    if _profiler is not None:
+        _profiler.disable()
+        output = io.StringIO()
+        stats = pstats.Stats(_profiler, stream=output)
+        stats.sort_stats("cumulative").print_stats(limit)
+        report.append("CPU profile (cumulative):\n" + output.getvalue())
+        _profiler = None
+    if tracemalloc.is_tracing():
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report.append(f"Memory: {current:,} bytes traced, {peak:,} bytes peak")
+        for stat in snapshot.statistics("lineno")[:limit]:
+            report.append(f"  {stat}")
+    return "\n".join(report)
+
+
+def write_metrics(path, registry=REGISTRY):
+    """Write metrics to path, as JSON if it ends in .json."""
+    with open(path, "w") as handle:
+        if path.endswith(".json"):
+            handle.write(registry.to_json())
+        else:
+            handle.write(registry.to_prometheus())
+
+
+def configure_from_env(*classes, environ=None):
+    """Apply the HANGMAN_METRICS / HANGMAN_PROFILE environment switches."""
+    environ = os.environ if environ is None else environ
+    if environ.get("HANGMAN_METRICS"):
+        enable(*classes)
+        output = environ.get("HANGMAN_METRICS_OUTPUT")
+        if output:
+            atexit.register(write_metrics, output)
+    profile = environ.get("HANGMAN_PROFILE")
+    if profile:
+        start_profiling(profile)
+        atexit.register(lambda: print(stop_profiling(), file=sys.stderr))
@@ -0,0 +1,264 @@
+"""
+Hangman Game - Terminal Renderer
+Redraws the game screen with ANSI escape sequences instead of clearing it.
+
+TerminalRenderer keeps the last frame it drew as a list of lines. Drawing a
+new frame only rewrites the lines that changed (usually the word line, the
+guessed letters and a row or two of the hangman), all in one write, with no
+shell process spawned. LineReader collects keyboard input without blocking,
+so the game loop stays free to do other work while waiting for a guess.
+
+FrameCache goes further for kiosk and replay screens: it prebuilds each
+complete board as encoded bytes and only splices in the word and guessed
+letters, so a frame costs one bytes join and one stdout write.
+"""
+
+import os
+import shutil
+import sys
+import time
+
+ESC = "\x1b["
+CLEAR_SCREEN = ESC + "2J" + ESC + "H"
+CLEAR_TO_END_OF_LINE = ESC + "K"
+
+
+_ansi_enabled = False
+
+
+def enable_ansi():
+    """
+    Turn on escape sequence handling where it is off by default. Only the
+    first call does anything; later calls return at once.
+    """
+    global _ansi_enabled
+    if _ansi_enabled:
+        return
+    _ansi_enabled = True
+    if os.name == "nt":
+        # Any os.system() call switches the Windows console into VT mode.
+        os.system("")
+
+
+def header_lines():
+    """Return the game header, as GameInterface.display_header() prints it."""
+    return ["", "=" * 50, "          HANGMAN GAME".center(50), "=" * 50, ""]
+
+
+def player_lines(player):
+    """Return the player stats block, as display_player_stats() prints it."""
+    stats = player.get_stats()
+    lines = [
+        "",
+        "-" * 50,
+        f"Player: {stats['name']}",
+        f"Score: {stats['score']} | Games: {stats['games_played']} | "
+        f"Wins: {stats['games_won']}",
+    ]
+    if stats["games_played"] > 0:
+        lines.append(f"Win Rate: {stats['win_rate']:.1f}%")
+    lines += ["-" * 50, ""]
+    return lines
+
+
+def game_lines(game_state):
+    """Return the board, as display_game_state() prints it."""
+    if game_state["guessed_letters"]:
+        guessed = ", ".join(game_state["guessed_letters"])
+    else:
+        guessed = "None yet"
+    return game_state["hangman_stage"].split("\n") + [
+        "",
+        f"Word: {game_state['word_display']}",
+        "",
+        f"Wrong guesses: {game_state['wrong_guesses']}/{game_state['max_guesses']}",
+        f"Guessed letters: {guessed}",
+    ]
+
+
+def game_frame(player, game_state, message=None):
+    """Return every line of the in-game screen."""
+    lines = header_lines() + player_lines(player) + game_lines(game_state)
+    lines += ["", f">>> {message}" if message else ""]
+    return lines
+
+
+class TerminalRenderer:
+    """Diff-based screen renderer using a cached frame buffer."""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.frame = []
+        self.needs_clear = True
+        enable_ansi()
+
+    def clear(self):
+        """Clear the screen and forget the cached frame."""
+        self.stream.write(CLEAR_SCREEN)
+        self.stream.flush()
+        self.frame = []
+        self.needs_clear = False
+
+    def draw(self, lines):
+        """
+        Show lines, rewriting only rows that differ from the last frame,
+        and leave the cursor on the row below the frame.
+        Returns the number of rows rewritten.
+        """
+        out = []
+        if self.needs_clear:
+            out.append(CLEAR_SCREEN)
+            self.frame = []
+            self.needs_clear = False
+
+        previous = self.frame
+        changed = 0
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                out.append(f"{ESC}{row + 1};1H{line}{CLEAR_TO_END_OF_LINE}")
+                changed += 1
+        for row in range(len(lines), len(previous)):
+            out.append(f"{ESC}{row + 1};1H{CLEAR_TO_END_OF_LINE}")
+            changed += 1
+        out.append(f"{ESC}{len(lines) + 1};1H{CLEAR_TO_END_OF_LINE}")
+
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self.frame = list(lines)
+        return changed
+
+    def invalidate(self):
+        """Force a full redraw next time, e.g. after other output."""
+        self.needs_clear = True
+
+
+class LineReader:
+    """Non-blocking line input from the terminal."""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdin
+        self._buffer = ""
+
+    def poll(self, timeout=0.0):
+        """
+        Return a complete input line (without the newline) if one is ready
+        within timeout seconds, otherwise None.
+        """
+        if os.name == "nt":
+            return self._poll_windows(timeout)
+
+        import select
+
+        ready, _, _ = select.select([self.stream], [], [], timeout)
+        if not ready:
+            return None
+        line = self.stream.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+    def _poll_windows(self, timeout):
+        import msvcrt
+
+        deadline = time.monotonic() + timeout
+        while True:
+            while msvcrt.kbhit():
+                char = msvcrt.getwche()
+                if char in "\r\n":
+                    line, self._buffer = self._buffer, ""
+                    sys.stdout.write("\n")
+                    return line
+                if char == "\b":
+                    self._buffer = self._buffer[:-1]
+                else:
+                    self._buffer += char
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+
+    def read_line(self, prompt="", idle=None, interval=0.05):
+        """
+        Show prompt and wait for a line, calling idle() every interval
+        seconds while no input is ready.
+        """
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while True:
+            line = self.poll(interval)
+            if line is not None:
+                return line.strip()
+            if idle is not None:
+                idle()
+
+
+class FrameCache:
+    """
+    Prebuilt byte frames for the game board, one per
+    (wrong guesses, terminal width, max guesses).
+    """
+
+    def __init__(self, width=None, encoding="utf-8"):
+        self.width = width or shutil.get_terminal_size().columns
+        self.encoding = encoding
+        self._frames = {}
+
+    def _line(self, text):
+        return text[: self.width] + CLEAR_TO_END_OF_LINE + "\n"
+
+    def _build(self, wrong_guesses, max_guesses):
+        from hangman import HangmanDisplay
+
+        rule = "=" * min(50, self.width)
+        title = "HANGMAN GAME".center(len(rule))
+        stage = HangmanDisplay.get_stage(wrong_guesses).split("\n")
+        # The word and guessed letters are spliced in by render().
+        prefix = (
+            ESC
+            + "H"
+            + "".join(
+                self._line(text) for text in [rule, title, rule, ""] + stage + [""]
+            )
+        )
+        middle = (
+            CLEAR_TO_END_OF_LINE
+            + "\n"
+            + self._line("")
+            + self._line(f"Wrong guesses: {wrong_guesses}/{max_guesses}")
+        )
+        suffix = CLEAR_TO_END_OF_LINE + "\n" + ESC + "J"
+        return (
+            (prefix + "Word: ").encode(self.encoding),
+            (middle + "Guessed letters: ").encode(self.encoding),
+            suffix.encode(self.encoding),
+        )
+
+    def frame_for(self, wrong_guesses, max_guesses=6):
+        """Return the cached (prefix, middle, suffix) bytes of one layout."""
+        key = (wrong_guesses, self.width, max_guesses)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = self._build(wrong_guesses, max_guesses)
+        return frame
+
+    def prebuild(self, max_guesses=6):
+        """Build every board ahead of time."""
+        for wrong_guesses in range(max_guesses + 1):
+            self.frame_for(wrong_guesses, max_guesses)
+
+    def render(self, game_state):
+        """Return the complete frame for game_state as bytes."""
+        display = game_state["word_display"]
+        prefix, middle, suffix = self.frame_for(
+            game_state["wrong_guesses"], game_state["max_guesses"]
+        )
+        guessed = ", ".join(game_state["guessed_letters"]) or "None yet"
+        encoding = self.encoding
+        return b"".join(
+            (prefix, display.encode(encoding), middle, guessed.encode(encoding), suffix)
+        )
+
+    def write(self, game_state, stream=None):
+        """Render game_state and send it to the terminal in one write."""
+        stream = stream if stream is not None else sys.stdout.buffer
+        stream.write(self.render(game_state))
+        stream.flush()
@@ -0,0 +1,241 @@
+"""
+Hangman Game - Replay Log
+Records games as compact fixed-width binary events and reads them back.
+
+Attach an EventLog to a game (HangmanGame(player, event_log=log)) and every
+game start, guess and finish is appended as one 20-byte record:
+
+    kind      uint8   START, GUESS or END
+    letter    uint8   guessed letter (GUESS), 1 if won / 0 if lost (END)
+    result    uint8   HIT, MISS or INVALID (GUESS)
+    wrong     uint8   wrong guesses so far
+    game_id   uint32  numbers the games in this log
+    word_id   uint32  index into the log's word table
+    time_ns   uint64  wall clock time of the event
+
+A guessed letter is stored as its ASCII code, or as 128 plus its bit number
+in alphabet.LETTERS for Greek and Cyrillic letters; see letter_code().
+
+Words are stored once each in a sidecar "<path>.words" file, one per line.
+Records are buffered in memory and appended in large writes. The readers
+walk the file in big chunks with struct.iter_unpack, so logs far larger than
+memory can be replayed or aggregated in one pass.
+"""
+
+import struct
+import time
+from collections import namedtuple
+
+from alphabet import LETTERS, letter_bit, letter_key
+
+RECORD = struct.Struct("<BBBBIIQ")
+
+START, GUESS, END = 1, 2, 3
+MISS, HIT, INVALID = 0, 1, 2
+
+Event = namedtuple("Event", "kind letter result wrong game_id word_id time_ns")
+
+
+def letter_code(letter):
+    """Return the one-byte code of a guessed letter (its key, see alphabet)."""
+    key = letter_key(letter)
+    if key is None:
+        return ord(letter[0]) & 0xFF if letter else 0
+    if key.isascii():
+        return ord(key)
+    return 128 + letter_bit(key)
+
+
+def code_letter(code):
+    """Return the letter stored as code by letter_code()."""
+    return chr(code) if code < 128 else LETTERS[code - 128]
+
+
+class EventLog:
+    """Buffered, append-only writer for game events."""
+
+    def __init__(self, path, buffer_size=1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._file = open(path, "ab")
+        self._words_file = open(f"{path}.words", "a", encoding="utf-8")
+        self._word_ids = {}
+        self._next_game_id = 0
+        # Continue numbering where an existing log left off.
+        for word_id, word in enumerate(read_words(path)):
+            self._word_ids[word] = word_id
+        last_game_id = _last_game_id(path)
+        if last_game_id is not None:
+            self._next_game_id = last_game_id + 1
+
+    def _word_id(self, word):
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = self._word_ids[word] = len(self._word_ids)
+            self._words_file.write(word + "\n")
+        return word_id
+
+    def _append(self, kind, letter, result, wrong, game_id, word_id):
+        self._buffer += RECORD.pack(
+            kind, letter, result, wrong, game_id, word_id, time.time_ns()
+        )
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def game_started(self, game):
+        """Record a new game and return its game id."""
+        game_id = self._next_game_id
+        self._next_game_id += 1
+        word_id = self._word_id(game.word.get_word())
+        self._append(START, 0, 0, 0, game_id, word_id)
+        return game_id
+
+    def guess_made(self, game, letter, is_correct):
+        """
+        Record one make_guess() call, and the game's end if it ended there.
+        HangmanGame only calls this while the game is still in progress.
+        """
+        game_id, word_id = game.log_id, self._word_ids[game.word.get_word()]
+        if is_correct is None:
+            result = INVALID
+        else:
+            result = HIT if is_correct else MISS
+        self._append(
+            GUESS, letter_code(letter), result, game.wrong_guesses, game_id, word_id
+        )
+        if game.game_over:
+            self.game_ended(game)
+
+    def game_ended(self, game):
+        """Record the end of a game, e.g. one lost on time."""
+        word_id = self._word_ids[game.word.get_word()]
+        self._append(END, int(game.won), 0, game.wrong_guesses, game.log_id, word_id)
+
+    def flush(self):
+        """Write buffered records to disk."""
+        self._words_file.flush()
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the log files."""
+        self.flush()
+        self._file.close()
+        self._words_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _last_game_id(path, chunk_records=4096):
+    """Return the id of the last game started in a log, scanning backwards."""
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with handle:
+        end = handle.seek(0, 2)
+        end -= end % RECORD.size
+        while end > 0:
+            start = max(0, end - RECORD.size * chunk_records)
+            handle.seek(start)
+            records = list(RECORD.iter_unpack(handle.read(end - start)))
+            for record in reversed(records):
+                if record[0] == START:
+                    return record[4]
+            end = start
+    return None
+
+
+def read_words(path):
+    """Return the word table of a log as a list."""
+    try:
+        with open(f"{path}.words", encoding="utf-8") as handle:
+            return [line.rstrip("\n") for line in handle]
+    except FileNotFoundError:
+        return []
+
+
+def iter_records(path, chunk_records=65536):
+    """Yield raw record tuples from a log, reading it in large chunks."""
+    chunk_size = RECORD.size * chunk_records
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            usable = len(chunk) - len(chunk) % RECORD.size
+            yield from RECORD.iter_unpack(chunk[:usable])
+            if usable < len(chunk):
+                break  # a torn final record from an interrupted write
+
+
+def iter_events(path):
+    """Yield every record of a log as an Event."""
+    for record in iter_records(path):
+        yield Event._make(record)
+
+
+def iter_games(path):
+    """
+    Yield (word, events) for each finished game in a log. Games that were
+    never finished are skipped.
+    """
+    words = read_words(path)
+    open_games = {}
+    for event in iter_events(path):
+        if event.kind == START:
+            open_games[event.game_id] = [event]
+        elif event.game_id in open_games:
+            open_games[event.game_id].append(event)
+            if event.kind == END:
+                events = open_games.pop(event.game_id)
+                yield words[event.word_id], events
+
+
+def replay(word, events):
+    """Yield the game state after each guess of one recorded game."""
+    from hangman import HangmanGame, Player, Word
+
+    game = HangmanGame(Player("Replay"))
+    game.word = Word(word)
+    for event in events:
+        if event.kind == GUESS and event.result != INVALID:
+            game.make_guess(code_letter(event.letter))
+            yield game.get_game_state()
+
+
+def aggregate(path):
+    """Return summary statistics for every finished game in a log."""
+    games = wins = guesses = wrong_total = 0
+    hits = misses = 0
+    for kind, letter, result, wrong, _, _, _ in iter_records(path):
+        if kind == GUESS:
+            guesses += 1
+            if result == HIT:
+                hits += 1
+            elif result == MISS:
+                misses += 1
+        elif kind == END:
+            games += 1
+            wins += letter
+            wrong_total += wrong
+    return {
+        "games": games,
+        "wins": wins,
+        "win_rate": wins / games * 100 if games else 0.0,
+        "guesses": guesses,
+        "hits": hits,
+        "misses": misses,
+        "average_wrong_guesses": wrong_total / games if games else 0.0,
+    }
@@ -0,0 +1,227 @@
+"""
+Hangman Game - Multiplayer Rooms
+Many players guess the same word; every change is broadcast as a delta.
+
+A Room holds one shared Word. Each guess is applied once, for the whole
+room, and the change is sent to every subscriber as one short text line,
+encoded once and handed to all subscribers as the same bytes object:
+
+    EVT <room> <version> GUESS <player> <letter> <hit|miss> <positions> <wrong> <status>
+    EVT <room> <version> WORD <length> <pattern>
+
+positions are the comma-separated indices the guess revealed ("-" for a
+miss), each followed by ":<char>" where the word shows an accented form of
+the guessed letter, and status is playing, won or lost. A WORD event starts
+a new word or phrase; its pattern is Word.get_pattern() with nothing guessed
+yet. Subscribers start from snapshot() and apply deltas in
+version order; RoomView does this for clients and spectators.
+
+Modes:
+    coop    everyone shares the result; a win scores for every player
+    versus  hits score 10 points per revealed letter for the guesser, and
+            the player who completes the word wins it
+"""
+
+from alphabet import LETTER_KEYS, letter_key
+from hangman import HangmanGame, Player, Word, WordBank
+
+MODES = ("coop", "versus")
+POINTS_PER_LETTER = 10
+
+
+class Room:
+    """A shared-word game for many players and spectators."""
+
+    def __init__(self, room_id, mode="coop", selector=None):
+        if mode not in MODES:
+            raise ValueError(f"unknown mode '{mode}', use one of {MODES}")
+        self.room_id = room_id
+        self.mode = mode
+        self.selector = selector
+        self.max_wrong = HangmanGame.MAX_WRONG_GUESSES
+        self.players = {}
+        self.subscribers = {}
+        self._next_token = 0
+        self.version = 0
+        self.word = None
+        self.wrong_guesses = 0
+        self.game_over = False
+        self.won = False
+        self.start_new_word()
+
+    def status(self):
+        """Return playing, won or lost."""
+        if self.won:
+            return "won"
+        return "lost" if self.game_over else "playing"
+
+    def start_new_word(self, word=None):
+        """Start a new shared word and tell every subscriber."""
+        if word is None:
+            if self.selector is not None:
+                word = self.selector.next_word()
+            else:
+                word = WordBank.get_random_word()
+        self.word = Word(word)
+        self.wrong_guesses = 0
+        self.game_over = False
+        self.won = False
+        self.version += 1
+        self._broadcast(
+            f"EVT {self.room_id} {self.version} WORD {len(self.word.word)} "
+            f"{self.word.get_pattern()}"
+        )
+
+    def join(self, player):
+        """Add a Player (or a name) to the room and return the Player."""
+        if isinstance(player, str):
+            player = self.players.get(player) or Player(player)
+        self.players[player.name] = player
+        return player
+
+    def leave(self, name):
+        """Remove a player from the room."""
+        self.players.pop(name, None)
+
+    def subscribe(self, send):
+        """
+        Call send(bytes) with every future delta line (newline included).
+        Returns a token for unsubscribe().
+        """
+        token = self._next_token
+        self._next_token += 1
+        self.subscribers[token] = send
+        return token
+
+    def unsubscribe(self, token):
+        """Stop sending deltas to a subscriber."""
+        self.subscribers.pop(token, None)
+
+    def is_empty(self):
+        """Return True if nobody is playing or watching."""
+        return not self.players and not self.subscribers
+
+    def _broadcast(self, line):
+        data = line.encode("utf-8") + b"\n"
+        # A subscriber may unsubscribe itself while being sent to.
+        for send in list(self.subscribers.values()):
+            send(data)
+
+    def guess(self, name, letter):
+        """
+        Apply one player's guess to the shared word and broadcast it.
+        Returns a tuple: (is_correct, message), like HangmanGame.make_guess().
+        """
+        player = self.players.get(name)
+        if player is None:
+            return None, f"'{name}' has not joined room {self.room_id}."
+        if self.game_over:
+            return None, "This word is finished; wait for the next one."
+        letter = LETTER_KEYS.get(letter) or letter_key(letter)
+        if letter is None:
+            return None, "Please enter a single letter."
+
+        if letter in self.word.guessed_letters:
+            return None, f"'{letter}' was already guessed. Try a different letter."
+
+        is_correct = self.word.guess_letter(letter)
+        if is_correct:
+            hits = self.word.positions[letter]
+            if self.mode == "versus":
+                player.add_score(POINTS_PER_LETTER * len(hits))
+            if self.word.is_solved():
+                self.won = self.game_over = True
+                self._finish(winner=player)
+                message = f"Correct! {name} solved it!"
+            else:
+                message = f"Good guess! '{letter}' is in the word."
+            word = self.word.word
+            positions = ",".join(
+                str(index) if word[index] == letter else f"{index}:{word[index]}"
+                for index in hits
+            )
+        else:
+            self.wrong_guesses += 1
+            if self.wrong_guesses >= self.max_wrong:
+                self.game_over = True
+                self._finish(winner=None)
+                message = f"Wrong! The word was: {self.word.get_word()}"
+            else:
+                message = f"Sorry, '{letter}' is not in the word."
+            positions = "-"
+
+        self.version += 1
+        self._broadcast(
+            f"EVT {self.room_id} {self.version} GUESS {name} {letter} "
+            f"{'hit' if is_correct else 'miss'} {positions} "
+            f"{self.wrong_guesses} {self.status()}"
+        )
+        return is_correct, message
+
+    def _finish(self, winner):
+        """Record the finished word for everyone in the room."""
+        points = (self.max_wrong - self.wrong_guesses) * 10
+        for player in self.players.values():
+            if winner is not None and (self.mode == "coop" or player is winner):
+                player.add_win()
+                if self.mode == "coop":
+                    player.add_score(points)
+            else:
+                player.add_loss()
+            player.save()
+
+    def snapshot(self):
+        """
+        Return the full state line a new subscriber starts from:
+        "<version> <pattern> <wrong>/<max> <status> <guessed>".
+        """
+        guessed = "".join(self.word.get_guessed_letters()) or "-"
+        pattern = self.word.get_pattern()
+        return (
+            f"{self.version} {pattern} {self.wrong_guesses}/{self.max_wrong} "
+            f"{self.status()} {guessed}"
+        )
+
+
+class RoomView:
+    """A subscriber's copy of a room, kept current from delta lines."""
+
+    def __init__(self, snapshot):
+        version, pattern, wrong, status, guessed = snapshot.split()
+        self.version = int(version)
+        self.pattern = list(pattern)
+        self.wrong_guesses = int(wrong.split("/")[0])
+        self.status = status
+        self.guessed = set() if guessed == "-" else set(guessed)
+
+    def apply(self, line):
+        """Apply one EVT line; returns False if it was out of order."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        parts = line.split()
+        version = int(parts[2])
+        if version != self.version + 1:
+            return False
+        self.version = version
+        if parts[3] == "WORD":
+            if len(parts) > 5:
+                self.pattern = list(parts[5])
+            else:
+                self.pattern = ["_"] * int(parts[4])
+            self.wrong_guesses = 0
+            self.status = "playing"
+            self.guessed = set()
+            return True
+        _, letter, _, positions, wrong, status = parts[4:]
+        self.guessed.add(letter)
+        if positions != "-":
+            for position in positions.split(","):
+                index, _, char = position.partition(":")
+                self.pattern[int(index)] = char or letter
+        self.wrong_guesses = int(wrong)
+        self.status = status
+        return True
+
+    def get_pattern(self):
+        """Return the revealed word like Word.get_pattern()."""
+        return "".join(self.pattern)
@@ -0,0 +1,134 @@
+"""
+Hangman Game - Word Selection
+Seedable, reproducible word selection with an optional no-repeat mode.
+
+Each WordSelector owns its own random.Random, so games, players or worker
+processes can each get an independent, reproducible stream of words from an
+explicit seed.
+
+In no-repeat mode the selector walks a random permutation of the word index
+that is shuffled lazily: each draw performs one step of a Fisher-Yates
+shuffle, remembering only the positions it has swapped. No word comes up
+twice until every word has been drawn, each draw is O(1), and nothing
+proportional to the dictionary size is allocated up front.
+"""
+
+import random
+from array import array
+
+from hangman import WordBank
+
+
+class WordSelector:
+    """Draws words for games from the WordBank or any word list."""
+
+    def __init__(
+        self,
+        seed=None,
+        no_repeat=True,
+        words=None,
+        length=None,
+        predicate=None,
+        ids=None,
+    ):
+        """
+        seed: any value accepted by random.Random; None seeds from the OS.
+        words: a list of words or an MmapWordBank; defaults to the bank's
+            word file if one is open, otherwise WordBank.WORD_LIST.
+        length / predicate: only draw words of that length, or for which
+            predicate(word) is true.
+        ids: only draw the words with these ids, e.g. one difficulty tier.
+        """
+        self.rng = random.Random(seed)
+        self.no_repeat = no_repeat
+        if words is None:
+            words = WordBank.word_file
+            if words is None:
+                words = WordBank.WORD_LIST
+        if ids is not None:
+            self._get = getattr(words, "get_word", None) or words.__getitem__
+            self._ids, self.size = ids, len(ids)
+        else:
+            self._get, self._ids, self.size = self._build_index(
+                words, length, predicate
+            )
+        self._swapped = {}
+        self._cursor = 0
+        self._last = None
+
+    @staticmethod
+    def _build_index(words, length, predicate):
+        """Return (get_word(i), ids or None, number of selectable words)."""
+        if hasattr(words, "get_word"):
+            get = words.get_word
+            if predicate is None and length is not None:
+                start, count = words.length_range(length)
+                ids = _BucketIds(words, start)
+                return get, ids, count
+            total = len(words)
+        else:
+            get = words.__getitem__
+            total = len(words)
+
+        if length is None and predicate is None:
+            return get, None, total
+
+        # Filtered selections keep a compact array of matching word ids.
+        ids = array("L")
+        for word_id in range(total):
+            word = get(word_id)
+            if length is not None and len(word) != length:
+                continue
+            if predicate is not None and not predicate(word):
+                continue
+            ids.append(word_id)
+        return get, ids, len(ids)
+
+    def _word_id(self, index):
+        return index if self._ids is None else self._ids[index]
+
+    def _next_index(self):
+        if not self.no_repeat:
+            return self.rng.randrange(self.size)
+
+        if self._cursor >= self.size:
+            # Every word has been drawn once; start a fresh permutation.
+            self._swapped.clear()
+            self._cursor = 0
+
+        cursor = self._cursor
+        pick = self.rng.randrange(cursor, self.size)
+        swapped = self._swapped
+        value = swapped.get(pick, pick)
+        if value == self._last and self.size > 1 and cursor == 0:
+            # Don't let a new round start with the word that ended the last.
+            pick = self.rng.randrange(1, self.size)
+            value = swapped.get(pick, pick)
+        if pick != cursor:
+            swapped[pick] = swapped.pop(cursor, cursor)
+        else:
+            swapped.pop(cursor, None)
+        self._cursor = cursor + 1
+        self._last = value
+        return value
+
+    def next_word(self):
+        """Return the next word, uppercased like WordBank.get_random_word()."""
+        if not self.size:
+            raise ValueError("no words match this selector")
+        return self._get(self._word_id(self._next_index())).upper()
+
+    def remaining(self):
+        """Return how many words are left before the current round repeats."""
+        return self.size - self._cursor if self.no_repeat else self.size
+
+
+class _BucketIds:
+    """Word ids of one length bucket in an MmapWordBank, read on demand."""
+
+    def __init__(self, bank, start):
+        self.bank = bank
+        self.start = start
+
+    def __getitem__(self, index):
+        return self.bank.length_bucket_id(self.start + index)
@@ -0,0 +1,492 @@
+"""
+Hangman Game - Game Server
+Hosts many concurrent HangmanGame sessions in one asyncio process.
+
+Clients speak a line-based text protocol over TCP or a Unix socket. Each
+request is one line; each reply is one line starting with OK or ERR.
+
+    NEW [name]              start a session      -> OK <sid> <state>
+    GUESS <sid> <letter>    guess a letter       -> OK <result> <state>
+    STATE <sid>             current state        -> OK <state>
+    NEXT <sid>              start another word   -> OK <state>
+    STATS <sid>             player statistics    -> OK <score> <played> <won>
+    END <sid>               close the session    -> OK
+    PING                                         -> OK PONG
+    METRICS                                      -> OK <json>
+
+<state> is "<pattern> <wrong>/<max> <status> <guessed>" where pattern is
+Word.get_pattern(): hidden letters as "_", no spaces, and "/" between the
+words of a phrase. status is playing, won or lost, and guessed is the sorted
+guessed letters (or "-"). <result> is hit, miss or invalid. Sessions idle
+for longer than the idle timeout are evicted. With --guess-time or
+--game-time every session is a timed game and is lost when a clock runs
+out. With --checkpoint PATH the server restores its sessions from PATH on
+start and saves them there on shutdown (Ctrl+C or SIGTERM); see
+checkpoint.py.
+METRICS returns the metrics.REGISTRY snapshot, which is only filled in when
+the server runs with --metrics (or HANGMAN_METRICS=1).
+
+Multiplayer rooms (see rooms.py) share one word between many connections:
+
+    JOIN <room> <name> [mode]      join or create a room -> OK <snapshot>
+    WATCH <room>                   spectate a room       -> OK <snapshot>
+    RGUESS <room> <name> <letter>  guess in a room       -> OK <result>
+    RNEXT <room>                   start the next word   -> OK <snapshot>
+    LEAVE <room>                   stop playing/watching -> OK
+
+JOIN and WATCH subscribe the connection to the room, and every change is
+then pushed to it as an "EVT ..." line, interleaved with replies. Each event
+is encoded once and the same bytes are written to every subscriber; a
+subscriber that falls more than max_backlog bytes behind is disconnected.
+
+A connection plays a room under one name. A JOIN under a second name, or
+under a name another connection is playing as, is refused, and RGUESS only
+accepts the name the connection joined with.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import secrets
+import signal
+import time
+from collections import OrderedDict
+
+from hangman import HangmanGame, Player, WordBank
+from rooms import Room
+
+SESSION_COMMANDS = ("GUESS", "STATE", "NEXT", "STATS", "END")
+ROOM_COMMANDS = ("JOIN", "WATCH", "RGUESS", "RNEXT", "LEAVE")
+
+
+class Session:
+    """One player's game hosted by the server."""
+
+    def __init__(
+        self,
+        session_id,
+        name,
+        guess_time=None,
+        game_time=None,
+        timers=None,
+        game=None,
+    ):
+        """game: a game in progress to host, e.g. one restored from a checkpoint."""
+        self.session_id = session_id
+        if game is None:
+            game = HangmanGame(
+                Player(name), guess_time=guess_time, game_time=game_time, timers=timers
+            )
+            game.start_new_game()
+        self.game = game
+        self.last_seen = time.monotonic()
+
+    def close(self):
+        """Stop the game's clocks, so a dropped session can never time out."""
+        if self.game.timer is not None:
+            self.game.timer.stop()
+
+    def state_line(self):
+        """Return the <state> part of a reply."""
+        game = self.game
+        if game.won:
+            status = "won"
+        elif game.game_over:
+            status = "lost"
+        else:
+            status = "playing"
+        guessed = "".join(game.word.get_guessed_letters()) or "-"
+        pattern = game.word.get_pattern()
+        return (
+            f"{pattern} {game.wrong_guesses}/{game.MAX_WRONG_GUESSES} "
+            f"{status} {guessed}"
+        )
+
+
+class Connection:
+    """One client connection, as a subscriber to rooms."""
+
+    def __init__(self, writer, max_backlog):
+        self.writer = writer
+        self.max_backlog = max_backlog
+        # room id -> (subscription token, player name or None)
+        self.rooms = {}
+
+    def send(self, data):
+        """Queue a pushed event without waiting for the socket."""
+        transport = self.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > self.max_backlog:
+            transport.abort()  # too slow to keep up; serve_client cleans up
+            return
+        self.writer.write(data)
+
+
+class GameServer:
+    """Session registry and protocol handler."""
+
+    def __init__(
+        self,
+        idle_timeout=300.0,
+        sweep_interval=5.0,
+        max_backlog=1 << 20,
+        guess_time=None,
+        game_time=None,
+    ):
+        """
+        guess_time / game_time: play every session as a timed game, with
+        one timer wheel for all of them.
+        """
+        # Kept in least-recently-used order so eviction stops at the first
+        # session that is still fresh.
+        self.sessions = OrderedDict()
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.guesses = 0
+        self.evicted = 0
+        self.rooms = {}
+        self.max_backlog = max_backlog
+        self.guess_time = guess_time
+        self.game_time = game_time
+        self.timers = None
+        if guess_time or game_time:
+            from timers import TimerWheel
+
+            self.timers = TimerWheel()
+        # Background tasks created by start().
+        self._sweeper = None
+        self._ticker = None
+
+    def new_session(self, name):
+        """Create a session and return it."""
+        session_id = secrets.token_hex(8)
+        while session_id in self.sessions:
+            session_id = secrets.token_hex(8)
+        session = Session(
+            session_id, name, self.guess_time, self.game_time, self.timers
+        )
+        self.sessions[session_id] = session
+        return session
+
+    def dump_sessions(self):
+        """Return every session as one checkpoint (see checkpoint.py)."""
+        from checkpoint import dump_games
+
+        return dump_games(
+            (session.game for session in self.sessions.values()), keys=self.sessions
+        )
+
+    def restore_sessions(self, data):
+        """Host the sessions of a dump_sessions() checkpoint; returns how many."""
+        from checkpoint import load_games
+
+        restored = load_games(data, timers=self.timers)
+        for session_id, game in restored:
+            self.end_session(session_id)
+            self.sessions[session_id] = Session(session_id, None, game=game)
+        return len(restored)
+
+    def end_session(self, session_id):
+        """Drop a session and stop its clocks; returns it, or None."""
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+        return session
+
+    def close_sessions(self):
+        """Drop every session and stop their clocks, e.g. on shutdown."""
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+
+    def evict_idle(self, now=None):
+        """Drop sessions idle for longer than idle_timeout."""
+        cutoff = (now if now is not None else time.monotonic()) - self.idle_timeout
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if session.last_seen >= cutoff:
+                break
+            self.end_session(session.session_id)
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    async def sweep(self):
+        """Periodically evict idle sessions."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.evict_idle()
+
+    def handle(self, line, connection=None):
+        """
+        Process one request line and return the reply line. connection is
+        the Connection that room events are pushed to, if any.
+        """
+        parts = line.split()
+        if not parts:
+            return "ERR empty request"
+        command = parts[0].upper()
+        if command in ROOM_COMMANDS:
+            return self.handle_room(command, parts, connection)
+
+        if command == "PING":
+            return "OK PONG"
+        if command == "METRICS":
+            import metrics
+
+            return f"OK {metrics.REGISTRY.to_json()}"
+        if command == "NEW":
+            name = " ".join(parts[1:]) or "Player"
+            session = self.new_session(name)
+            return f"OK {session.session_id} {session.state_line()}"
+
+        if command not in SESSION_COMMANDS:
+            return f"ERR unknown command {command}"
+        if len(parts) < 2:
+            return f"ERR {command} needs a session id"
+        session = self.sessions.get(parts[1])
+        if session is None:
+            return "ERR unknown session"
+        session.last_seen = time.monotonic()
+        self.sessions.move_to_end(session.session_id)
+
+        if command == "GUESS":
+            if len(parts) != 3:
+                return "ERR GUESS needs a letter"
+            if session.game.game_over:
+                return "ERR game over, send NEXT"
+            is_correct, _ = session.game.make_guess(parts[2])
+            self.guesses += 1
+            if is_correct is None:
+                result = "invalid"
+            else:
+                result = "hit" if is_correct else "miss"
+            return f"OK {result} {session.state_line()}"
+        if command == "STATE":
+            return f"OK {session.state_line()}"
+        if command == "NEXT":
+            session.game.start_new_game()
+            return f"OK {session.state_line()}"
+        if command == "STATS":
+            player = session.game.player
+            return f"OK {player.score} {player.games_played} {player.games_won}"
+        if command == "END":
+            self.end_session(session.session_id)
+            return "OK"
+
+    def handle_room(self, command, parts, connection):
+        """Process one room command; see the module docstring."""
+        if len(parts) < 2:
+            return f"ERR {command} needs a room"
+        room_id = parts[1]
+        room = self.rooms.get(room_id)
+
+        if command == "JOIN":
+            if len(parts) < 3:
+                return "ERR JOIN needs a player name"
+            joined = self._joined_name(room_id, connection)
+            if joined is not None and joined != parts[2]:
+                return f"ERR already joined room {room_id} as {joined}"
+            if (
+                connection is not None
+                and joined is None
+                and room is not None
+                and parts[2] in room.players
+            ):
+                return f"ERR {parts[2]} is already playing in room {room_id}"
+            if room is None:
+                mode = parts[3].lower() if len(parts) > 3 else "coop"
+                try:
+                    room = self.rooms[room_id] = Room(room_id, mode)
+                except ValueError as error:
+                    return f"ERR {error}"
+            room.join(parts[2])
+            self._subscribe(room, connection, parts[2])
+            return f"OK {room.snapshot()}"
+
+        if room is None:
+            return "ERR unknown room"
+        if command == "WATCH":
+            self._subscribe(room, connection, None)
+            return f"OK {room.snapshot()}"
+        if command == "RGUESS":
+            if len(parts) != 4:
+                return "ERR RGUESS needs a player and a letter"
+            if connection is not None:
+                joined = self._joined_name(room_id, connection)
+                if joined != parts[2]:
+                    return f"ERR {parts[2]} has not joined room {room_id} here"
+            is_correct, message = room.guess(parts[2], parts[3])
+            if is_correct is None:
+                return f"ERR {message}"
+            self.guesses += 1
+            return f"OK {'hit' if is_correct else 'miss'}"
+        if command == "RNEXT":
+            room.start_new_word()
+            return f"OK {room.snapshot()}"
+        if command == "LEAVE":
+            if connection is not None:
+                self._unsubscribe(room_id, connection)
+            return "OK"
+
+    @staticmethod
+    def _joined_name(room_id, connection):
+        if connection is None or room_id not in connection.rooms:
+            return None
+        return connection.rooms[room_id][1]
+
+    def _subscribe(self, room, connection, name):
+        if connection is None:
+            return
+        if room.room_id in connection.rooms:
+            token, joined = connection.rooms[room.room_id]
+            connection.rooms[room.room_id] = (token, name or joined)
+            return
+        token = room.subscribe(connection.send)
+        connection.rooms[room.room_id] = (token, name)
+
+    def _unsubscribe(self, room_id, connection):
+        token, name = connection.rooms.pop(room_id, (None, None))
+        room = self.rooms.get(room_id)
+        if room is None or token is None:
+            return
+        room.unsubscribe(token)
+        if name is not None:
+            room.leave(name)
+        if room.is_empty():
+            del self.rooms[room_id]
+
+    async def serve_client(self, reader, writer):
+        """Answer requests from one connection until it closes."""
+        connection = Connection(writer, self.max_backlog)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = self.handle(line.decode("utf-8", "replace"), connection)
+                writer.write(reply.encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for room_id in list(connection.rooms):
+                self._unsubscribe(room_id, connection)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=7777, unix_path=None):
+        """Start listening and return the asyncio server."""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.serve_client, unix_path)
+        else:
+            server = await asyncio.start_server(self.serve_client, host, port)
+        self._sweeper = asyncio.ensure_future(self.sweep())
+        if self.timers is not None:
+            self._ticker = asyncio.ensure_future(self.timers.run_async())
+        return server
+
+
+async def serve(
+    host,
+    port,
+    unix_path,
+    idle_timeout,
+    guess_time=None,
+    game_time=None,
+    checkpoint=None,
+):
+    """
+    Run the game server until interrupted. With a checkpoint path, sessions
+    are restored from it on start and written back to it on shutdown
+    (Ctrl+C or SIGTERM), so a restarted worker picks up every live game.
+    """
+    game_server = GameServer(
+        idle_timeout=idle_timeout, guess_time=guess_time, game_time=game_time
+    )
+    if checkpoint and os.path.exists(checkpoint):
+        from checkpoint import read_checkpoint
+
+        count = game_server.restore_sessions(read_checkpoint(checkpoint))
+        print(f"Restored {count:,} sessions from {checkpoint}")
+    server = await game_server.start(host, port, unix_path)
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel
+        )
+    where = unix_path or f"{host}:{port}"
+    print(f"Hangman server listening on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        try:
+            if checkpoint:
+                from checkpoint import write_checkpoint
+
+                write_checkpoint(checkpoint, game_server.dump_sessions())
+                print(f"Saved {len(game_server.sessions):,} sessions to {checkpoint}")
+        finally:
+            game_server.close_sessions()
+
+
+def main():
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(description="Hangman game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead")
+    parser.add_argument("--idle-timeout", type=float, default=300.0)
+    parser.add_argument("--guess-time", type=float, help="seconds per guess")
+    parser.add_argument("--game-time", type=float, help="seconds per game")
+    parser.add_argument("--words", help="serve words from this word list file")
+    parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=2.0,
+        help="seconds between checks for a changed --words file (0 disables)",
+    )
+    parser.add_argument(
+        "--metrics", action="store_true", help="collect per-operation metrics"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="restore sessions from this file on start and save them on exit",
+    )
+    args = parser.parse_args()
+
+    if args.words:
+        snapshot = WordBank.reload(args.words)
+        print(f"Loaded {len(snapshot.words):,} words from {args.words}")
+        if args.reload_interval > 0:
+            WordBank.watch(args.words, args.reload_interval)
+
+    environ = dict(os.environ)
+    if args.metrics:
+        environ["HANGMAN_METRICS"] = "1"
+    if environ.get("HANGMAN_METRICS") or environ.get("HANGMAN_PROFILE"):
+        import metrics
+
+        # Also honours HANGMAN_METRICS_OUTPUT, written when the server exits.
+        metrics.configure_from_env(HangmanGame, GameServer, environ=environ)
+
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.unix,
+                args.idle_timeout,
+                args.guess_time,
+                args.game_time,
+                args.checkpoint,
+            )
+        )
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Hangman Game - Headless Simulation
+Plays large numbers of games without any UI and reports aggregate statistics.
+
+Games follow the same rules and scoring as HangmanGame.make_guess(), but skip
+the message strings and per-guess objects, and are sharded across a process
+pool with a deterministic seed per shard.
+"""
+
+import random
+import time
+
+from alphabet import LETTER_KEYS, letter_key, upper
+from hangman import HangmanGame, WordBank
+
+COMMON_LETTERS = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+
+class FrequencyStrategy:
+    """Guess letters in a fixed order, most common English letters first."""
+
+    def __init__(self, order=COMMON_LETTERS):
+        self.order = order.upper()
+
+    def __call__(self, pattern, guessed):
+        for letter in self.order:
+            if letter not in guessed:
+                return letter
+        return None
+
+
+class RandomStrategy:
+    """Guess unguessed letters in a random order."""
+
+    def __init__(self):
+        self.rng = random.Random()
+
+    def reset(self, rng):
+        """Take the shard's RNG so runs are reproducible."""
+        self.rng = rng
+
+    def __call__(self, pattern, guessed):
+        choices = [letter for letter in COMMON_LETTERS if letter not in guessed]
+        return self.rng.choice(choices) if choices else None
+
+
+class SimulationStats:
+    """Aggregate results of many simulated games."""
+
+    def __init__(self, max_wrong=HangmanGame.MAX_WRONG_GUESSES):
+        self.games = 0
+        self.wins = 0
+        self.score = 0
+        self.guesses = 0
+        self.wrong_histogram = [0] * (max_wrong + 1)
+        self.elapsed = 0.0
+
+    def record(self, won, wrong, guesses, points):
+        """Add one finished game."""
+        self.games += 1
+        self.wins += won
+        self.score += points
+        self.guesses += guesses
+        self.wrong_histogram[wrong] += 1
+
+    def merge(self, other):
+        """Fold another SimulationStats into this one."""
+        self.games += other.games
+        self.wins += other.wins
+        self.score += other.score
+        self.guesses += other.guesses
+        for wrong, count in enumerate(other.wrong_histogram):
+            self.wrong_histogram[wrong] += count
+        return self
+
+    def as_dict(self):
+        """Return the statistics as a plain dict."""
+        games = self.games or 1
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "losses": self.games - self.wins,
+            "win_rate": self.wins / games * 100,
+            "total_score": self.score,
+            "average_score": self.score / games,
+            "average_guesses": self.guesses / games,
+            "wrong_histogram": list(self.wrong_histogram),
+            "elapsed": self.elapsed,
+            "games_per_second": self.games / self.elapsed if self.elapsed else 0.0,
+        }
+
+
+def play_game(word, strategy, max_wrong=HangmanGame.MAX_WRONG_GUESSES):
+    """
+    Play one game of word with strategy and return (won, wrong, guesses).
+
+    strategy is called as strategy(pattern, guessed) where pattern is the
+    board as Word.get_pattern() shows it ("_" for hidden letters, no spaces,
+    "/" between the words of a phrase) and guessed is the set of letters
+    tried so far. It returns the next letter, or None to give up. Repeating
+    a letter, or guessing something that is not a letter, is an error, since
+    it would never end the game.
+    """
+    # Letters are hidden and matched by their key, exactly as in Word;
+    # spaces and punctuation are shown from the start.
+    word = " ".join(upper(word).split())
+    keys = LETTER_KEYS
+    positions = {}
+    pattern = []
+    for index, char in enumerate(word):
+        key = keys.get(char) or letter_key(char)
+        if key is None:
+            pattern.append("/" if char == " " else char)
+        else:
+            pattern.append("_")
+            positions.setdefault(key, []).append(index)
+
+    guessed = set()
+    hidden = len(positions)
+    wrong = 0
+
+    while hidden and wrong < max_wrong:
+        letter = strategy("".join(pattern), guessed)
+        if letter is None:
+            break
+        key = keys.get(letter) or letter_key(letter)
+        if key is None:
+            raise ValueError(f"strategy guessed '{letter}', which is not a letter")
+        if key in guessed:
+            raise ValueError(f"strategy repeated the letter '{key}'")
+        guessed.add(key)
+
+        hits = positions.get(key)
+        if hits:
+            for index in hits:
+                pattern[index] = word[index]
+            hidden -= 1
+        else:
+            wrong += 1
+
+    return not hidden, wrong, len(guessed)
+
+
+def _shard_rng(seed, shard):
+    return random.Random(f"{seed}-{shard}")
+
+
+def run_shard(
+    strategy, words, games, seed, shard, max_wrong=HangmanGame.MAX_WRONG_GUESSES
+):
+    """Play games on one worker and return its SimulationStats."""
+    rng = _shard_rng(seed, shard)
+    reset = getattr(strategy, "reset", None)
+    if reset is not None:
+        reset(rng)
+
+    stats = SimulationStats(max_wrong)
+    choice = rng.choice
+    for _ in range(games):
+        won, wrong, guesses = play_game(choice(words), strategy, max_wrong)
+        points = (max_wrong - wrong) * 10 if won else 0
+        stats.record(won, wrong, guesses, points)
+    return stats
+
+
+def simulate(
+    strategy,
+    words=None,
+    games=10000,
+    workers=None,
+    seed=0,
+    max_wrong=HangmanGame.MAX_WRONG_GUESSES,
+):
+    """
+    Simulate games and return the merged SimulationStats.
+
+    strategy must be picklable (a module-level function or class instance)
+    when more than one worker is used. words defaults to WordBank.WORD_LIST.
+    workers=1 runs everything in the current process. The same seed always
+    produces the same results for the same number of workers.
+    """
+    words = list(words) if words is not None else list(WordBank.WORD_LIST)
+    if not words:
+        raise ValueError("simulate() needs at least one word")
+
+    started = time.perf_counter()
+    workers = workers or 1
+    shard_games = [games // workers] * workers
+    for shard in range(games % workers):
+        shard_games[shard] += 1
+
+    total = SimulationStats(max_wrong)
+    if workers == 1:
+        total.merge(run_shard(strategy, words, games, seed, 0, max_wrong))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(run_shard, strategy, words, count, seed, shard, max_wrong)
+                for shard, count in enumerate(shard_games)
+                if count
+            ]
+            for future in futures:
+                total.merge(future.result())
+
+    total.elapsed = time.perf_counter() - started
+    return total
+
+
+def _solver_strategy():
+    from solver import Solver
+
+    return Solver(WordBank.WORD_LIST)
+
+
+STRATEGIES = {
+    "frequency": FrequencyStrategy,
+    "random": RandomStrategy,
+    "solver": _solver_strategy,
+}
+
+
+def main():
+    """Run a simulation from the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless Hangman simulation")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    args = parser.parse_args()
+
+    stats = simulate(
+        STRATEGIES[args.strategy](),
+        games=args.games,
+        workers=args.workers,
+        seed=args.seed,
+    ).as_dict()
+
+    print(f"Games:         {stats['games']}")
+    print(f"Win rate:      {stats['win_rate']:.1f}%")
+    print(f"Average score: {stats['average_score']:.2f}")
+    print(f"Wrong guesses: {stats['wrong_histogram']}")
+    print(f"Throughput:    {stats['games_per_second']:.0f} games/sec")
+
+
+if __name__ == "__main__":
+    main()
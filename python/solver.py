@@ -0,0 +1,171 @@
+"""
+Hangman Game - Automated Solver
+Picks the next guess from the revealed pattern and the letters tried so far.
+
+Words are indexed once by length. Each length bucket keeps, for every letter,
+a bitset of the words containing it and a bitset per position of the words
+with that letter there. Narrowing the dictionary to the words that still fit
+the board is then a few bitwise ANDs, and the best guess is the unguessed
+letter that appears in the most remaining candidates. Decisions are memoized
+by (length, pattern, excluded letters), so repeated positions are free.
+
+Words and patterns are read like Word reads them: letters by their key (see
+alphabet.py), so "É" on the board matches an E, and spaces and punctuation
+as fixed characters, with "/" standing for a space as in Word.get_pattern().
+"""
+
+from alphabet import LETTER_KEYS, letter_key, upper
+from batch import iter_bits, popcount
+from simulation import COMMON_LETTERS
+
+_FREQUENCY_RANK = {letter: rank for rank, letter in enumerate(COMMON_LETTERS)}
+
+
+def _pattern_form(word):
+    """Return word as Word.get_pattern() shows it solved: "TO BE" -> "TO/BE"."""
+    return " ".join(upper(word).split()).replace(" ", "/")
+
+
+def _key(char):
+    # A letter's key, or the character itself for spaces and punctuation.
+    return LETTER_KEYS.get(char) or letter_key(char) or char
+
+
+class _LengthIndex:
+    """Bitset index over all dictionary words of one length."""
+
+    def __init__(self, words):
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        size = (len(words) + 7) // 8
+        length = len(words[0])
+
+        # Planes per character first, then fold characters onto their
+        # letter keys; spaces and punctuation stay as they are.
+        at = [{} for _ in range(length)]
+        for row, word in enumerate(words):
+            byte, bit = row >> 3, 1 << (row & 7)
+            for position, char in enumerate(word):
+                column = at[position]
+                plane = column.get(char)
+                if plane is None:
+                    plane = column[char] = bytearray(size)
+                plane[byte] |= bit
+
+        self.contains = {}
+        self.at = []
+        for column in at:
+            folded = {}
+            for char, plane in column.items():
+                bits = int.from_bytes(plane, "little")
+                letter = LETTER_KEYS.get(char) or letter_key(char)
+                key = letter or char
+                folded[key] = folded.get(key, 0) | bits
+                if letter is not None:
+                    self.contains[letter] = self.contains.get(letter, 0) | bits
+            self.at.append(folded)
+
+        # Most common first, so ties go to the more frequent letter.
+        self.letters = sorted(
+            self.contains,
+            key=lambda letter: (
+                _FREQUENCY_RANK.get(letter, len(COMMON_LETTERS)),
+                letter,
+            ),
+        )
+
+
+class Solver:
+    """Frequency-optimal guesser over a fixed dictionary."""
+
+    CACHE_SIZE = 200000
+
+    def __init__(self, words):
+        by_length = {}
+        for word in {_pattern_form(word) for word in words}:
+            by_length.setdefault(len(word), []).append(word)
+        self.index = {
+            length: _LengthIndex(sorted(bucket)) for length, bucket in by_length.items()
+        }
+        self._cache = {}
+
+    @staticmethod
+    def _parse_pattern(pattern):
+        # Accept both Word.get_display() output ("P _ T H O N", "T _   _ _")
+        # and the get_pattern() form ("P_THON", "T_/__"). In a display a gap
+        # between words is its space plus the separators on either side.
+        return pattern.replace("   ", "/").replace(" ", "")
+
+    def candidates(self, pattern, excluded=()):
+        """
+        Return (index, bitset) of dictionary words that fit pattern and
+        contain none of the excluded letters, or (None, 0) if none do.
+        """
+        pattern = self._parse_pattern(pattern)
+        index = self.index.get(len(pattern))
+        if index is None:
+            return None, 0
+
+        bits = index.all
+        keys = [_key(char) for char in pattern]
+        revealed = {key for key in keys if key != "_" and key in index.contains}
+        for letter in excluded:
+            bits &= ~index.contains.get(letter, 0)
+        for position, key in enumerate(keys):
+            column = index.at[position]
+            if key != "_":
+                bits &= column.get(key, 0)
+            else:
+                # A revealed letter is shown everywhere it occurs, so it
+                # cannot also be hiding under an underscore.
+                for shown in revealed:
+                    bits &= ~column.get(shown, 0)
+            if not bits:
+                break
+        return index, bits
+
+    def candidate_words(self, pattern, excluded=()):
+        """Return the dictionary words that still fit the board."""
+        index, bits = self.candidates(pattern, excluded)
+        return [index.words[row].replace("/", " ") for row in iter_bits(bits)]
+
+    def next_guess(self, pattern, guessed):
+        """
+        Return the best next letter for pattern given the set of letters
+        guessed so far, or None if every letter has been tried.
+        """
+        pattern = self._parse_pattern(pattern)
+        shown = {_key(char) for char in pattern}
+        excluded = frozenset(guessed).difference(shown)
+        key = (len(pattern), pattern, excluded)
+        letter = self._cache.get(key)
+        if letter is not None:
+            return letter
+
+        tried = excluded.union(shown)
+        index, bits = self.candidates(pattern, excluded)
+        best, best_count = None, 0
+        if bits:
+            for candidate in index.letters:
+                if candidate not in tried:
+                    count = popcount(bits & index.contains[candidate])
+                    if count > best_count:
+                        best, best_count = candidate, count
+        if best is None:
+            # Word not in the dictionary: fall back to letter frequency.
+            best = next((c for c in COMMON_LETTERS if c not in tried), None)
+            if best is None:
+                return None
+
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = best
+        return best
+
+    def __call__(self, pattern, guessed):
+        """Let a Solver be used directly as a simulation strategy."""
+        return self.next_guess(pattern, guessed)
+
+    def guess_for(self, game):
+        """Return the best next letter for a HangmanGame in progress."""
+        return self.next_guess(game.word.get_pattern(), game.word.guessed_letters)
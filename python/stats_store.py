@@ -0,0 +1,230 @@
+"""
+Hangman Game - Player Statistics Store
+Persists Player stats so they survive restarts.
+
+A store is attached to a Player (Player(name, store=...)); HangmanGame then
+calls store.record(player) whenever a game finishes. record() only queues a
+snapshot of the stats; a background writer thread groups queued snapshots
+into one transaction per batch, so the guess path never waits on disk.
+A row that fails to save is logged and dropped without stopping the writer,
+and whatever is still queued is written when the process exits.
+
+SQLiteStatsStore keeps one row per player in WAL mode with an index on score,
+so leaderboards are read with an indexed ORDER BY ... LIMIT query.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+
+from hangman import Player
+
+log = logging.getLogger(__name__)
+
+
+class StatsStore:
+    """Interface for player statistics persistence."""
+
+    def record(self, player):
+        """Queue the player's current stats to be saved."""
+        raise NotImplementedError
+
+    def load(self, name):
+        """Return the saved stats dict for name, or None."""
+        raise NotImplementedError
+
+    def leaderboard(self, limit=10):
+        """Return the top players' stats dicts, highest score first."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Block until every queued record has been written."""
+
+    def close(self):
+        """Flush and release resources."""
+
+    def load_player(self, name):
+        """Return a Player attached to this store, with saved stats restored."""
+        player = Player(name, store=self)
+        stats = self.load(name)
+        if stats:
+            player.score = stats["score"]
+            player.games_played = stats["games_played"]
+            player.games_won = stats["games_won"]
+        return player
+
+
+def _connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # WAL with synchronous=NORMAL never corrupts the database on a crash;
+    # at worst the last unsynced batch is lost.
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class _StatsWriter(threading.Thread):
+    """Background thread saving queued stats, one transaction per batch."""
+
+    def __init__(self, path, upsert, batch_size, flush_interval):
+        super().__init__(name="stats-writer", daemon=True)
+        self.path = path
+        self.upsert = upsert
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.failed_rows = 0
+
+    def run(self):
+        connection = _connect(self.path)
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    timeout = max(0.0, deadline - time.monotonic())
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                # Only the newest snapshot of each player needs writing.
+                latest = {row[0]: row for row in batch}
+                self._write_rows(connection, list(latest.values()))
+            except Exception:
+                log.exception("could not save a batch of %d stats", len(batch))
+            finally:
+                # Mark the batch done whatever happened, or flush() would hang.
+                for _ in range(len(batch) + stop):
+                    self.queue.task_done()
+            if stop:
+                break
+        connection.close()
+
+    def _write_rows(self, connection, rows):
+        now = time.time()
+        try:
+            with connection:
+                connection.executemany(self.upsert, [row + (now,) for row in rows])
+            return
+        except Exception:
+            if len(rows) == 1:
+                self.failed_rows += 1
+                log.exception("could not save the stats of %r", rows[0][0])
+                return
+        # Retry one row at a time, so one bad row only loses itself.
+        for row in rows:
+            self._write_rows(connection, [row])
+
+
+def _shut_down(writer, reader):
+    if writer.is_alive():
+        writer.queue.put(None)
+        # A store collected on the writer thread itself can't wait for it.
+        if writer is not threading.current_thread():
+            writer.join()
+    reader.close()
+
+
+class SQLiteStatsStore(StatsStore):
+    """StatsStore backed by SQLite with batched background writes."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS players (
+            name TEXT PRIMARY KEY,
+            score INTEGER NOT NULL,
+            games_played INTEGER NOT NULL,
+            games_won INTEGER NOT NULL,
+            updated REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS players_by_score ON players (score DESC);
+    """
+
+    UPSERT = """
+        INSERT INTO players (name, score, games_played, games_won, updated)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            score = excluded.score,
+            games_played = excluded.games_played,
+            games_won = excluded.games_won,
+            updated = excluded.updated
+    """
+
+    def __init__(self, path="hangman_stats.db", batch_size=500, flush_interval=0.2):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._read_lock = threading.Lock()
+        self._reader = _connect(path)
+        self._reader.executescript(self.SCHEMA)
+        self._writer = _StatsWriter(path, self.UPSERT, batch_size, flush_interval)
+        self._queue = self._writer.queue
+        self._writer.start()
+        # Stop the writer, saving whatever is still queued, on close(), when
+        # the store is garbage collected or at exit. The finalizer holds no
+        # reference to the store, so a store nobody closes is still freed.
+        self._finalizer = weakref.finalize(self, _shut_down, self._writer, self._reader)
+
+    @property
+    def failed_rows(self):
+        """Number of stats rows that could not be saved."""
+        return self._writer.failed_rows
+
+    def record(self, player):
+        """Queue the player's current stats to be saved."""
+        self._queue.put(
+            (player.name, player.score, player.games_played, player.games_won)
+        )
+
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending writes and stop the writer thread."""
+        self._finalizer()
+
+    def load(self, name):
+        """Return the saved stats dict for name, or None."""
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT name, score, games_played, games_won FROM players "
+                "WHERE name = ?",
+                (name,),
+            ).fetchone()
+        return self._stats(row) if row else None
+
+    def leaderboard(self, limit=10):
+        """Return the top players' stats dicts, highest score first."""
+        with self._read_lock:
+            rows = self._reader.execute(
+                "SELECT name, score, games_played, games_won FROM players "
+                "ORDER BY score DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [self._stats(row) for row in rows]
+
+    @staticmethod
+    def _stats(row):
+        name, score, games_played, games_won = row
+        win_rate = (games_won / games_played * 100) if games_played > 0 else 0
+        return {
+            "name": name,
+            "score": score,
+            "games_played": games_played,
+            "games_won": games_won,
+            "win_rate": win_rate,
+        }
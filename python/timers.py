@@ -0,0 +1,246 @@
+"""
+Hangman Game - Timers
+A hierarchical timer wheel shared by every timed game, and per-game clocks.
+
+TimerWheel keeps timers in levels of 64 slots each. A timer goes into the
+lowest level whose span covers its deadline; as time advances, a slot of a
+higher level is emptied into the levels below it once its turn comes up.
+Scheduling and cancelling are O(1) and each tick only looks at the slots
+that are due, so tens of thousands of timed games cost the same per tick as
+one, and no thread or asyncio task is created per game.
+
+Whoever owns the wheel advances it: the interactive game does so while it
+waits for input, and the server from one background task.
+
+GameTimer applies a game's limits (seconds per guess and per game) on top
+of a wheel. HangmanGame creates one when given guess_time or game_time.
+"""
+
+import math
+import time
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+
+class Timer:
+    """A scheduled callback; cancel() stops it from firing."""
+
+    __slots__ = ("wheel", "expires", "callback", "args", "cancelled")
+
+    def __init__(self, wheel, expires, callback, args):
+        self.wheel = wheel
+        self.expires = expires
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the timer from firing. Safe to call more than once."""
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel.pending -= 1
+
+
+class TimerWheel:
+    """Hierarchical timer wheel with O(1) schedule, cancel and tick."""
+
+    def __init__(self, tick=0.05, levels=4, clock=time.monotonic):
+        self.tick = tick
+        self.levels = levels
+        self.clock = clock
+        self.started = clock()
+        self.current = 0
+        self.pending = 0
+        self.wheels = [[[] for _ in range(SLOTS)] for _ in range(levels)]
+        self.overflow = []
+
+    def __len__(self):
+        return self.pending
+
+    def _tick_at(self, when):
+        return int((when - self.started) / self.tick)
+
+    def _place(self, timer):
+        expires = timer.expires
+        differing = expires ^ self.current
+        for level in range(self.levels):
+            if differing >> (SLOT_BITS * (level + 1)) == 0:
+                index = (expires >> (SLOT_BITS * level)) & SLOT_MASK
+                self.wheels[level][index].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) after delay seconds; returns the Timer."""
+        # Round up, so a timer never fires early.
+        due = math.ceil((self.clock() + delay - self.started) / self.tick)
+        expires = max(self.current + 1, due)
+        timer = Timer(self, expires, callback, args)
+        self._place(timer)
+        self.pending += 1
+        return timer
+
+    def advance(self, now=None):
+        """Fire every timer due by now; returns how many fired."""
+        target = self._tick_at(now if now is not None else self.clock())
+        if not self.pending:
+            self.current = max(self.current, target)
+            return 0
+        fired = 0
+        while self.current < target and self.pending:
+            self.current += 1
+            fired += self._run_tick(self.current)
+        self.current = max(self.current, target)
+        return fired
+
+    def _run_tick(self, tick):
+        # Move the timers of every higher-level slot that comes due at this
+        # tick down towards level 0, highest level first.
+        if tick & SLOT_MASK == 0:
+            if tick & ((1 << (SLOT_BITS * self.levels)) - 1) == 0:
+                self._cascade(self.overflow)
+            for level in range(self.levels - 1, 0, -1):
+                if tick & ((1 << (SLOT_BITS * level)) - 1) == 0:
+                    index = (tick >> (SLOT_BITS * level)) & SLOT_MASK
+                    self._cascade(self.wheels[level], index)
+
+        slot = self.wheels[0][tick & SLOT_MASK]
+        if not slot:
+            return 0
+        self.wheels[0][tick & SLOT_MASK] = []
+        fired = 0
+        for timer in slot:
+            if timer.cancelled:
+                continue
+            timer.cancelled = True
+            self.pending -= 1
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
+
+    def _cascade(self, slots, index=None):
+        if index is None:
+            timers, slots[:] = list(slots), []
+        else:
+            timers, slots[index] = slots[index], []
+        for timer in timers:
+            if not timer.cancelled:
+                self._place(timer)
+
+    async def run_async(self):
+        """Advance the wheel every tick from an asyncio task."""
+        import asyncio
+
+        while True:
+            await asyncio.sleep(self.tick)
+            self.advance()
+
+
+_shared_wheel = None
+
+
+def shared_wheel():
+    """Return the process-wide TimerWheel used by timed games by default."""
+    global _shared_wheel
+    if _shared_wheel is None:
+        _shared_wheel = TimerWheel()
+    return _shared_wheel
+
+
+class GameTimer:
+    """The per-guess and per-game deadlines of one timed HangmanGame."""
+
+    __slots__ = (
+        "game",
+        "guess_time",
+        "game_time",
+        "wheel",
+        "turn_started",
+        "game_deadline",
+        "guess_deadline",
+        "expired",
+        "_guess_timer",
+        "_game_timer",
+    )
+
+    def __init__(self, game, guess_time=None, game_time=None, wheel=None):
+        self.game = game
+        self.guess_time = guess_time
+        self.game_time = game_time
+        self.wheel = wheel if wheel is not None else shared_wheel()
+        self.turn_started = None
+        self.game_deadline = None
+        self.guess_deadline = None
+        self.expired = None
+        self._guess_timer = None
+        self._game_timer = None
+
+    def start(self):
+        """Start the clocks for a new game."""
+        self.stop()
+        self.expired = None
+        now = self.wheel.clock()
+        self.turn_started = now
+        if self.game_time:
+            self.game_deadline = now + self.game_time
+            self._game_timer = self.wheel.schedule(self.game_time, self.expire, "game")
+        self._start_turn(now)
+
+    def _start_turn(self, now):
+        if self._guess_timer is not None:
+            self._guess_timer.cancel()
+            self._guess_timer = None
+        self.turn_started = now
+        if self.guess_time:
+            self.guess_deadline = now + self.guess_time
+            self._guess_timer = self.wheel.schedule(
+                self.guess_time, self.expire, "guess"
+            )
+
+    def stop(self):
+        """Cancel any pending deadlines."""
+        for timer in (self._guess_timer, self._game_timer):
+            if timer is not None:
+                timer.cancel()
+        self._guess_timer = self._game_timer = None
+        self.game_deadline = self.guess_deadline = None
+
+    def guess_made(self):
+        """Restart the guess clock and return the guess's response time."""
+        now = self.wheel.clock()
+        response_time = now - self.turn_started
+        if self.game.game_over:
+            self.stop()
+        else:
+            self._start_turn(now)
+        return response_time
+
+    def check(self):
+        """Expire the game now if a deadline has passed; True if it has."""
+        if self.expired is None:
+            now = self.wheel.clock()
+            if self.game_deadline is not None and now >= self.game_deadline:
+                self.expire("game")
+            elif self.guess_deadline is not None and now >= self.guess_deadline:
+                self.expire("guess")
+        return self.expired is not None
+
+    def expire(self, kind):
+        """End the game because the guess or game clock ran out."""
+        if self.expired is not None or self.game.game_over:
+            return
+        self.expired = kind
+        self.stop()
+        self.game.time_up(kind)
+
+    def remaining(self):
+        """Return (seconds left for this guess, for the game); None if untimed."""
+        now = self.wheel.clock()
+        guess = game = None
+        if self.guess_deadline is not None:
+            guess = max(0.0, self.guess_deadline - now)
+        if self.game_deadline is not None:
+            game = max(0.0, self.game_deadline - now)
+        return guess, game
@@ -0,0 +1,336 @@
+"""
+Hangman Game - Tournaments
+Runs multi-round leagues of real HangmanGame matches between strategies.
+
+Every entrant is a strategy, called like the simulation strategies as
+strategy(pattern, guessed) -> letter. In a match, both entrants play the same
+words with their own HangmanGame; the higher total score wins (fewer wrong
+guesses breaks ties) for 3 points, a draw gives 1 point each.
+
+Rounds use Swiss pairing: entrants are sorted by their points so far and
+paired with their neighbours, so strong players meet each other quickly and
+a league of n players needs only a handful of rounds instead of n - 1. The
+matches of a round are split into chunks and played on a process pool, and
+each chunk's results are folded into the standings as soon as it finishes.
+
+    tournament = Tournament({"alice": "solver", "bob": "frequency"}, rounds=3)
+    standings = tournament.run(on_result=print)
+    print(standings.top(10))
+"""
+
+import random
+from collections import namedtuple
+
+from alphabet import letter_key
+from hangman import HangmanGame, Player, Word, WordBank
+from leaderboard import Leaderboard
+
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+MatchResult = namedtuple(
+    "MatchResult", "round home away home_score away_score home_wrong away_wrong"
+)
+
+
+class HumanStrategy:
+    """Ask at the keyboard for each guess (single-process tournaments only)."""
+
+    def __init__(self, name="Human"):
+        self.name = name
+
+    def __call__(self, pattern, guessed):
+        print(
+            f"\n{self.name}: {' '.join(pattern)}  guessed: {''.join(sorted(guessed))}"
+        )
+        while True:
+            letter = letter_key(input("Your guess: ").strip())
+            if letter is not None and letter not in guessed:
+                return letter
+            print("Please enter a single new letter.")
+
+
+class MatchContext:
+    """What every match needs: the strategies, the words and the seed."""
+
+    def __init__(self, strategies, words, seed):
+        self.strategies = strategies
+        self.words = words
+        self.seed = seed
+        self._resolved = {}
+        self._built = {}
+
+    def strategy(self, name):
+        """
+        Return the callable strategy of an entrant. Strategies given by name
+        are built once per process, so each worker builds an expensive one
+        (like the solver) at most once.
+        """
+        resolved = self._resolved.get(name)
+        if resolved is None:
+            resolved = self._resolved[name] = resolve_strategy(
+                self.strategies[name], self.words, self._built
+            )
+        return resolved
+
+
+def resolve_strategy(strategy, words, built=None):
+    """
+    Return a callable for a strategy object or a STRATEGIES name, reusing
+    the ones already in built (a dict of name -> strategy).
+    """
+    if not isinstance(strategy, str):
+        return strategy
+    built = built if built is not None else {}
+    if strategy not in built:
+        if strategy == "solver":
+            from solver import Solver
+
+            built[strategy] = Solver(words)
+        else:
+            from simulation import STRATEGIES
+
+            built[strategy] = STRATEGIES[strategy]()
+    return built[strategy]
+
+
+def play_word(word, strategy, rng=None):
+    """Play one real HangmanGame of word; return (score, wrong guesses)."""
+    game = HangmanGame(Player())
+    game.word = Word(word)
+    reset = getattr(strategy, "reset", None)
+    if reset is not None and rng is not None:
+        reset(rng)
+    while not game.game_over:
+        pattern = game.word.get_pattern()
+        letter = strategy(pattern, game.word.guessed_letters)
+        if letter is None:
+            break
+        is_correct, _ = game.make_guess(letter)
+        if is_correct is None:
+            raise ValueError(f"strategy made an invalid guess {letter!r}")
+    return game.player.score, game.wrong_guesses
+
+
+def play_match(context, round_number, home, away, match_words):
+    """Play one match and return its MatchResult."""
+    rng = random.Random(f"{context.seed}-{round_number}-{home}-{away}")
+    home_strategy = context.strategy(home)
+    away_strategy = context.strategy(away)
+    home_score = away_score = home_wrong = away_wrong = 0
+    for word in match_words:
+        score, wrong = play_word(word, home_strategy, rng)
+        home_score += score
+        home_wrong += wrong
+        score, wrong = play_word(word, away_strategy, rng)
+        away_score += score
+        away_wrong += wrong
+    return MatchResult(
+        round_number, home, away, home_score, away_score, home_wrong, away_wrong
+    )
+
+
+def play_matches(context, matches):
+    """Play a chunk of (round, home, away, words) matches."""
+    return [play_match(context, *match) for match in matches]
+
+
+# The MatchContext of a worker process, sent once by its initializer rather
+# than with every chunk of matches.
+_worker_context = None
+
+
+def _init_worker(strategies, words, seed):
+    global _worker_context
+    _worker_context = MatchContext(strategies, words, seed)
+
+
+def _play_worker_matches(matches):
+    return play_matches(_worker_context, matches)
+
+
+class Tournament:
+    """A Swiss-system league of strategies playing real games."""
+
+    def __init__(
+        self,
+        entrants,
+        words=None,
+        rounds=3,
+        words_per_match=3,
+        workers=1,
+        seed=0,
+        chunk_size=256,
+    ):
+        """
+        entrants: {name: strategy}, where strategy is a callable or the name
+            of a strategy in simulation.STRATEGIES ("frequency", "random",
+            "solver"). With more than one worker, strategies must be
+            picklable; names are the cheapest to send.
+        words: the words to draw match words from; defaults to WORD_LIST.
+        """
+        if len(entrants) < 2:
+            raise ValueError("a tournament needs at least two entrants")
+        self.strategies = dict(entrants)
+        self.words = [word.upper() for word in (words or WordBank.WORD_LIST)]
+        self.rounds = rounds
+        self.words_per_match = words_per_match
+        self.workers = workers or 1
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        self.standings = Leaderboard()
+        self.players = {
+            name: Player(name, leaderboard=self.standings) for name in self.strategies
+        }
+        self.opponents = {name: set() for name in self.strategies}
+        self.round = 0
+        self.context = MatchContext(self.strategies, self.words, seed)
+
+    def pairings(self):
+        """
+        Pair entrants for the next round by current points, avoiding
+        rematches where a neighbour allows it. An odd one out gets a bye.
+        """
+        order = list(self.players)
+        self.rng.shuffle(order)
+        # Lowest points first, so the leaders are popped off the end.
+        order.sort(key=lambda name: self.players[name].score)
+        pairs = []
+        byes = []
+        while order:
+            home = order.pop()
+            if not order:
+                byes.append(home)
+                break
+            played = self.opponents[home]
+            index = -1
+            for candidate in range(-1, -min(8, len(order)) - 1, -1):
+                if order[candidate] not in played:
+                    index = candidate
+                    break
+            pairs.append((home, order.pop(index)))
+        return pairs, byes
+
+    def record(self, result):
+        """Fold one match result into the standings."""
+        home = self.players[result.home]
+        away = self.players[result.away]
+        self.opponents[result.home].add(result.away)
+        self.opponents[result.away].add(result.home)
+        home_key = (result.home_score, -result.home_wrong)
+        away_key = (result.away_score, -result.away_wrong)
+        if home_key == away_key:
+            for player in (home, away):
+                player.games_played += 1
+                player.add_score(DRAW_POINTS)
+        else:
+            winner, loser = (home, away) if home_key > away_key else (away, home)
+            winner.add_win()
+            winner.add_score(WIN_POINTS)
+            loser.add_loss()
+
+    def play_round(self, on_result=None, pool=None):
+        """Pair and play one round, streaming results into the standings."""
+        self.round += 1
+        pairs, byes = self.pairings()
+        for name in byes:
+            self.players[name].add_score(WIN_POINTS)
+
+        matches = [
+            (
+                self.round,
+                home,
+                away,
+                self.rng.sample(self.words, min(self.words_per_match, len(self.words))),
+            )
+            for home, away in pairs
+        ]
+        chunks = [
+            matches[start : start + self.chunk_size]
+            for start in range(0, len(matches), self.chunk_size)
+        ]
+
+        if pool is None:
+            finished = (play_matches(self.context, chunk) for chunk in chunks)
+        else:
+            from concurrent.futures import as_completed
+
+            futures = [pool.submit(_play_worker_matches, chunk) for chunk in chunks]
+            finished = (future.result() for future in as_completed(futures))
+
+        for results in finished:
+            for result in results:
+                self.record(result)
+                if on_result is not None:
+                    on_result(result)
+
+    def run(self, on_result=None):
+        """Play every round and return the standings Leaderboard."""
+        if self.workers == 1:
+            for _ in range(self.rounds):
+                self.play_round(on_result)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.strategies, self.words, self.seed),
+            ) as pool:
+                for _ in range(self.rounds):
+                    self.play_round(on_result, pool)
+        self.standings.refresh_snapshot()
+        return self.standings
+
+
+def main():
+    """Run a bot league from the command line."""
+    import argparse
+    import time
+
+    from simulation import STRATEGIES
+
+    parser = argparse.ArgumentParser(description="Hangman bot tournament")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--words-per-match", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    names = sorted(STRATEGIES)
+    entrants = {
+        f"{names[index % len(names)]}-{index}": names[index % len(names)]
+        for index in range(args.players)
+    }
+    tournament = Tournament(
+        entrants,
+        rounds=args.rounds,
+        words_per_match=args.words_per_match,
+        workers=args.workers,
+        seed=args.seed,
+    )
+
+    started = time.perf_counter()
+    matches = [0]
+
+    def progress(result):
+        matches[0] += 1
+        if matches[0] % 10000 == 0:
+            print(f"Round {result.round}: {matches[0]} matches played")
+
+    standings = tournament.run(on_result=progress)
+    elapsed = time.perf_counter() - started
+    print(f"{matches[0]} matches in {elapsed:.1f}s")
+    print(f"{'Rank':<6}{'Player':<20}{'Points':<8}{'Wins'}")
+    for entry in standings.top(args.top):
+        print(
+            f"{entry['rank']:<6}{entry['name']:<20}{entry['score']:<8}"
+            f"{entry['games_won']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Hangman Game - Word Queries
+Answers attribute queries over a dictionary with compressed bitsets.
+
+A WordIndex keeps one Bitset of word ids per attribute value: per category,
+word length, letter and difficulty tier. A combined query such as
+
+    index.random_word(category="animals", min_length=7, max_length=9,
+                      excludes="Z", tier="medium")
+
+is a few bitwise ANDs plus one random pick from the result, with no pass
+over the word list, so it stays in the microseconds on dictionaries of
+millions of words.
+
+Bitsets are split into chunks of 65536 ids. Each non-empty chunk is one
+Python int and empty chunks are not stored at all. The index numbers its
+words by category and then by length, so those sets cover only a few chunks
+each, and an AND with them only visits the chunks they cover. Small chunks
+also keep every intermediate result small: one AND of two
+multi-million-bit integers would allocate (and page in) a result of
+hundreds of kilobytes.
+
+Letters are matched by their key (see alphabet.py), so contains="E" also
+finds words with É.
+"""
+
+import random
+from array import array
+
+from alphabet import LETTER_KEYS, letter_key
+from batch import iter_bits, popcount
+from hangman import WordBank
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+_OFFSET_MASK = CHUNK_SIZE - 1
+
+
+def _select(bits, n):
+    """Return the position of the n-th (0-based) set bit of bits."""
+    position = 0
+    width = bits.bit_length()
+    # Keep the half that holds the bit, so each step works on half as much.
+    while width > 64:
+        half = width >> 1
+        low = bits & ((1 << half) - 1)
+        count = popcount(low)
+        if n < count:
+            bits, width = low, half
+        else:
+            n -= count
+            bits >>= half
+            position += half
+            width -= half
+    for _ in range(n):
+        bits &= bits - 1
+    return position + (bits & -bits).bit_length() - 1
+
+
+class Bitset:
+    """A set of word ids stored as 65536-bit chunks; empty chunks omitted."""
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks=None):
+        # chunk number -> int whose bit i is id chunk * CHUNK_SIZE + i
+        self.chunks = chunks if chunks is not None else {}
+
+    @classmethod
+    def from_ids(cls, ids):
+        """Return the Bitset of an iterable of ids."""
+        planes = {}
+        for word_id in ids:
+            plane = planes.get(word_id >> CHUNK_BITS)
+            if plane is None:
+                plane = planes[word_id >> CHUNK_BITS] = bytearray(CHUNK_SIZE >> 3)
+            offset = word_id & _OFFSET_MASK
+            plane[offset >> 3] |= 1 << (offset & 7)
+        return cls(
+            {key: int.from_bytes(plane, "little") for key, plane in planes.items()}
+        )
+
+    @classmethod
+    def from_range(cls, start, stop):
+        """Return the Bitset of ids start <= id < stop."""
+        chunks = {}
+        while start < stop:
+            key = start >> CHUNK_BITS
+            end = min(stop, (key + 1) << CHUNK_BITS)
+            chunks[key] = ((1 << (end - start)) - 1) << (start & _OFFSET_MASK)
+            start = end
+        return cls(chunks)
+
+    def __len__(self):
+        return sum(map(popcount, self.chunks.values()))
+
+    def __bool__(self):
+        return bool(self.chunks)
+
+    def __contains__(self, word_id):
+        chunk = self.chunks.get(word_id >> CHUNK_BITS)
+        return chunk is not None and bool(chunk >> (word_id & _OFFSET_MASK) & 1)
+
+    def __iter__(self):
+        for key in sorted(self.chunks):
+            base = key << CHUNK_BITS
+            for offset in iter_bits(self.chunks[key]):
+                yield base + offset
+
+    def __and__(self, other):
+        small, large = self.chunks, other.chunks
+        if len(small) > len(large):
+            small, large = large, small
+        chunks = {}
+        for key, chunk in small.items():
+            both = large.get(key, 0) & chunk
+            if both:
+                chunks[key] = both
+        return Bitset(chunks)
+
+    def __or__(self, other):
+        chunks = dict(self.chunks)
+        for key, chunk in other.chunks.items():
+            chunks[key] = chunks.get(key, 0) | chunk
+        return Bitset(chunks)
+
+    def __sub__(self, other):
+        chunks = {}
+        for key, chunk in self.chunks.items():
+            # chunk & ~other, without building a negative integer.
+            chunk ^= chunk & other.chunks.get(key, 0)
+            if chunk:
+                chunks[key] = chunk
+        return Bitset(chunks)
+
+    def nth(self, n):
+        """Return the n-th smallest id (0-based)."""
+        for key in sorted(self.chunks):
+            chunk = self.chunks[key]
+            count = popcount(chunk)
+            if n < count:
+                return (key << CHUNK_BITS) + _select(chunk, n)
+            n -= count
+        raise IndexError("Bitset index out of range")
+
+    def random_id(self, rng=random):
+        """Return a random id from the set, or None if it is empty."""
+        # Count each chunk once, then select within the chunk picked.
+        keys = sorted(self.chunks)
+        counts = [popcount(self.chunks[key]) for key in keys]
+        total = sum(counts)
+        if not total:
+            return None
+        n = rng.randrange(total)
+        for key, count in zip(keys, counts):
+            if n < count:
+                return (key << CHUNK_BITS) + _select(self.chunks[key], n)
+            n -= count
+
+    def nbytes(self):
+        """Return roughly how many bytes the chunks take up."""
+        return sum((chunk.bit_length() + 7) // 8 for chunk in self.chunks.values())
+
+
+EMPTY = Bitset()
+
+
+def _source_lengths(source):
+    """Return an array of the length of every word in source, by word id."""
+    if not hasattr(source, "length_range"):
+        return array("H", map(len, source))
+    # An MmapWordBank already groups its ids by length.
+    lengths = array("H", [0]) * len(source)
+    for length in range(source.max_length + 1):
+        start, count = source.length_range(length)
+        for position in range(start, start + count):
+            lengths[source.length_bucket_id(position)] = length
+    return lengths
+
+
+class WordIndex:
+    """Bitset indexes over a dictionary for combined attribute queries."""
+
+    def __init__(self, words=None, categories=None, difficulty=None):
+        """
+        words: a word list or MmapWordBank; defaults to WordBank.WORD_LIST.
+            A bank's words are read by id when needed, never copied out.
+        categories: {name: words in the category}; defaults to the
+            categories stored in an MmapWordBank.
+        difficulty: a difficulty.DifficultyIndex over the same word list.
+        """
+        source = words if words is not None else WordBank.WORD_LIST
+        self.source = source if hasattr(source, "get_word") else list(source)
+        self._get = getattr(self.source, "get_word", None) or self.source.__getitem__
+        count = len(self.source)
+        lengths = _source_lengths(self.source)
+
+        # Source word ids of each category, in category order.
+        category_ids = {}
+        if categories is not None:
+            # One pass over the dictionary, looking each word up in the
+            # (much smaller) category lists.
+            member_of = {}
+            for position, members in enumerate(categories.values()):
+                for word in members:
+                    member_of.setdefault(word.upper(), []).append(position)
+            found = [[] for _ in categories]
+            for word_id in range(count):
+                for position in member_of.get(self._get(word_id).upper(), ()):
+                    found[position].append(word_id)
+            category_ids = dict(zip(categories, found))
+        elif hasattr(self.source, "category_ids"):
+            for name in self.source.categories:
+                category_ids[name] = self.source.category_ids(name)
+
+        # Number the words by (first category, length) so that category and
+        # length sets are runs of neighbouring ids. Only the id arrays are
+        # kept; words are read from the source through word().
+        rank = array("L", [len(category_ids)]) * count
+        for position, ids in reversed(list(enumerate(category_ids.values()))):
+            for word_id in ids:
+                rank[word_id] = position
+        self.source_ids = array(
+            "L",
+            sorted(
+                range(count),
+                key=lambda word_id: (rank[word_id] << 16) | lengths[word_id],
+            ),
+        )
+        del rank
+        internal = array("L", [0]) * count
+        for word_id, source_id in enumerate(self.source_ids):
+            internal[source_id] = word_id
+
+        self.all = Bitset.from_range(0, count)
+        self.categories = {
+            name: Bitset.from_ids(internal[word_id] for word_id in ids)
+            for name, ids in category_ids.items()
+        }
+        self.tiers = {}
+        if difficulty is not None:
+            for tier in difficulty.tiers:
+                self.tiers[tier] = Bitset.from_ids(
+                    internal[word_id] for word_id in difficulty.tier_ids(tier)
+                )
+        self.lengths = self._length_sets(lengths)
+        self.letters = self._letter_sets()
+
+    def word(self, word_id):
+        """Return the word with (internal) id word_id, uppercased."""
+        return self._get(self.source_ids[word_id]).upper()
+
+    def _length_sets(self, lengths):
+        # Words are sorted by length within each category: one run per pair.
+        result = {}
+        start = 0
+        source_ids = self.source_ids
+        total = len(source_ids)
+        for word_id in range(1, total + 1):
+            length = lengths[source_ids[start]]
+            if word_id == total or lengths[source_ids[word_id]] != length:
+                run = Bitset.from_range(start, word_id)
+                result[length] = result[length] | run if length in result else run
+                start = word_id
+        return result
+
+    def _letter_sets(self):
+        # Build each chunk's per-character planes in one pass over its words,
+        # then fold characters onto their letter keys.
+        letters = {}
+        get, source_ids = self._get, self.source_ids
+        for key in range((len(source_ids) + CHUNK_SIZE - 1) >> CHUNK_BITS):
+            base = key << CHUNK_BITS
+            planes = {}
+            for offset, source_id in enumerate(source_ids[base : base + CHUNK_SIZE]):
+                byte, bit = offset >> 3, 1 << (offset & 7)
+                for char in set(get(source_id)):
+                    plane = planes.get(char)
+                    if plane is None:
+                        plane = planes[char] = bytearray(CHUNK_SIZE >> 3)
+                    plane[byte] |= bit
+            for char, plane in planes.items():
+                letter = LETTER_KEYS.get(char) or letter_key(char)
+                if letter is None:
+                    continue
+                chunks = letters.setdefault(letter, Bitset()).chunks
+                chunks[key] = chunks.get(key, 0) | int.from_bytes(plane, "little")
+        return letters
+
+    def __len__(self):
+        return len(self.source_ids)
+
+    def _named(self, sets, names, kind):
+        if isinstance(names, str):
+            names = (names,)
+        result = EMPTY
+        for name in names:
+            if name not in sets:
+                raise ValueError(f"unknown {kind} '{name}', use one of {tuple(sets)}")
+            result = result | sets[name]
+        return result
+
+    def length_set(self, min_length=None, max_length=None):
+        """Return the Bitset of words with min_length <= length <= max_length."""
+        result = EMPTY
+        for length, words in self.lengths.items():
+            if (min_length is None or length >= min_length) and (
+                max_length is None or length <= max_length
+            ):
+                result = result | words
+        return result
+
+    def letter_set(self, letter):
+        """Return the Bitset of words containing letter (accents ignored)."""
+        key = LETTER_KEYS.get(letter) or letter_key(letter)
+        if key is None:
+            raise ValueError(f"'{letter}' is not a letter")
+        return self.letters.get(key, EMPTY)
+
+    def query(
+        self,
+        category=None,
+        length=None,
+        min_length=None,
+        max_length=None,
+        contains="",
+        excludes="",
+        tier=None,
+    ):
+        """
+        Return the Bitset of word ids matching every criterion given.
+        category and tier take a name or a list of names (any of them).
+        """
+        terms = []
+        if category is not None:
+            terms.append(self._named(self.categories, category, "category"))
+        if tier is not None:
+            terms.append(self._named(self.tiers, tier, "difficulty"))
+        if length is not None:
+            min_length = max_length = length
+        if min_length is not None or max_length is not None:
+            terms.append(self.length_set(min_length, max_length))
+        for letter in contains:
+            terms.append(self.letter_set(letter))
+
+        # Start from the set spread over the fewest chunks.
+        terms.sort(key=lambda term: len(term.chunks))
+        result = terms[0] if terms else self.all
+        for term in terms[1:]:
+            if not result:
+                break
+            result = result & term
+        for letter in excludes:
+            if not result:
+                break
+            result = result - self.letter_set(letter)
+        return result
+
+    def count(self, **criteria):
+        """Return how many words match the criteria of query()."""
+        return len(self.query(**criteria))
+
+    def matching_words(self, **criteria):
+        """Return every word matching the criteria of query()."""
+        return [self.word(word_id) for word_id in self.query(**criteria)]
+
+    def random_word(self, rng=random, **criteria):
+        """Return a random word matching the criteria, or None if none do."""
+        word_id = self.query(**criteria).random_id(rng)
+        return None if word_id is None else self.word(word_id)
+
+    def selector(self, seed=None, no_repeat=True, **criteria):
+        """Return a WordSelector that only draws words matching the criteria."""
+        from selection import WordSelector
+
+        source_ids = self.source_ids
+        ids = array("L", (source_ids[word_id] for word_id in self.query(**criteria)))
+        return WordSelector(seed=seed, no_repeat=no_repeat, words=self.source, ids=ids)
@@ -0,0 +1,260 @@
+"""
+Hangman Game - On-Disk Word Store
+A memory-mapped, indexed binary dictionary format for very large word lists.
+
+File layout (all integers little-endian):
+
+    header      magic, version, max length, word count, category count,
+                and the byte offsets of every section below
+    words       uppercase UTF-8 words, concatenated with no separators
+    offsets     (word count + 1) uint32 offsets into the words section
+    lengths     (max length + 2) uint32 starts into the length bucket ids;
+                lengths count characters, not bytes
+    length ids  uint32 word ids grouped by word length
+    categories  per category: uint16 name size, name, uint32 start, count
+    category ids  uint32 word ids grouped by category
+"""
+
+import mmap
+import random
+import struct
+from array import array
+
+from alphabet import upper
+
+MAGIC = b"HMWB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII6I")
+_U32 = struct.Struct("<I")
+_RANGE = struct.Struct("<II")
+_NAME_SIZE = struct.Struct("<H")
+
+
+def _normalize(word):
+    """Return the stored form of a word or phrase, or None if it is blank."""
+    word = " ".join(upper(word).split())
+    return word or None
+
+
+def build_word_file(path, words, categories=None):
+    """
+    Write a binary word file that MmapWordBank can open.
+
+    words is any iterable of strings. categories is an optional mapping of
+    category name to an iterable of words; those words are added to the
+    dictionary too. Words are stored like Word shows them: uppercase, with
+    runs of whitespace as one space. Blank and duplicate words are skipped.
+    Returns the number of words written.
+    """
+    ids = {}
+    stored = []
+
+    def add(word):
+        word = _normalize(word)
+        if word is None:
+            return None
+        if word not in ids:
+            ids[word] = len(stored)
+            stored.append(word)
+        return ids[word]
+
+    for word in words:
+        add(word)
+
+    category_ids = []
+    for name, members in (categories or {}).items():
+        member_ids = sorted(
+            {word_id for word_id in map(add, members) if word_id is not None}
+        )
+        category_ids.append((name.encode("utf-8"), member_ids))
+
+    encoded = [word.encode("utf-8") for word in stored]
+    max_length = max(map(len, stored), default=0)
+
+    words_blob = b"".join(encoded)
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    by_length = [[] for _ in range(max_length + 1)]
+    for word_id, word in enumerate(stored):
+        by_length[len(word)].append(word_id)
+    length_starts = [0]
+    for bucket in by_length:
+        length_starts.append(length_starts[-1] + len(bucket))
+    length_ids = [word_id for bucket in by_length for word_id in bucket]
+
+    category_table = bytearray()
+    category_members = []
+    for name, member_ids in category_ids:
+        category_table += _NAME_SIZE.pack(len(name)) + name
+        category_table += _RANGE.pack(len(category_members), len(member_ids))
+        category_members.extend(member_ids)
+
+    sections = [
+        words_blob,
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        struct.pack(f"<{len(length_starts)}I", *length_starts),
+        struct.pack(f"<{len(length_ids)}I", *length_ids),
+        bytes(category_table),
+        struct.pack(f"<{len(category_members)}I", *category_members),
+    ]
+
+    position = _HEADER.size
+    section_offsets = []
+    for section in sections:
+        section_offsets.append(position)
+        position += len(section)
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        max_length,
+        len(encoded),
+        len(category_ids),
+        *section_offsets,
+    )
+
+    with open(path, "wb") as handle:
+        handle.write(header)
+        for section in sections:
+            handle.write(section)
+
+    return len(encoded)
+
+
+class MmapWordBank:
+    """Read-only word bank backed by a memory-mapped binary word file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            self.max_length,
+            self.word_count,
+            category_count,
+            self._words_at,
+            self._offsets_at,
+            self._length_starts_at,
+            self._length_ids_at,
+            category_table_at,
+            self._category_ids_at,
+        ) = _HEADER.unpack_from(self._map, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} word file")
+
+        # Only the small category table is decoded up front; words and
+        # buckets are read straight from the mapping on demand.
+        self.categories = {}
+        position = category_table_at
+        for _ in range(category_count):
+            (size,) = _NAME_SIZE.unpack_from(self._map, position)
+            position += _NAME_SIZE.size
+            name = self._map[position : position + size].decode("utf-8")
+            position += size
+            self.categories[name] = _RANGE.unpack_from(self._map, position)
+            position += _RANGE.size
+        # (length, category) -> array of matching ids, built on first use.
+        self._filtered = {}
+
+    def __len__(self):
+        return self.word_count
+
+    def close(self):
+        """Release the memory mapping."""
+        self._map.close()
+
+    def _u32(self, section_at, index):
+        return _U32.unpack_from(self._map, section_at + 4 * index)[0]
+
+    def get_word(self, word_id):
+        """Return the word stored under word_id."""
+        start, end = struct.unpack_from(
+            "<II", self._map, self._offsets_at + 4 * word_id
+        )
+        return self._map[self._words_at + start : self._words_at + end].decode("utf-8")
+
+    def length_range(self, length):
+        """Return (start, count) of the length bucket for words of length."""
+        if length < 0 or length > self.max_length:
+            return 0, 0
+        start, end = struct.unpack_from(
+            "<II", self._map, self._length_starts_at + 4 * length
+        )
+        return start, end - start
+
+    def length_bucket_id(self, position):
+        """Return the word id at position in the length-grouped id list."""
+        return self._u32(self._length_ids_at, position)
+
+    def category_ids(self, category):
+        """Return the word ids in a category."""
+        start, count = self.categories.get(category, (0, 0))
+        return [
+            self._u32(self._category_ids_at, start + index) for index in range(count)
+        ]
+
+    def word_length(self, word_id):
+        """Return the length of the word stored under word_id, in characters."""
+        start, end = _RANGE.unpack_from(self._map, self._offsets_at + 4 * word_id)
+        data = self._map[self._words_at + start : self._words_at + end]
+        return len(data) if data.isascii() else len(data.decode("utf-8"))
+
+    def filtered_ids(self, length, category):
+        """Return the ids of the category's words of one length, as an array."""
+        key = (length, category)
+        ids = self._filtered.get(key)
+        if ids is None:
+            start, count = self.categories.get(category, (0, 0))
+            ids = self._filtered[key] = array("L")
+            for index in range(start, start + count):
+                word_id = self._u32(self._category_ids_at, index)
+                if self.word_length(word_id) == length:
+                    ids.append(word_id)
+        return ids
+
+    def count(self, length=None, category=None):
+        """Return how many words match the given length and/or category."""
+        if category is not None and length is not None:
+            return len(self.filtered_ids(length, category))
+        if category is not None:
+            return self.categories.get(category, (0, 0))[1]
+        if length is not None:
+            return self.length_range(length)[1]
+        return self.word_count
+
+    def random_id(self, length=None, category=None, rng=random):
+        """
+        Return a random word id, optionally restricted to one word length,
+        one category or both. Returns None when nothing matches.
+        """
+        if category is not None and length is not None:
+            # Scanned once per pair (only the category's ids), then O(1).
+            ids = self.filtered_ids(length, category)
+            return ids[rng.randrange(len(ids))] if ids else None
+        if category is not None:
+            start, count = self.categories.get(category, (0, 0))
+            section_at = self._category_ids_at
+        elif length is not None:
+            start, count = self.length_range(length)
+            section_at = self._length_ids_at
+        else:
+            if not self.word_count:
+                return None
+            return rng.randrange(self.word_count)
+
+        if not count:
+            return None
+        return self._u32(section_at, start + rng.randrange(count))
+
+    def get_random_word(self, length=None, category=None, rng=random):
+        """Return a random word in O(1), or None when nothing matches."""
+        word_id = self.random_id(length, category, rng)
+        return None if word_id is None else self.get_word(word_id)